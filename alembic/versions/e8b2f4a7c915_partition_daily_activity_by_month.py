@@ -0,0 +1,86 @@
+"""Partition daily activity by month
+
+Revision ID: e8b2f4a7c915
+Revises: d3a9c6f1e842
+Create Date: 2025-07-29 20:06:51.730118
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b2f4a7c915'
+down_revision: Union[str, Sequence[str], None] = 'd3a9c6f1e842'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_daily_activity(**kwargs) -> None:
+    op.create_table('daily_activity',
+    sa.Column('guild_id', sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.BigInteger(), autoincrement=False, nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('message_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['guild_id'], ['guild_configs.guild_id'], ),
+    sa.PrimaryKeyConstraint('guild_id', 'user_id', 'day'),
+    **kwargs
+    )
+    op.create_index('ix_daily_activity_guild_id_day', 'daily_activity', ['guild_id', 'day'], unique=False)
+
+
+def _rename_daily_activity(new_name: str) -> None:
+    op.rename_table('daily_activity', new_name)
+    op.execute(f'ALTER INDEX daily_activity_pkey RENAME TO {new_name}_pkey')
+    op.execute(f'ALTER INDEX ix_daily_activity_guild_id_day RENAME TO ix_{new_name}_guild_id_day')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_daily_activity('daily_activity_unpartitioned')
+    _create_daily_activity(postgresql_partition_by='RANGE (day)')
+
+    # One partition per month from the oldest row to a few months ahead, the
+    # create_activity_partitions job keeps adding them from then on.
+    first_day = op.get_bind().execute(
+        sa.text('SELECT min(day) FROM daily_activity_unpartitioned')
+    ).scalar()
+    current = date.today().replace(day=1)
+    month = min(first_day.replace(day=1), current) if first_day else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        next_month = _add_months(month, 1)
+        op.execute(
+            f'CREATE TABLE daily_activity_y{month.year:04d}m{month.month:02d}'
+            f" PARTITION OF daily_activity FOR VALUES FROM ('{month.isoformat()}')"
+            f" TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+
+    op.execute(
+        'INSERT INTO daily_activity (guild_id, user_id, day, message_count)'
+        ' SELECT guild_id, user_id, day, message_count FROM daily_activity_unpartitioned'
+    )
+    op.drop_table('daily_activity_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_daily_activity('daily_activity_partitioned')
+    _create_daily_activity()
+    op.execute(
+        'INSERT INTO daily_activity (guild_id, user_id, day, message_count)'
+        ' SELECT guild_id, user_id, day, message_count FROM daily_activity_partitioned'
+    )
+    # Dropping the partitioned table drops all of its partitions.
+    op.drop_table('daily_activity_partitioned')
@@ -0,0 +1,36 @@
+"""Add default daily activity partition
+
+Revision ID: f4d1b8c62e39
+Revises: a7c3e91f5d28
+Create Date: 2025-07-31 10:22:57.184406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4d1b8c62e39'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e91f5d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Catches rows outside every monthly partition instead of failing inserts.
+    op.execute('CREATE TABLE daily_activity_default PARTITION OF daily_activity DEFAULT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Rows in it would be lost, so they need a monthly partition to move into.
+    op.execute(
+        'DO $$ BEGIN IF EXISTS (SELECT 1 FROM daily_activity_default) THEN'
+        " RAISE EXCEPTION 'daily_activity_default is not empty';"
+        ' END IF; END $$'
+    )
+    op.drop_table('daily_activity_default')
@@ -0,0 +1,64 @@
+"""Encode time versus upload size for every ImageFormat.
+
+Run from the repository root:
+
+    poetry run python -m benchmarks.bench_encoding
+"""
+
+from __future__ import annotations
+
+import io
+import time
+
+from PIL import Image
+
+from progandbot.cogs.member_join import WELCOME_TEMPLATE
+from progandbot.cogs.rank import RANK_TEMPLATE
+from progandbot.core.enums import ImageFormat
+from progandbot.core.logging_config import setup_logging
+from progandbot.core.rendering import CardData
+from progandbot.core.rendering import encode_image
+
+
+ROUNDS = 20
+UPLOAD_MBPS = (10, 50)
+
+
+def _avatar_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.effect_mandelbrot((256, 256), (-2, -1.5, 1, 1.5), 100).save(
+        buffer, format="PNG"
+    )
+    return buffer.getvalue()
+
+
+def main() -> None:
+    setup_logging("WARNING")
+    data: CardData = {
+        "avatar": _avatar_bytes(),
+        "name": "ProgAndBot",
+        "level": 12,
+        "percent": 42,
+        "progress": 0.42,
+    }
+
+    header = "  ".join(f"e2e@{mbps}Mbps" for mbps in UPLOAD_MBPS)
+    print(f"{'card':<8} {'format':<14} {'encode ms':>10} {'size KiB':>9}  {header}")
+    for template in (WELCOME_TEMPLATE, RANK_TEMPLATE):
+        image = template.compose(data)
+        for image_format in ImageFormat:
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                encoded = encode_image(image, image_format)
+            encode_ms = (time.perf_counter() - start) / ROUNDS * 1000
+
+            upload_ms = [len(encoded) * 8 / (mbps * 1000) for mbps in UPLOAD_MBPS]
+            e2e = "  ".join(f"{encode_ms + ms:>9.1f}ms" for ms in upload_ms)
+            print(
+                f"{template.name:<8} {image_format.value:<14}"
+                f" {encode_ms:>10.1f} {len(encoded) / 1024:>9.1f}  {e2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Card rendering throughput.
+
+Run from the repository root:
+
+    poetry run python -m benchmarks.bench_rendering
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+
+from PIL import Image
+
+from progandbot.cogs.member_join import WELCOME_TEMPLATE
+from progandbot.cogs.rank import RANK_TEMPLATE
+from progandbot.core.logging_config import setup_logging
+from progandbot.core.rendering import CardData
+from progandbot.core.rendering import CardRenderer
+from progandbot.core.rendering import CardTemplate
+
+
+CARDS = 200
+
+
+def _avatar_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGBA", (256, 256), "#f47fff").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def _bench(
+    renderer: CardRenderer, template: CardTemplate, data: CardData, unique: bool
+) -> float:
+    async def load_data() -> CardData:
+        return data
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            renderer.render(template, i if unique else 0, load_data)
+            for i in range(CARDS)
+        )
+    )
+    return CARDS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    setup_logging("WARNING")
+    data: CardData = {
+        "avatar": _avatar_bytes(),
+        "name": "ProgAndBot",
+        "level": 12,
+        "percent": 42,
+        "progress": 0.42,
+    }
+    for template in (WELCOME_TEMPLATE, RANK_TEMPLATE):
+        for workers in (1, 2, 4):
+            renderer = CardRenderer(max_workers=workers, cache_size=CARDS)
+            uncached = await _bench(renderer, template, data, unique=True)
+            cached = await _bench(renderer, template, data, unique=False)
+            renderer.close()
+            print(
+                f"{template.name:<8} workers={workers}"
+                f"  uncached={uncached:8.1f} cards/s  cached={cached:10.1f} cards/s"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
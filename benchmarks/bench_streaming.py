@@ -0,0 +1,123 @@
+"""Peak memory of loading versus streaming a large ``user_profiles`` table.
+
+Run from the repository root, against a temporary SQLite file by default or
+against any database given with ``--url``:
+
+    poetry run python -m benchmarks.bench_streaming --rows 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel import select
+
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.streaming import stream_partitions
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+GUILD_ID = 1
+INSERT_BATCH_SIZE = 50_000
+BATCH_SIZE = 1000
+
+
+async def _populate(engine: AsyncEngine, rows: int) -> None:
+    tables = [
+        SQLModel.metadata.tables[name] for name in ("guild_configs", "user_profiles")
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all, tables=tables)
+
+    async with AsyncSession(engine) as session:
+        existing = await session.scalar(select(func.count()).select_from(UserProfile))
+        if existing == rows:
+            return
+        if existing:
+            raise SystemExit(f"user_profiles already holds {existing} rows")
+
+        session.add(GuildConfig(guild_id=GUILD_ID))
+        await session.flush()
+        for start in range(0, rows, INSERT_BATCH_SIZE):
+            await session.execute(
+                insert(UserProfile),
+                [
+                    {"guild_id": GUILD_ID, "user_id": user_id, "xp": user_id % 5000}
+                    for user_id in range(start, min(start + INSERT_BATCH_SIZE, rows))
+                ],
+            )
+        await session.commit()
+
+
+async def _load_all(session: AsyncSession, limit: int) -> int:
+    statement = select(UserProfile.user_id, UserProfile.xp).limit(limit)
+    return sum(xp for _, xp in (await session.execute(statement)).all())
+
+
+async def _stream(session: AsyncSession, limit: int) -> int:
+    statement = select(UserProfile.user_id, UserProfile.xp).limit(limit)
+    total = 0
+    async for partition in stream_partitions(session, statement, batch_size=BATCH_SIZE):
+        total += sum(xp for _, xp in partition)
+    return total
+
+
+async def _measure(
+    engine: AsyncEngine,
+    func: Callable[[AsyncSession, int], Awaitable[int]],
+    limit: int,
+) -> tuple[float, float]:
+    async with AsyncSession(engine) as session:
+        tracemalloc.start()
+        start = time.perf_counter()
+        await func(session, limit)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+async def main(rows: int, url: str | None) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(
+            url or f"sqlite+aiosqlite:///{Path(tmp_dir) / 'bench.db'}"
+        )
+        start = time.perf_counter()
+        await _populate(engine, rows)
+        print(f"populated {rows} rows in {time.perf_counter() - start:.1f}s")
+
+        print(f"{'rows':>10} {'mode':<8} {'seconds':>8} {'peak MiB':>9}")
+        for limit in (rows // 4, rows // 2, rows):
+            for mode, func in (("load", _load_all), ("stream", _stream)):
+                elapsed, peak = await _measure(engine, func, limit)
+                print(f"{limit:>10} {mode:<8} {elapsed:>8.2f} {peak:>9.1f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument(
+        "--url", help="Database URL, a temporary SQLite file by default."
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.url))
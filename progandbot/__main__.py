@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
+
+from pathlib import Path
+
 import structlog
 
 from progandbot.core.bot import ProgAndBot
 from progandbot.core.config import settings
+from progandbot.core.enums import ExportFormat
 from progandbot.core.logging_config import setup_logging
+from progandbot.db.session import get_session
+from progandbot.db.transfer import export_guild
+from progandbot.db.transfer import import_guilds
 
 
 setup_logging(settings.LOG_LEVEL)
 logger = structlog.get_logger(__name__)
 
 
-def main() -> None:
+def run_bot() -> None:
     token = settings.DISCORD_BOT_TOKEN
     bot = ProgAndBot()
 
@@ -21,5 +30,48 @@ def main() -> None:
         logger.info("Bot stopped.")
 
 
+async def run_export(guild_id: int, output: Path, export_format: ExportFormat) -> None:
+    async with get_session(read_only=True) as session:
+        await export_guild(session, guild_id, output, export_format)
+
+
+async def run_import(input_dir: Path) -> None:
+    async with get_session() as session:
+        await import_guilds(session, input_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="progandbot")
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export the data of a guild, one file per table."
+    )
+    export_parser.add_argument("guild_id", type=int)
+    export_parser.add_argument("output", type=Path)
+    export_parser.add_argument(
+        "--format",
+        choices=[export_format.value for export_format in ExportFormat],
+        default=ExportFormat.PARQUET.value,
+        help="Falls back to csv when pyarrow is not installed.",
+    )
+
+    import_parser = subparsers.add_parser(
+        "import", help="Replace the data of the guilds in an export."
+    )
+    import_parser.add_argument("input", type=Path)
+
+    args = parser.parse_args()
+    match args.command:
+        case "export":
+            asyncio.run(
+                run_export(args.guild_id, args.output, ExportFormat(args.format))
+            )
+        case "import":
+            asyncio.run(run_import(args.input))
+        case _:
+            run_bot()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import time
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from discord.ext import commands
+
+from progandbot.core.rate_limit import BoundedStateMap
+from progandbot.core.rate_limit import TokenBucket
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+from progandbot.db.upsert import upsert_increment
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+
+
+logger = structlog.get_logger(__name__)
+
+MAX_TRACKED_USERS = 50000
+
+FLOOD_BURST = 6
+FLOOD_RATE = 1.0
+MENTION_BURST = 8
+MENTION_RATE = 0.2
+DUPLICATE_WINDOW = 5
+DUPLICATE_THRESHOLD = 3
+WARNING_COOLDOWN = 30.0
+
+
+class _UserSpamState:
+    __slots__ = ("flood", "last_warned_at", "mentions", "recent_hashes")
+
+    def __init__(self) -> None:
+        self.flood = TokenBucket(FLOOD_BURST, FLOOD_RATE)
+        self.mentions = TokenBucket(MENTION_BURST, MENTION_RATE)
+        self.recent_hashes: deque[int] = deque(maxlen=DUPLICATE_WINDOW)
+        self.last_warned_at = 0.0
+
+
+class AutoModeration(commands.Cog):
+    def __init__(self, bot: ProgAndBot) -> None:
+        self.bot = bot
+        self.logger = logger.bind(cog_name=self.__class__.__name__)
+
+        self.user_states: BoundedStateMap[tuple[int, int], _UserSpamState] = (
+            BoundedStateMap(MAX_TRACKED_USERS, _UserSpamState)
+        )
+
+        self.logger.info(f"Initialized {self.__class__.__name__} cog")
+
+    def _detect_violation(self, message: discord.Message, now: float) -> str | None:
+        assert message.guild is not None
+        state = self.user_states.get((message.guild.id, message.author.id))
+
+        violation: str | None = None
+        if not state.flood.consume(now=now):
+            violation = "message flood"
+
+        mention_count = len(message.raw_mentions) + len(message.raw_role_mentions)
+        if mention_count and not state.mentions.consume(mention_count, now=now):
+            violation = "mention spam"
+
+        content = message.content.strip().lower()
+        if content:
+            content_hash = hash(content)
+            if state.recent_hashes.count(content_hash) + 1 >= DUPLICATE_THRESHOLD:
+                violation = "duplicate messages"
+            state.recent_hashes.append(content_hash)
+
+        return violation
+
+    def _should_warn(self, message: discord.Message, now: float) -> bool:
+        """Allow one warning per user every ``WARNING_COOLDOWN`` seconds."""
+        assert message.guild is not None
+        state = self.user_states.get((message.guild.id, message.author.id))
+        if now - state.last_warned_at < WARNING_COOLDOWN:
+            return False
+        state.last_warned_at = now
+        return True
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        if message.author.bot or not message.guild:
+            return
+
+        guild_id = message.guild.id
+        user_id = message.author.id
+
+        filtered_term = await self.bot.word_filter.find_match(guild_id, message.content)
+        if filtered_term is not None:
+            self.logger.info(
+                "Deleting filtered message",
+                guild_id=guild_id,
+                user_id=user_id,
+                term=filtered_term,
+            )
+            try:
+                await message.delete()
+                self.bot.outbox.send(
+                    message.channel,
+                    f"{message.author.mention} your message contained a banned word.",
+                    delete_after=10,
+                    coalesce_key="auto_moderation",
+                )
+            except discord.HTTPException as e:
+                self.logger.error(
+                    "Failed to delete filtered message",
+                    guild_id=guild_id,
+                    user_id=user_id,
+                    error=str(e),
+                )
+            return
+
+        now = time.monotonic()
+        violation = self._detect_violation(message, now)
+        if violation is None:
+            return
+
+        # Every violating message is deleted, only the warning has a cooldown.
+        warn = self._should_warn(message, now)
+        self.logger.info(
+            "Detected spam",
+            guild_id=guild_id,
+            user_id=user_id,
+            violation=violation,
+            warned=warn,
+        )
+        if warn:
+            await self._add_warning(guild_id, user_id)
+
+        try:
+            await message.delete()
+            if warn:
+                self.bot.outbox.send(
+                    message.channel,
+                    f"{message.author.mention} you have been warned for {violation}.",
+                    delete_after=10,
+                    coalesce_key="auto_moderation",
+                )
+        except discord.HTTPException as e:
+            self.logger.error(
+                "Failed to act on spam message",
+                guild_id=guild_id,
+                user_id=user_id,
+                error=str(e),
+            )
+
+    async def _add_warning(self, guild_id: int, user_id: int) -> None:
+        async with get_session() as session:
+            await upsert_increment(
+                session,
+                UserProfile,
+                [{"guild_id": guild_id, "user_id": user_id, "warning_count": 1}],
+                index_elements=["guild_id", "user_id"],
+                increment=["warning_count"],
+            )
+            await session.commit()
+
+        self.bot.profile_cache.invalidate((guild_id, user_id))
+
+
+async def setup(bot: ProgAndBot) -> None:
+    await bot.add_cog(AutoModeration(bot))
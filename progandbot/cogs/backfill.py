@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from collections import Counter
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from discord import app_commands
+from discord.ext import commands
+from sqlalchemy import select
+
+from progandbot.core.checks import in_guild
+from progandbot.core.rate_limit import TokenBucket
+from progandbot.db.models.backfill_checkpoint import BackfillCheckpoint
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+from progandbot.db.upsert import upsert_increment
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from progandbot.core.bot import ProgAndBot
+
+
+logger = structlog.get_logger(__name__)
+
+BACKFILL_CONCURRENCY = 3
+BACKFILL_FLUSH_MESSAGES = 1000
+# Channel history is fetched in pages of 100 messages, one request each.
+HISTORY_PAGE_SIZE = 100
+HISTORY_PAGES_PER_SECOND = 1.0
+HISTORY_PAGE_BURST = 5
+
+
+@dataclass
+class BackfillProgress:
+    channels: int
+    channels_done: int = 0
+    messages_scanned: int = 0
+    messages_counted: int = 0
+    started: float = field(default_factory=time.monotonic)
+    task: asyncio.Task[None] | None = None
+
+
+class Backfill(commands.Cog):
+    """Counts the messages that were sent before live tracking started.
+
+    Every readable text channel gets a checkpoint row holding the id of the
+    newest message to skip and the oldest message counted so far. Workers walk
+    the history backwards from there, at most ``BACKFILL_CONCURRENCY`` channels
+    at a time and sharing one token bucket for history requests, aggregate the
+    counts per user in memory and flush them together with the checkpoint, so
+    a restart resumes without counting anything twice.
+    """
+
+    def __init__(self, bot: ProgAndBot) -> None:
+        self.bot = bot
+        self.logger = logger.bind(cog_name=self.__class__.__name__)
+
+        self.runs: dict[int, BackfillProgress] = {}
+        self.semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+        self.page_bucket = TokenBucket(HISTORY_PAGE_BURST, HISTORY_PAGES_PER_SECOND)
+        self._resume_task: asyncio.Task[None] | None = None
+
+        self.logger.info(f"Initialized {self.__class__.__name__} cog")
+
+    async def cog_load(self) -> None:
+        self._resume_task = asyncio.create_task(self._resume_pending())
+
+    async def cog_unload(self) -> None:
+        # Progress is checkpointed, interrupted runs resume on the next load.
+        tasks = [run.task for run in self.runs.values() if run.task is not None]
+        if self._resume_task is not None:
+            tasks.append(self._resume_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @app_commands.command(
+        name="backfill",
+        description="Count the messages sent before the bot started tracking.",
+    )
+    @app_commands.describe(
+        before="Only count messages sent before this date (YYYY-MM-DD),"
+        " the day the bot started counting messages."
+    )
+    @app_commands.default_permissions(administrator=True)
+    @in_guild()
+    async def backfill(self, interaction: discord.Interaction, before: str) -> None:
+        assert interaction.guild is not None
+        guild = interaction.guild
+
+        run = self.runs.get(guild.id)
+        if run is not None and run.task is not None and not run.task.done():
+            await interaction.response.send_message(
+                f"Backfill in progress: {run.channels_done}/{run.channels} channels,"
+                f" {run.messages_counted} messages counted"
+                f" ({run.messages_scanned} scanned).",
+                ephemeral=True,
+            )
+            return
+
+        # Message counts have no record of when tracking started, and the
+        # activity tables only go back to their own rollout, so the cutoff must
+        # come from an admin to avoid counting live tracked messages twice.
+        try:
+            until = date.fromisoformat(before)
+        except ValueError:
+            await interaction.response.send_message(
+                "Invalid date, use the YYYY-MM-DD format.", ephemeral=True
+            )
+            return
+        if until > discord.utils.utcnow().date():
+            await interaction.response.send_message(
+                "The date cannot be in the future.", ephemeral=True
+            )
+            return
+
+        async with get_session() as session:
+            checkpoints = list(
+                await session.scalars(
+                    select(BackfillCheckpoint).where(
+                        BackfillCheckpoint.guild_id == guild.id  # type: ignore[arg-type]
+                    )
+                )
+            )
+            if not checkpoints:
+                checkpoints = await self._create_checkpoints(session, guild, until)
+
+        pending = [
+            checkpoint for checkpoint in checkpoints if checkpoint.completed_at is None
+        ]
+        if not pending:
+            await interaction.response.send_message(
+                "Message history has already been backfilled for this server.",
+                ephemeral=True,
+            )
+            return
+
+        self._start_run(guild, pending, interaction.channel)
+        await interaction.response.send_message(
+            f"Backfilling message counts from {len(pending)} channels,"
+            " I will post here when it is done.",
+            ephemeral=True,
+        )
+
+    async def _create_checkpoints(
+        self, session: AsyncSession, guild: discord.Guild, until: date
+    ) -> list[BackfillCheckpoint]:
+        until_message_id = discord.utils.time_snowflake(
+            datetime(until.year, until.month, until.day, tzinfo=UTC)
+        )
+
+        checkpoints = [
+            BackfillCheckpoint(
+                guild_id=guild.id,
+                channel_id=channel.id,
+                until_message_id=until_message_id,
+            )
+            for channel in guild.text_channels
+            if channel.permissions_for(guild.me).read_message_history
+        ]
+        session.add_all(checkpoints)
+        await session.commit()
+        self.logger.info(
+            "Created backfill checkpoints",
+            guild_id=guild.id,
+            channels=len(checkpoints),
+            until=until.isoformat(),
+        )
+        return checkpoints
+
+    async def _resume_pending(self) -> None:
+        await self.bot.wait_until_ready()
+
+        async with get_session() as session:
+            result = await session.scalars(
+                select(BackfillCheckpoint).where(
+                    BackfillCheckpoint.completed_at.is_(None)  # type: ignore[union-attr]
+                )
+            )
+            pending: defaultdict[int, list[BackfillCheckpoint]] = defaultdict(list)
+            for checkpoint in result:
+                assert checkpoint.guild_id is not None
+                pending[checkpoint.guild_id].append(checkpoint)
+
+        for guild_id, checkpoints in pending.items():
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                continue
+            self.logger.info(
+                "Resuming backfill", guild_id=guild_id, channels=len(checkpoints)
+            )
+            self._start_run(guild, checkpoints)
+
+    def _start_run(
+        self,
+        guild: discord.Guild,
+        checkpoints: list[BackfillCheckpoint],
+        report_channel: discord.abc.Messageable | None = None,
+    ) -> None:
+        progress = BackfillProgress(channels=len(checkpoints))
+        progress.task = asyncio.create_task(
+            self._run(guild, checkpoints, progress, report_channel),
+            name=f"backfill:{guild.id}",
+        )
+        self.runs[guild.id] = progress
+
+    async def _run(
+        self,
+        guild: discord.Guild,
+        checkpoints: list[BackfillCheckpoint],
+        progress: BackfillProgress,
+        report_channel: discord.abc.Messageable | None,
+    ) -> None:
+        results = await asyncio.gather(
+            *(
+                self._backfill_channel(guild, checkpoint, progress)
+                for checkpoint in checkpoints
+            ),
+            return_exceptions=True,
+        )
+        failed = 0
+        for checkpoint, result in zip(checkpoints, results, strict=True):
+            if isinstance(result, Exception):
+                failed += 1
+                self.logger.error(
+                    "Failed to backfill channel",
+                    guild_id=guild.id,
+                    channel_id=checkpoint.channel_id,
+                    error=str(result),
+                )
+
+        self.logger.info(
+            "Backfill finished",
+            guild_id=guild.id,
+            channels=progress.channels,
+            failed=failed,
+            messages_scanned=progress.messages_scanned,
+            messages_counted=progress.messages_counted,
+            duration=round(time.monotonic() - progress.started, 3),
+        )
+        if report_channel is not None:
+            self.bot.outbox.send(
+                report_channel,
+                f"Backfill finished: counted {progress.messages_counted} messages"
+                f" from {progress.channels_done}/{progress.channels} channels.",
+            )
+
+    async def _wait_for_page(self) -> None:
+        while not self.page_bucket.consume():
+            await asyncio.sleep(self.page_bucket.retry_after())
+
+    async def _backfill_channel(
+        self,
+        guild: discord.Guild,
+        checkpoint: BackfillCheckpoint,
+        progress: BackfillProgress,
+    ) -> None:
+        assert checkpoint.channel_id is not None
+        async with self.semaphore:
+            channel = guild.get_channel(checkpoint.channel_id)
+            if not isinstance(channel, discord.TextChannel):
+                await self._flush(
+                    guild.id, checkpoint.channel_id, Counter(), None, True
+                )
+                return
+
+            before = discord.Object(
+                checkpoint.cursor_message_id or checkpoint.until_message_id
+            )
+            counts: Counter[int] = Counter()
+            cursor: int | None = None
+            scanned = 0
+            try:
+                async for message in channel.history(limit=None, before=before):
+                    scanned += 1
+                    cursor = message.id
+                    if not message.author.bot:
+                        counts[message.author.id] += 1
+
+                    if scanned % BACKFILL_FLUSH_MESSAGES == 0:
+                        await self._flush(guild.id, channel.id, counts, cursor, False)
+                        progress.messages_counted += counts.total()
+                        counts = Counter()
+                    if scanned % HISTORY_PAGE_SIZE == 0:
+                        progress.messages_scanned += HISTORY_PAGE_SIZE
+                        await self._wait_for_page()
+            except discord.Forbidden:
+                self.logger.warning(
+                    "Lost access to channel during backfill",
+                    guild_id=guild.id,
+                    channel_id=channel.id,
+                )
+
+            await self._flush(guild.id, channel.id, counts, cursor, True)
+            progress.messages_counted += counts.total()
+            progress.messages_scanned += scanned % HISTORY_PAGE_SIZE
+            progress.channels_done += 1
+
+    async def _flush(
+        self,
+        guild_id: int,
+        channel_id: int,
+        counts: Counter[int],
+        cursor: int | None,
+        completed: bool,
+    ) -> None:
+        async with get_session() as session:
+            await upsert_increment(
+                session,
+                UserProfile,
+                [
+                    {"guild_id": guild_id, "user_id": user_id, "message_count": count}
+                    for user_id, count in counts.items()
+                ],
+                index_elements=["guild_id", "user_id"],
+                increment=["message_count"],
+            )
+
+            checkpoint = await session.get(BackfillCheckpoint, (guild_id, channel_id))
+            assert checkpoint is not None
+            if cursor is not None:
+                checkpoint.cursor_message_id = cursor
+            checkpoint.messages_counted += counts.total()
+            if completed:
+                checkpoint.completed_at = discord.utils.utcnow()
+            await session.commit()
+
+        for user_id in counts:
+            self.bot.profile_cache.invalidate((guild_id, user_id))
+
+
+async def setup(bot: ProgAndBot) -> None:
+    await bot.add_cog(Backfill(bot))
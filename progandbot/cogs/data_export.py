@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from discord import app_commands
+from discord.ext import commands
+
+from progandbot.core.checks import in_guild
+from progandbot.core.enums import ExportFormat
+from progandbot.db.session import get_session
+from progandbot.db.transfer import export_guild
+from progandbot.db.transfer import resolve_format
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+
+
+logger = structlog.get_logger(__name__)
+
+
+class DataExport(commands.Cog):
+    def __init__(self, bot: ProgAndBot) -> None:
+        self.bot = bot
+        self.logger = logger.bind(cog_name=self.__class__.__name__)
+
+        # Exports hold a database connection for a while, run one at a time.
+        self.lock = asyncio.Lock()
+
+        self.logger.info(f"Initialized {self.__class__.__name__} cog")
+
+    @app_commands.command(
+        name="export", description="Export all the data of this server."
+    )
+    @app_commands.describe(
+        export_format="File format of the exported tables, parquet by default."
+    )
+    @app_commands.rename(export_format="format")
+    @app_commands.default_permissions(administrator=True)
+    @in_guild()
+    async def export(
+        self,
+        interaction: discord.Interaction,
+        export_format: ExportFormat = ExportFormat.PARQUET,
+    ) -> None:
+        assert interaction.guild is not None
+        guild = interaction.guild
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        export_format = resolve_format(export_format)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            directory = Path(tmp_dir) / f"guild-{guild.id}"
+            async with self.lock:
+                async with get_session(read_only=True) as session:
+                    exported = await export_guild(
+                        session, guild.id, directory, export_format
+                    )
+                archive = Path(
+                    await asyncio.to_thread(
+                        shutil.make_archive, str(directory), "zip", directory
+                    )
+                )
+
+            size = archive.stat().st_size
+            if size > guild.filesize_limit:
+                self.logger.warning(
+                    "Export is too large to upload", guild_id=guild.id, size=size
+                )
+                await interaction.followup.send(
+                    f"The export is {size // 1024 // 1024} MiB, larger than this"
+                    " server's upload limit. Ask the bot owner to run"
+                    f" `python -m progandbot export {guild.id} <directory>` instead.",
+                    ephemeral=True,
+                )
+                return
+
+            await interaction.followup.send(
+                f"Exported {sum(exported.values())} rows from {len(exported)}"
+                f" tables as {export_format.value}.",
+                file=discord.File(archive),
+                ephemeral=True,
+            )
+
+
+async def setup(bot: ProgAndBot) -> None:
+    await bot.add_cog(DataExport(bot))
@@ -1,22 +1,59 @@
 from __future__ import annotations
 
+import time
+
 from typing import TYPE_CHECKING
 
 import structlog
 
 from discord.ext import commands
+from sqlalchemy import select
 
 from progandbot.db.models.guild_config import GuildConfig
 from progandbot.db.session import get_session
+from progandbot.db.upsert import insert_ignore
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     import discord
 
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 logger = structlog.get_logger(__name__)
 
 
+async def ensure_guild_configs(
+    session: AsyncSession, guild_ids: Collection[int]
+) -> list[int]:
+    """Create default configs for the guilds that have none, returning their ids.
+
+    Existing configs are found with one query and the missing ones are bulk
+    inserted with ``ON CONFLICT DO NOTHING``, so a concurrent insert for the
+    same guild is harmless.
+    """
+    if not guild_ids:
+        return []
+
+    result = await session.execute(
+        select(GuildConfig.guild_id).where(
+            GuildConfig.guild_id.in_(guild_ids)  # type: ignore[union-attr]
+        )
+    )
+    missing = sorted(set(guild_ids) - set(result.scalars()))
+
+    await insert_ignore(
+        session,
+        GuildConfig,
+        [{"guild_id": guild_id} for guild_id in missing],
+        index_elements=["guild_id"],
+    )
+    await session.commit()
+    return missing
+
+
 class GuildJoin(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
@@ -24,22 +61,33 @@ class GuildJoin(commands.Cog):
 
         self.logger.info(f"Initialized {self.__class__.__name__} cog")
 
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        start = time.monotonic()
+        guild_ids = [guild.id for guild in self.bot.guilds]
+        async with get_session() as session:
+            created = await ensure_guild_configs(session, guild_ids)
+
+        self.logger.info(
+            "Reconciled guild configs",
+            guilds=len(guild_ids),
+            created=len(created),
+            duration=round(time.monotonic() - start, 3),
+        )
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         self.logger.info("Joined a new guild", guild_id=guild.id, guild_name=guild.name)
 
         async with get_session() as session:
-            guild_config = await session.get(GuildConfig, guild.id)
-            if guild_config:
-                self.logger.info(
-                    "Skipping guild config creation, already exists", guild_id=guild.id
-                )
-                return
-
-            guild_config = GuildConfig(guild_id=guild.id)
-            session.add(guild_config)
-            await session.commit()
+            created = await ensure_guild_configs(session, [guild.id])
+
+        if created:
             self.logger.info("Created new guild config", guild_id=guild.id)
+        else:
+            self.logger.info(
+                "Skipping guild config creation, already exists", guild_id=guild.id
+            )
 
 
 async def setup(bot: commands.Bot) -> None:
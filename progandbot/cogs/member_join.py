@@ -2,22 +2,43 @@ from __future__ import annotations
 
 import io
 
+from typing import TYPE_CHECKING
+
 import discord
 import structlog
 
 from discord.ext import commands
-from PIL import Image
-from PIL import ImageDraw
 
-from progandbot.db.models.guild_config import GuildConfig
-from progandbot.db.session import get_session
+from progandbot.core.config import settings
+from progandbot.core.guild_configs import get_guild_config
+from progandbot.core.rendering import AvatarLayer
+from progandbot.core.rendering import CardTemplate
+from progandbot.core.rendering import TextLayer
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+    from progandbot.core.enums import ImageFormat
+    from progandbot.core.rendering import CardData
+    from progandbot.db.models.guild_config import GuildConfig
 
 
 logger = structlog.get_logger(__name__)
 
+WELCOME_TEMPLATE = CardTemplate(
+    name="welcome",
+    version=1,
+    background="assets/welcome_background.jpg",
+    layers=(
+        AvatarLayer(position=(50, 50), size=(150, 150)),
+        TextLayer(position=(220, 80), text="WELCOME!", font_size=40),
+        TextLayer(position=(220, 150), text="{name}", font_size=28),
+    ),
+)
+
 
 class MemberJoin(commands.Cog):
-    def __init__(self, bot: commands.Bot) -> None:
+    def __init__(self, bot: ProgAndBot) -> None:
         self.bot = bot
         self.logger = logger.bind(cog_name=self.__class__.__name__)
 
@@ -30,55 +51,37 @@ class MemberJoin(commands.Cog):
             "Member joined to a guild", member_id=member.id, guild_id=guild_id
         )
 
-        async with get_session() as session:
-            guild_config = await session.get(GuildConfig, guild_id)
-            if not guild_config:
-                self.logger.warning(
-                    "Guild config not found for member join",
-                    member_id=member.id,
-                    guild_id=guild_id,
-                )
-                return
-            await self._send_welcome_message(member, guild_config)
-
-    async def _create_welcome_image(self, member: discord.Member) -> io.BytesIO | None:
-        if member.avatar is None:
-            return None
-
-        background = Image.open("assets/welcome_background.jpg")
-
-        draw = ImageDraw.Draw(background)
-
-        avatar_size = (150, 150)
-
-        avatar_bytes = await member.avatar.read()
-        avatar_image = Image.open(io.BytesIO(avatar_bytes)).convert("RGBA")
-        avatar_image = avatar_image.resize(avatar_size)
-
-        avatar_mask = Image.new("L", avatar_size, 0)
-        draw_mask = ImageDraw.Draw(avatar_mask)
-        draw_mask.ellipse((0, 0, *avatar_size), fill=255)
+        guild_config = await get_guild_config(self.bot.cache, guild_id)
+        if not guild_config:
+            self.logger.warning(
+                "Guild config not found for member join",
+                member_id=member.id,
+                guild_id=guild_id,
+            )
+            return
+        await self._send_welcome_message(member, guild_config)
 
-        background.paste(avatar_image, (50, 50), mask=avatar_mask)
+    async def _create_welcome_image(
+        self, member: discord.Member, image_format: ImageFormat
+    ) -> io.BytesIO | None:
+        avatar = member.avatar
+        if avatar is None:
+            return None
 
-        draw.text(
-            (220, 80),
-            "WELCOME!",
-            fill="white",
-            font=None,
-        )
-        draw.text(
-            (220, 150),
-            f"{member.name}#{member.discriminator}",
-            fill="white",
-            font=None,
+        async def load_data() -> CardData:
+            return {
+                "avatar": await avatar.read(),
+                "name": f"{member.name}#{member.discriminator}",
+            }
+
+        rendered = await self.bot.card_renderer.render(
+            WELCOME_TEMPLATE,
+            (member.id, avatar.key, member.name),
+            load_data,
+            image_format=image_format,
+            quality=settings.IMAGE_QUALITY,
         )
-
-        buffer = io.BytesIO()
-        background.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        return buffer
+        return io.BytesIO(rendered)
 
     async def _send_welcome_message(
         self, member: discord.Member, guild_config: GuildConfig
@@ -87,38 +90,31 @@ class MemberJoin(commands.Cog):
             return
 
         welcome_channel = member.guild.get_channel(guild_config.welcome_channel_id)
-        if not welcome_channel:
+        if not isinstance(welcome_channel, discord.TextChannel):
             return
         welcome_message = guild_config.welcome_message.replace(
             "%MEMBER%", member.mention
         )
 
-        image_buffer = await self._create_welcome_image(member)
+        image_format = guild_config.image_format or settings.IMAGE_FORMAT
+        image_buffer = await self._create_welcome_image(member, image_format)
+        picture = None
         if image_buffer:
-            picture = discord.File(image_buffer, filename="welcome.png")
-
-        try:
-            assert isinstance(welcome_channel, discord.TextChannel)
-            if image_buffer:
-                await welcome_channel.send(content=welcome_message, file=picture)
-            else:
-                await welcome_channel.send(welcome_message)
-            self.logger.info(
-                "Sent welcome message",
-                member_id=member.id,
-                guild_id=guild_config.guild_id,
-                channel_id=welcome_channel.id,
-            )
-        except Exception as e:
-            self.logger.error(
-                "Failed to send welcome message",
-                member_id=member.id,
-                guild_id=guild_config.guild_id,
-                channel_id=guild_config.welcome_channel_id,
-                error=str(e),
+            picture = discord.File(
+                image_buffer, filename=f"welcome.{image_format.extension}"
             )
-            return
+
+        # Welcomes for a burst of joins are merged into a single message.
+        self.bot.outbox.send(
+            welcome_channel, welcome_message, file=picture, coalesce_key="welcome"
+        )
+        self.logger.info(
+            "Queued welcome message",
+            member_id=member.id,
+            guild_id=guild_config.guild_id,
+            channel_id=welcome_channel.id,
+        )
 
 
-async def setup(bot: commands.Bot) -> None:
+async def setup(bot: ProgAndBot) -> None:
     await bot.add_cog(MemberJoin(bot))
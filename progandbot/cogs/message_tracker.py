@@ -1,29 +1,121 @@
 from __future__ import annotations
 
+from collections import Counter
+from datetime import date
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+import discord
 import structlog
 
 from discord.ext import commands
+from sqlalchemy import delete
+from sqlalchemy import select
+from sqlalchemy.exc import DataError
+from sqlalchemy.exc import IntegrityError
 
+from progandbot.db.models.activity import DailyActivity
+from progandbot.db.models.activity import MonthlyActivity
 from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.partitions import create_partitions
+from progandbot.db.partitions import drop_partitions_before
 from progandbot.db.session import get_session
+from progandbot.db.streaming import stream_partitions
+from progandbot.db.upsert import upsert_increment
 
 
 if TYPE_CHECKING:
-    import discord
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from progandbot.core.bot import ProgAndBot
 
 
 logger = structlog.get_logger(__name__)
 
+ACTIVITY_FLUSH_SECONDS = 30
+# Failed rows are retried this many flushes before they are dropped.
+ACTIVITY_FLUSH_RETRIES = 5
+# Beyond this many pending rows, counts for new rows are dropped until a flush
+# gets through, which bounds memory during a long database outage.
+ACTIVITY_PENDING_MAX_ROWS = 100_000
+# Errors caused by the rows themselves. Anything else, like the database being
+# unreachable, says nothing about the rows and is retried as a whole.
+ACTIVITY_ROW_ERRORS = (IntegrityError, DataError)
+ACTIVITY_COMPACT_SECONDS = 24 * 60 * 60
+ACTIVITY_COMPACT_JITTER = 10 * 60
+ACTIVITY_RETENTION_DAYS = 90
+DAILY_ACTIVITY_TABLE = "daily_activity"
+
+ActivityKey = tuple[int, int, date]
+
+
+async def _upsert_activity_counts(
+    session: AsyncSession,
+    model: type[DailyActivity] | type[MonthlyActivity],
+    period_column: str,
+    counts: Counter[ActivityKey],
+) -> None:
+    rows = [
+        {
+            "guild_id": guild_id,
+            "user_id": user_id,
+            period_column: period,
+            "message_count": count,
+        }
+        for (guild_id, user_id, period), count in counts.items()
+    ]
+    await upsert_increment(
+        session,
+        model,
+        rows,
+        index_elements=["guild_id", "user_id", period_column],
+        increment=["message_count"],
+    )
+
 
 class MessageTracker(commands.Cog):
-    def __init__(self, bot: commands.Bot) -> None:
+    def __init__(self, bot: ProgAndBot) -> None:
         self.bot = bot
         self.logger = logger.bind(cog_name=self.__class__.__name__)
 
+        self.pending_activity: Counter[ActivityKey] = Counter()
+        self.flush_retries: Counter[ActivityKey] = Counter()
+        self.dropped_messages = 0
+
         self.logger.info(f"Initialized {self.__class__.__name__} cog")
 
+    async def cog_load(self) -> None:
+        # The job only runs an interval after its last run, which may be months
+        # ago after a long downtime.
+        try:
+            await self.create_activity_partitions()
+        except Exception as e:
+            self.logger.error("Failed to create activity partitions", error=str(e))
+        self.bot.scheduler.add_job(
+            "flush_activity",
+            self.flush_activity,
+            interval=ACTIVITY_FLUSH_SECONDS,
+            persist=False,
+        )
+        self.bot.scheduler.add_job(
+            "compact_activity",
+            self.compact_activity,
+            interval=ACTIVITY_COMPACT_SECONDS,
+            jitter=ACTIVITY_COMPACT_JITTER,
+        )
+        self.bot.scheduler.add_job(
+            "create_activity_partitions",
+            self.create_activity_partitions,
+            interval=ACTIVITY_COMPACT_SECONDS,
+            jitter=ACTIVITY_COMPACT_JITTER,
+        )
+
+    async def cog_unload(self) -> None:
+        await self.bot.scheduler.remove_job("flush_activity")
+        await self.bot.scheduler.remove_job("compact_activity")
+        await self.bot.scheduler.remove_job("create_activity_partitions")
+        await self.flush_activity()
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         if message.author.bot or not message.guild:
@@ -31,18 +123,159 @@ class MessageTracker(commands.Cog):
 
         guild_id = message.guild.id
         user_id = message.author.id
+        self._add_pending((guild_id, user_id, discord.utils.utcnow().date()), 1)
+
         async with get_session() as session:
-            user_profile = await session.get(UserProfile, (guild_id, user_id))
-            if not user_profile:
-                user_profile = UserProfile(guild_id=guild_id, user_id=user_id)
-                session.add(user_profile)
-                self.logger.info(
-                    "Created new user profile", guild_id=guild_id, user_id=user_id
-                )
+            await upsert_increment(
+                session,
+                UserProfile,
+                [{"guild_id": guild_id, "user_id": user_id, "message_count": 1}],
+                index_elements=["guild_id", "user_id"],
+                increment=["message_count"],
+            )
+            await session.commit()
+        # The cached /userinfo embed is left alone, message counts in it are
+        # allowed to trail by up to the profile cache TTL.
+
+    def _add_pending(self, key: ActivityKey, count: int) -> None:
+        if (
+            key not in self.pending_activity
+            and len(self.pending_activity) >= ACTIVITY_PENDING_MAX_ROWS
+        ):
+            self.dropped_messages += count
+            return
+        self.pending_activity[key] += count
+
+    async def flush_activity(self) -> None:
+        if self.dropped_messages:
+            self.logger.error(
+                "Dropped activity counts, too many rows pending",
+                messages=self.dropped_messages,
+            )
+            self.dropped_messages = 0
+        if not self.pending_activity:
+            return
+
+        counts, self.pending_activity = self.pending_activity, Counter()
+        try:
+            await self._write_activity(counts)
+        except ACTIVITY_ROW_ERRORS as e:
+            self.logger.error(
+                "Failed to flush activity counts, retrying row by row",
+                rows=len(counts),
+                error=str(e),
+            )
+            failed, unwritten = await self._write_activity_rows(counts)
+            self._requeue_activity(failed)
+            for key, count in unwritten.items():
+                self._add_pending(key, count)
+            for key in counts.keys() - failed.keys() - unwritten.keys():
+                self.flush_retries.pop(key, None)
+            return
+        except Exception as e:
+            self.logger.warning(
+                "Failed to flush activity counts, retrying on the next flush",
+                rows=len(counts),
+                error=str(e),
+            )
+            for key, count in counts.items():
+                self._add_pending(key, count)
+            return
+
+        for key in counts:
+            self.flush_retries.pop(key, None)
+        self.logger.debug("Flushed activity counts", rows=len(counts))
+
+    async def _write_activity(self, counts: Counter[ActivityKey]) -> None:
+        async with get_session() as session:
+            await _upsert_activity_counts(session, DailyActivity, "day", counts)
+            await session.commit()
+
+    async def _write_activity_rows(
+        self, counts: Counter[ActivityKey]
+    ) -> tuple[Counter[ActivityKey], Counter[ActivityKey]]:
+        """Write every row in its own transaction.
+
+        Returns the rows rejected by the database, and the rows left unwritten
+        because of any other error, after which the remaining rows are not
+        tried either.
+        """
+        failed: Counter[ActivityKey] = Counter()
+        unwritten: Counter[ActivityKey] = Counter()
+        for key, count in counts.items():
+            if unwritten:
+                unwritten[key] = count
+                continue
+            try:
+                await self._write_activity(Counter({key: count}))
+            except ACTIVITY_ROW_ERRORS:
+                failed[key] = count
+            except Exception:
+                unwritten[key] = count
+        return failed, unwritten
 
-            user_profile.message_count += 1
+    def _requeue_activity(self, failed: Counter[ActivityKey]) -> None:
+        dropped = []
+        for key, count in failed.items():
+            self.flush_retries[key] += 1
+            if self.flush_retries[key] > ACTIVITY_FLUSH_RETRIES:
+                del self.flush_retries[key]
+                dropped.append(key)
+            else:
+                self._add_pending(key, count)
+        if dropped:
+            self.logger.error(
+                "Dropped activity counts that keep failing to flush",
+                rows=len(dropped),
+                keys=dropped[:10],
+            )
+
+    async def compact_activity(self, today: date | None = None) -> None:
+        if today is None:
+            today = discord.utils.utcnow().date()
+        cutoff = today - timedelta(days=ACTIVITY_RETENTION_DAYS)
+
+        async with get_session() as session:
+            monthly_counts: Counter[ActivityKey] = Counter()
+            async for partition in stream_partitions(
+                session,
+                select(
+                    DailyActivity.guild_id,
+                    DailyActivity.user_id,
+                    DailyActivity.day,
+                    DailyActivity.message_count,
+                ).where(DailyActivity.day < cutoff),  # type: ignore[arg-type]
+            ):
+                for guild_id, user_id, day, count in partition:
+                    monthly_counts[(guild_id, user_id, day.replace(day=1))] += count
+
+            if monthly_counts:
+                await _upsert_activity_counts(
+                    session, MonthlyActivity, "month", monthly_counts
+                )
+            # Whole months are dropped as partitions, the rest is deleted from
+            # the one partition holding the cutoff.
+            dropped = await drop_partitions_before(
+                session, DAILY_ACTIVITY_TABLE, cutoff
+            )
+            await session.execute(
+                delete(DailyActivity).where(DailyActivity.day < cutoff)  # type: ignore[arg-type]
+            )
             await session.commit()
 
+        self.logger.info(
+            "Compacted daily activity into monthly buckets",
+            cutoff=cutoff.isoformat(),
+            monthly_rows=len(monthly_counts),
+            dropped_partitions=dropped,
+        )
+
+    async def create_activity_partitions(self) -> None:
+        async with get_session() as session:
+            await create_partitions(
+                session, DAILY_ACTIVITY_TABLE, discord.utils.utcnow().date()
+            )
+
 
-async def setup(bot: commands.Bot) -> None:
+async def setup(bot: ProgAndBot) -> None:
     await bot.add_cog(MessageTracker(bot))
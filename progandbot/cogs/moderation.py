@@ -1,20 +1,85 @@
 from __future__ import annotations
 
+import asyncio
+import re
+import time
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
 import discord
 import structlog
 
 from discord import app_commands
 from discord.ext import commands
 
+from progandbot.core.checks import in_text_channel
+from progandbot.core.embeds import EmbedFieldTemplate
+from progandbot.core.embeds import EmbedTemplate
+from progandbot.core.responses import auto_defer
+from progandbot.core.responses import respond
 from progandbot.db.models.user_profile import UserProfile
 from progandbot.db.session import get_session
+from progandbot.db.upsert import upsert_increment
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from progandbot.core.bot import ProgAndBot
 
 
 logger = structlog.get_logger(__name__)
 
+MAX_CLEAR_AMOUNT = 1000
+CLEAR_SCAN_LIMIT = 10000
+CLEAR_PROGRESS_INTERVAL = 2.0
+BULK_DELETE_BATCH_SIZE = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=1)
+SINGLE_DELETE_DELAY = 1.0
+# Interaction tokens expire 15 minutes after the command, so stop editing the
+# response a little before that.
+INTERACTION_EDIT_WINDOW = timedelta(minutes=14)
+
+KICK_EMBED = EmbedTemplate(
+    name="kick",
+    title_key="moderation.kick.title",
+    description_key="moderation.kick.description",
+    color=discord.Color.red(),
+    footer_key="moderation.footer",
+    fields=(
+        EmbedFieldTemplate("moderation.kick.by", "{moderator}"),
+        EmbedFieldTemplate("moderation.reason", "{reason}"),
+    ),
+)
+BAN_EMBED = EmbedTemplate(
+    name="ban",
+    title_key="moderation.ban.title",
+    description_key="moderation.ban.description",
+    color=discord.Color.red(),
+    footer_key="moderation.footer",
+    image_url="https://i2.kym-cdn.com/photos/images/masonry/000/791/407/40c.gif",
+    fields=(
+        EmbedFieldTemplate("moderation.ban.by", "{moderator}"),
+        EmbedFieldTemplate("moderation.reason", "{reason}"),
+    ),
+)
+WARN_EMBED = EmbedTemplate(
+    name="warn",
+    title_key="moderation.warn.title",
+    description_key="moderation.warn.description",
+    color=discord.Color.red(),
+    footer_key="moderation.footer",
+    image_url="https://media.tenor.com/sLgNruA4tsgAAAAM/warning-lights.gif",
+    fields=(
+        EmbedFieldTemplate("moderation.warn.by", "{moderator}"),
+        EmbedFieldTemplate("moderation.reason", "{reason}"),
+    ),
+)
+
 
 class Moderation(commands.Cog):
-    def __init__(self, bot: commands.Bot) -> None:
+    def __init__(self, bot: ProgAndBot) -> None:
         self.bot = bot
         self.logger = logger.bind(cog_name=self.__class__.__name__)
 
@@ -29,62 +94,51 @@ class Moderation(commands.Cog):
         reason="The reason for kicking the member.",
     )
     @app_commands.default_permissions(kick_members=True)
+    @in_text_channel()
     async def kick_member(
         self,
         interaction: discord.Interaction,
         member: discord.Member,
         reason: str = "Unspecified reason",
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            return
+        assert interaction.guild is not None
+        assert isinstance(interaction.channel, discord.TextChannel)
 
+        translator = self.bot.translator
+        lang_code = await translator.get_guild_language(interaction.guild.id)
         if member == interaction.user:
             await interaction.response.send_message(
-                "You cannot kick yourself!", ephemeral=True
+                translator.translate(lang_code, "moderation.kick.self"), ephemeral=True
             )
             return
 
         try:
-            assert self.bot.user is not None, "Bot user is not initialized"
-            embed = (
-                discord.Embed(
-                    title="Moderation: Member Kicked",
-                    description=f"{member.mention} has been kicked from the server.",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow(),
-                )
-                .set_thumbnail(url=member.display_avatar.url)
-                .set_footer(
-                    text="ProgAndBot Moderation",
-                    icon_url=interaction.user.display_avatar.url,
-                )
-                .add_field(
-                    name="Kicked By", value=interaction.user.mention, inline=True
-                )
+            embed = self.bot.embeds.render(
+                KICK_EMBED,
+                lang_code,
+                thumbnail_url=member.display_avatar.url,
+                footer_icon_url=interaction.user.display_avatar.url,
+                member=member.mention,
+                moderator=interaction.user.mention,
+                reason=reason,
             )
-            if reason:
-                embed.add_field(name="Reason", value=reason, inline=True)
             await interaction.channel.send(embed=embed)
 
             await member.kick(reason=reason)
 
             await interaction.response.send_message(
-                f"Successfully kicked {member.mention} from the server."
+                translator.translate(
+                    lang_code, "moderation.kick.success", member=member.mention
+                )
             )
         except discord.Forbidden:
             await interaction.response.send_message(
-                "I do not have permission to kick this member.", ephemeral=True
+                translator.translate(lang_code, "moderation.kick.forbidden"),
+                ephemeral=True,
             )
         except Exception as e:
             await interaction.response.send_message(
-                f"An error occurred while trying to kick the member: {e!s}",
+                translator.translate(lang_code, "moderation.kick.error", error=str(e)),
                 ephemeral=True,
             )
 
@@ -98,6 +152,7 @@ class Moderation(commands.Cog):
         clear_messages="Whether to clear the member's messages.",
     )
     @app_commands.default_permissions(ban_members=True)
+    @in_text_channel()
     async def ban_member(
         self,
         interaction: discord.Interaction,
@@ -105,45 +160,27 @@ class Moderation(commands.Cog):
         reason: str = "Unspecified reason",
         clear_messages: bool = False,
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            return
+        assert interaction.guild is not None
+        assert isinstance(interaction.channel, discord.TextChannel)
 
+        translator = self.bot.translator
+        lang_code = await translator.get_guild_language(interaction.guild.id)
         if member == interaction.user:
             await interaction.response.send_message(
-                "You cannot ban yourself!", ephemeral=True
+                translator.translate(lang_code, "moderation.ban.self"), ephemeral=True
             )
             return
 
         try:
-            assert self.bot.user is not None, "Bot user is not initialized"
-            embed = (
-                discord.Embed(
-                    title="Moderation: Member Banned",
-                    description=f"{member.mention} has been banned from the server.",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow(),
-                )
-                .set_thumbnail(url=member.display_avatar.url)
-                .set_footer(
-                    text="ProgAndBot Moderation",
-                    icon_url=interaction.user.display_avatar.url,
-                )
-                .add_field(
-                    name="Banned By", value=interaction.user.mention, inline=True
-                )
-                .set_image(
-                    url="https://i2.kym-cdn.com/photos/images/masonry/000/791/407/40c.gif"
-                )
+            embed = self.bot.embeds.render(
+                BAN_EMBED,
+                lang_code,
+                thumbnail_url=member.display_avatar.url,
+                footer_icon_url=interaction.user.display_avatar.url,
+                member=member.mention,
+                moderator=interaction.user.mention,
+                reason=reason,
             )
-            if reason:
-                embed.add_field(name="Reason", value=reason, inline=True)
             await interaction.channel.send(embed=embed)
 
             await member.ban(
@@ -151,15 +188,18 @@ class Moderation(commands.Cog):
             )
 
             await interaction.response.send_message(
-                f"Successfully banned {member.mention} from the server."
+                translator.translate(
+                    lang_code, "moderation.ban.success", member=member.mention
+                )
             )
         except discord.Forbidden:
             await interaction.response.send_message(
-                "I do not have permission to ban this member.", ephemeral=True
+                translator.translate(lang_code, "moderation.ban.forbidden"),
+                ephemeral=True,
             )
         except Exception as e:
             await interaction.response.send_message(
-                f"An error occurred while trying to ban the member: {e!s}",
+                translator.translate(lang_code, "moderation.ban.error", error=str(e)),
                 ephemeral=True,
             )
 
@@ -172,84 +212,73 @@ class Moderation(commands.Cog):
         reason="The reason for banning the member.",
     )
     @app_commands.default_permissions(kick_members=True)
+    @auto_defer()
+    @in_text_channel()
     async def warn_member(
         self,
         interaction: discord.Interaction,
         member: discord.Member,
         reason: str = "Unspecified reason",
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            await interaction.response.send_message(
-                "This command can only be used in a text channel.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
+        assert isinstance(interaction.channel, discord.TextChannel)
 
+        translator = self.bot.translator
+        lang_code = await translator.get_guild_language(interaction.guild.id)
         if member == interaction.user:
-            await interaction.response.send_message(
-                "You cannot warn yourself!", ephemeral=True
+            await respond(
+                interaction,
+                translator.translate(lang_code, "moderation.warn.self"),
+                ephemeral=True,
             )
             return
 
         try:
             async with get_session() as session:
-                user_profile = await session.get(
-                    UserProfile, (interaction.guild.id, member.id)
+                await upsert_increment(
+                    session,
+                    UserProfile,
+                    [
+                        {
+                            "guild_id": interaction.guild.id,
+                            "user_id": member.id,
+                            "warning_count": 1,
+                        }
+                    ],
+                    index_elements=["guild_id", "user_id"],
+                    increment=["warning_count"],
                 )
-                if not user_profile:
-                    user_profile = UserProfile(
-                        guild_id=interaction.guild.id, user_id=member.id
-                    )
-                    session.add(user_profile)
-                    self.logger.info(
-                        "Created new user profile",
-                        guild_id=interaction.guild.id,
-                        user_id=member.id,
-                    )
-
-                user_profile.warning_count += 1
                 await session.commit()
 
-            assert self.bot.user is not None, "Bot user is not initialized"
-            embed = (
-                discord.Embed(
-                    title="Moderation: Member Warned",
-                    description=f"{member.mention} has been warned.",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow(),
-                )
-                .set_thumbnail(url=member.display_avatar.url)
-                .set_footer(
-                    text="ProgAndBot Moderation",
-                    icon_url=interaction.user.display_avatar.url,
-                )
-                .add_field(
-                    name="Warned By", value=interaction.user.mention, inline=True
-                )
-                .set_image(
-                    url="https://media.tenor.com/sLgNruA4tsgAAAAM/warning-lights.gif"
-                )
+            self.bot.profile_cache.invalidate((interaction.guild.id, member.id))
+
+            embed = self.bot.embeds.render(
+                WARN_EMBED,
+                lang_code,
+                thumbnail_url=member.display_avatar.url,
+                footer_icon_url=interaction.user.display_avatar.url,
+                member=member.mention,
+                moderator=interaction.user.mention,
+                reason=reason,
             )
-            if reason:
-                embed.add_field(name="Reason", value=reason, inline=True)
             await interaction.channel.send(embed=embed)
 
-            await interaction.response.send_message(
-                f"Successfully warned {member.mention}."
+            await respond(
+                interaction,
+                translator.translate(
+                    lang_code, "moderation.warn.success", member=member.mention
+                ),
             )
         except discord.Forbidden:
-            await interaction.response.send_message(
-                "I do not have permission to warn this member.", ephemeral=True
+            await respond(
+                interaction,
+                translator.translate(lang_code, "moderation.warn.forbidden"),
+                ephemeral=True,
             )
         except Exception as e:
-            await interaction.response.send_message(
-                f"An error occurred while trying to warn the member: {e!s}",
+            await respond(
+                interaction,
+                translator.translate(lang_code, "moderation.warn.error", error=str(e)),
                 ephemeral=True,
             )
 
@@ -258,48 +287,168 @@ class Moderation(commands.Cog):
         description="Clear a specified number of messages from the channel.",
     )
     @app_commands.describe(
-        amount="The number of messages to clear (1-100).",
+        amount=f"The number of messages to clear (1-{MAX_CLEAR_AMOUNT}).",
+        user="Only clear messages sent by this user.",
+        pattern="Only clear messages whose content matches this regex.",
+        bots_only="Only clear messages sent by bots.",
+        with_attachments="Only clear messages that have attachments.",
     )
     @app_commands.default_permissions(manage_messages=True)
+    @in_text_channel()
     async def clear_messages(
         self,
         interaction: discord.Interaction,
         amount: int = 10,
+        user: discord.Member | None = None,
+        pattern: str | None = None,
+        bots_only: bool = False,
+        with_attachments: bool = False,
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            return
+        assert interaction.guild is not None
+        assert isinstance(interaction.channel, discord.TextChannel)
 
-        if amount not in range(1, 100 + 1):
+        if amount not in range(1, MAX_CLEAR_AMOUNT + 1):
             await interaction.response.send_message(
-                "You must specify a number between 1 and 100.", ephemeral=True
+                f"You must specify a number between 1 and {MAX_CLEAR_AMOUNT}.",
+                ephemeral=True,
             )
             return
 
+        content_regex: re.Pattern[str] | None = None
+        if pattern:
+            try:
+                content_regex = re.compile(pattern)
+            except re.error as e:
+                await interaction.response.send_message(
+                    f"Invalid regex pattern: {e!s}", ephemeral=True
+                )
+                return
+
+        def check(message: discord.Message) -> bool:
+            if user is not None and message.author.id != user.id:
+                return False
+            if bots_only and not message.author.bot:
+                return False
+            if with_attachments and not message.attachments:
+                return False
+            return content_regex is None or bool(content_regex.search(message.content))
+
         await interaction.response.defer(thinking=True, ephemeral=True)
 
+        channel = interaction.channel
         try:
-            deleted = await interaction.channel.purge(limit=amount)
-            await interaction.followup.send(
-                f"Successfully cleared {len(deleted)} messages from the channel."
-            )
+            deleted = await self._stream_purge(interaction, channel, amount, check)
         except discord.Forbidden:
-            await interaction.followup.send(
+            await self._report_clear(
+                interaction,
+                channel,
                 "I do not have permission to clear messages in this channel.",
-                ephemeral=True,
             )
         except Exception as e:
-            await interaction.followup.send(
+            await self._report_clear(
+                interaction,
+                channel,
                 f"An error occurred while trying to clear messages: {e!s}",
-                ephemeral=True,
             )
+        else:
+            await self._report_clear(
+                interaction,
+                channel,
+                f"Successfully cleared {deleted} messages from the channel.",
+                edit=True,
+            )
+
+    async def _report_clear(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel,
+        content: str,
+        *,
+        edit: bool = False,
+    ) -> None:
+        # Slow purges of old messages can outlive the interaction token, after
+        # which the only way to reach the moderator is the channel itself.
+        if not _can_edit_response(interaction):
+            self.bot.outbox.send(channel, f"{interaction.user.mention} {content}")
+        elif edit:
+            await interaction.edit_original_response(content=content)
+        else:
+            await interaction.followup.send(content, ephemeral=True)
+
+    async def _stream_purge(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel,
+        amount: int,
+        check: Callable[[discord.Message], bool],
+    ) -> int:
+        bulk_cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        batch: list[discord.Message] = []
+        deleted = 0
+        scanned = 0
+        last_report = time.monotonic()
+
+        async def report_progress(force: bool = False) -> None:
+            nonlocal last_report
+            now = time.monotonic()
+            if not force and now - last_report < CLEAR_PROGRESS_INTERVAL:
+                return
+            if not _can_edit_response(interaction):
+                return
+            last_report = now
+            await interaction.edit_original_response(
+                content=f"Clearing messages... {deleted}/{amount} deleted,"
+                f" {scanned} scanned."
+            )
+
+        async for message in channel.history(limit=CLEAR_SCAN_LIMIT):
+            if deleted + len(batch) >= amount:
+                break
+            scanned += 1
+            if not check(message):
+                continue
+
+            if message.created_at > bulk_cutoff:
+                batch.append(message)
+                if len(batch) == BULK_DELETE_BATCH_SIZE:
+                    await channel.delete_messages(batch)
+                    deleted += len(batch)
+                    batch = []
+                    await report_progress()
+                continue
+
+            # Bulk delete rejects anything older than 14 days, and history is
+            # newest first, so flush the pending batch before going slow.
+            if batch:
+                await channel.delete_messages(batch)
+                deleted += len(batch)
+                batch = []
+
+            try:
+                await message.delete()
+                deleted += 1
+            except discord.NotFound:
+                pass
+            await report_progress()
+            await asyncio.sleep(SINGLE_DELETE_DELAY)
+
+        if batch:
+            await channel.delete_messages(batch)
+            deleted += len(batch)
+
+        self.logger.info(
+            "Cleared messages",
+            guild_id=channel.guild.id,
+            channel_id=channel.id,
+            deleted=deleted,
+            scanned=scanned,
+        )
+        return deleted
+
+
+def _can_edit_response(interaction: discord.Interaction) -> bool:
+    return discord.utils.utcnow() - interaction.created_at < INTERACTION_EDIT_WINDOW
 
 
-async def setup(bot: commands.Bot) -> None:
+async def setup(bot: ProgAndBot) -> None:
     await bot.add_cog(Moderation(bot))
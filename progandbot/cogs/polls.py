@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import textwrap
+
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -8,27 +10,117 @@ import structlog
 
 from discord import app_commands
 from discord.ext import commands
+from sqlalchemy import select
 
+from progandbot.core.checks import in_guild
+from progandbot.core.checks import in_text_channel
+from progandbot.core.responses import auto_defer
+from progandbot.core.responses import respond
+from progandbot.core.timers import TimerQueue
 from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.poll_result import PollResult
+from progandbot.db.models.poll_result import PollStats
+from progandbot.db.models.scheduled_poll import ScheduledPoll
 from progandbot.db.session import get_session
 
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from progandbot.core.bot import ProgAndBot
 
 
 logger = structlog.get_logger(__name__)
 
+POLL_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+MAX_SCHEDULE_MINUTES = 60 * 24 * 30
+POLL_STATS_RECENT = 5
+POLL_STATS_QUESTION_LENGTH = 120
+POLL_STATS_ANSWER_LENGTH = 55
+# Discord rejects embed fields longer than this.
+EMBED_FIELD_LENGTH = 1024
+# Discord polls last between 1 hour and 32 days.
+MAX_POLL_DURATION_HOURS = 24 * 32
+SCHEDULED_POLL_MAX_ATTEMPTS = 8
+SCHEDULED_POLL_RETRY_SECONDS = 60
+SCHEDULED_POLL_MAX_RETRY_SECONDS = 60 * 60
+
+
+def build_poll(
+    question: str, answers: list[str], duration_hours: int, allow_multiple: bool
+) -> discord.Poll:
+    poll = discord.Poll(
+        question=question,
+        duration=timedelta(hours=duration_hours),
+        multiple=allow_multiple,
+    )
+    for i, answer in enumerate(answers):
+        poll.add_answer(text=answer, emoji=POLL_EMOJIS[i])
+    return poll
+
 
-class Polls(commands.Cog):
+@app_commands.guild_only()
+class Polls(commands.GroupCog, group_name="poll"):
     def __init__(self, bot: ProgAndBot) -> None:
         self.bot = bot
         self.logger = logger.bind(cog_name=self.__class__.__name__)
 
+        self.scheduled_polls: TimerQueue[int] = TimerQueue(
+            "scheduled_polls", self._post_scheduled_poll
+        )
+        self.post_attempts: dict[int, int] = {}
+
         self.logger.info(f"Initialized {self.__class__.__name__} cog")
 
+    async def cog_load(self) -> None:
+        async with get_session() as session:
+            result = await session.execute(
+                select(ScheduledPoll.id, ScheduledPoll.scheduled_for).where(
+                    ScheduledPoll.posted_at.is_(None)  # type: ignore[union-attr]
+                )
+            )
+            for poll_id, scheduled_for in result:
+                self.scheduled_polls.schedule(poll_id, scheduled_for)
+
+        self.logger.info("Loaded scheduled polls", count=len(self.scheduled_polls))
+        self.scheduled_polls.start()
+
+    async def cog_unload(self) -> None:
+        self.scheduled_polls.stop()
+
+    async def _get_polls_channel(
+        self, interaction: discord.Interaction
+    ) -> tuple[GuildConfig, discord.TextChannel] | None:
+        assert interaction.guild is not None
+        async with get_session() as session:
+            guild_config = await session.get(GuildConfig, interaction.guild.id)
+        if not guild_config:
+            await respond(
+                interaction,
+                "Guild configuration not found. Please set up the bot first.",
+                ephemeral=True,
+            )
+            return None
+
+        if not guild_config.polls_channel_id:
+            await respond(
+                interaction,
+                "Polls channel is not set. Please configure it first.",
+                ephemeral=True,
+            )
+            return None
+
+        polls_channel = interaction.guild.get_channel(guild_config.polls_channel_id)
+        if not polls_channel or not isinstance(polls_channel, discord.TextChannel):
+            await respond(
+                interaction, "Polls channel is invalid or not found.", ephemeral=True
+            )
+            return None
+
+        return guild_config, polls_channel
+
     @app_commands.command(
-        name="poll",
+        name="create",
         description="Create a poll in the polls defined channel.",
     )
     @app_commands.describe(
@@ -47,6 +139,8 @@ class Polls(commands.Cog):
         allow_multiple="Allow users to select multiple answers. Default is False.",
     )
     @app_commands.default_permissions(manage_messages=True)
+    @auto_defer(ephemeral=True)
+    @in_text_channel()
     async def create_poll(
         self,
         interaction: discord.Interaction,
@@ -61,107 +155,409 @@ class Polls(commands.Cog):
         answer_8: str | None = None,
         answer_9: str | None = None,
         answer_10: str | None = None,
-        duration_hours: int = 24,
+        duration_hours: app_commands.Range[int, 1, MAX_POLL_DURATION_HOURS] = 24,
         allow_multiple: bool = False,
     ) -> None:
-        if interaction.guild is None:
-            await self.bot.send_guild_only_or_error(interaction)
+        assert interaction.guild is not None
+
+        polls_target = await self._get_polls_channel(interaction)
+        if polls_target is None:
+            return
+        guild_config, polls_channel = polls_target
+
+        if not question:
+            await respond(
+                interaction, "You must provide a question for the poll.", ephemeral=True
+            )
+            return
+
+        raw_answers = [
+            answer_1,
+            answer_2,
+            answer_3,
+            answer_4,
+            answer_5,
+            answer_6,
+            answer_7,
+            answer_8,
+            answer_9,
+            answer_10,
+        ]
+        answers = [answer for answer in raw_answers if answer]
+
+        if len(answers) not in range(2, 10 + 1):
+            await respond(
+                interaction,
+                "You must provide at least two answer options and at most 10 options!",
+                ephemeral=True,
+            )
             return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            await self.bot.send_text_channel_only_error(interaction)
+
+        try:
+            poll = build_poll(question, answers, duration_hours, allow_multiple)
+
+            await polls_channel.send(poll=poll, content=guild_config.polls_message)
+            await respond(
+                interaction,
+                f"Poll created successfully in {polls_channel.mention}!",
+                ephemeral=True,
+            )
+
+            logger.info(
+                "Poll created",
+                guild_id=interaction.guild.id,
+                channel_id=polls_channel.id,
+                question=question,
+                answers=answers,
+                duration_hours=duration_hours,
+                allow_multiple=allow_multiple,
+            )
+
+        except Exception as e:
+            logger.error(
+                "Failed to create poll",
+                guild_id=interaction.guild.id,
+                channel_id=polls_channel.id,
+                error=str(e),
+            )
+            await respond(
+                interaction,
+                f"An error occurred while creating the poll: {e!s}",
+                ephemeral=True,
+            )
             return
 
+    @app_commands.command(
+        name="schedule",
+        description="Schedule a poll to be posted later in the polls channel.",
+    )
+    @app_commands.describe(
+        starts_in_minutes="Minutes from now when the poll will be posted.",
+        question="The question for the poll.",
+        answer_1="The first answer option. It is mandatory.",
+        answer_2="The second answer option. It is mandatory.",
+        answer_3="The third answer option. Optional.",
+        answer_4="The fourth answer option. Optional.",
+        answer_5="The fifth answer option. Optional.",
+        answer_6="The sixth answer option. Optional.",
+        answer_7="The seventh answer option. Optional.",
+        answer_8="The eighth answer option. Optional.",
+        answer_9="The ninth answer option. Optional.",
+        answer_10="The tenth answer option. Optional.",
+        duration_hours="Duration of the poll in hours. Default is 24 hours.",
+        allow_multiple="Allow users to select multiple answers. Default is False.",
+    )
+    @app_commands.default_permissions(manage_messages=True)
+    @in_guild()
+    async def schedule_poll(
+        self,
+        interaction: discord.Interaction,
+        starts_in_minutes: app_commands.Range[int, 1, MAX_SCHEDULE_MINUTES],
+        question: str,
+        answer_1: str,
+        answer_2: str,
+        answer_3: str | None = None,
+        answer_4: str | None = None,
+        answer_5: str | None = None,
+        answer_6: str | None = None,
+        answer_7: str | None = None,
+        answer_8: str | None = None,
+        answer_9: str | None = None,
+        answer_10: str | None = None,
+        duration_hours: app_commands.Range[int, 1, MAX_POLL_DURATION_HOURS] = 24,
+        allow_multiple: bool = False,
+    ) -> None:
+        assert interaction.guild is not None
+
+        polls_target = await self._get_polls_channel(interaction)
+        if polls_target is None:
+            return
+        _, polls_channel = polls_target
+
+        raw_answers = [
+            answer_1,
+            answer_2,
+            answer_3,
+            answer_4,
+            answer_5,
+            answer_6,
+            answer_7,
+            answer_8,
+            answer_9,
+            answer_10,
+        ]
+        answers = [answer for answer in raw_answers if answer]
+
+        if not question or len(answers) not in range(2, 10 + 1):
+            await interaction.response.send_message(
+                "You must provide a question and between 2 and 10 answer options!",
+                ephemeral=True,
+            )
+            return
+
+        scheduled_for = discord.utils.utcnow() + timedelta(minutes=starts_in_minutes)
+        scheduled_poll = ScheduledPoll(
+            guild_id=interaction.guild.id,
+            channel_id=polls_channel.id,
+            question=question,
+            answers=answers,
+            duration_hours=duration_hours,
+            allow_multiple=allow_multiple,
+            scheduled_for=scheduled_for,
+        )
         async with get_session() as session:
-            guild_config = await session.get(GuildConfig, interaction.guild.id)
-            if not guild_config:
-                await interaction.response.send_message(
-                    "Guild configuration not found. Please set up the bot first.",
-                    ephemeral=True,
-                )
-                return
+            session.add(scheduled_poll)
+            await session.commit()
 
-            if not guild_config.polls_channel_id:
-                await interaction.response.send_message(
-                    "Polls channel is not set. Please configure it first.",
-                    ephemeral=True,
-                )
-                return
+        assert scheduled_poll.id is not None
+        self.scheduled_polls.schedule(scheduled_poll.id, scheduled_for)
 
-            polls_channel = interaction.guild.get_channel(guild_config.polls_channel_id)
-            if not polls_channel or not isinstance(polls_channel, discord.TextChannel):
-                await interaction.response.send_message(
-                    "Polls channel is invalid or not found.", ephemeral=True
-                )
-                return
+        self.logger.info(
+            "Poll scheduled",
+            guild_id=interaction.guild.id,
+            poll_id=scheduled_poll.id,
+            scheduled_for=scheduled_for.isoformat(),
+        )
+        await interaction.response.send_message(
+            f"Poll scheduled in {polls_channel.mention}"
+            f" {discord.utils.format_dt(scheduled_for, 'R')}.",
+            ephemeral=True,
+        )
 
-            if not question:
-                await interaction.response.send_message(
-                    "You must provide a question for the poll.", ephemeral=True
-                )
-                return
+    async def _post_scheduled_poll(self, poll_id: int) -> None:
+        await self.bot.wait_until_ready()
 
-            raw_answers = [
-                answer_1,
-                answer_2,
-                answer_3,
-                answer_4,
-                answer_5,
-                answer_6,
-                answer_7,
-                answer_8,
-                answer_9,
-                answer_10,
-            ]
-            answers = [answer for answer in raw_answers if answer]
-            emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
-
-            if len(answers) not in range(2, 10 + 1):
-                await interaction.response.send_message(
-                    "You must provide at least two answer options and at most 10 options!",
-                    ephemeral=True,
-                )
+        async with get_session() as session:
+            scheduled_poll = await session.get(ScheduledPoll, poll_id)
+            if not scheduled_poll or scheduled_poll.posted_at is not None:
                 return
+            guild_config = await session.get(GuildConfig, scheduled_poll.guild_id)
 
-            try:
-                poll = discord.Poll(
-                    question=question,
-                    duration=timedelta(hours=duration_hours),
-                    multiple=allow_multiple,
+            channel = self.bot.get_channel(scheduled_poll.channel_id)
+            if guild_config and isinstance(channel, discord.TextChannel):
+                poll = build_poll(
+                    scheduled_poll.question,
+                    scheduled_poll.answers,
+                    scheduled_poll.duration_hours,
+                    scheduled_poll.allow_multiple,
+                )
+                try:
+                    await channel.send(poll=poll, content=guild_config.polls_message)
+                except Exception as e:
+                    if self._retry_scheduled_poll(poll_id, e):
+                        return
+                else:
+                    self.logger.info(
+                        "Posted scheduled poll",
+                        guild_id=scheduled_poll.guild_id,
+                        poll_id=poll_id,
+                    )
+            else:
+                self.logger.warning(
+                    "Dropping scheduled poll, channel not found",
+                    guild_id=scheduled_poll.guild_id,
+                    poll_id=poll_id,
+                    channel_id=scheduled_poll.channel_id,
                 )
 
-                for i, answer in enumerate(answers):
-                    poll.add_answer(text=answer, emoji=emojis[i])
+            self.post_attempts.pop(poll_id, None)
+            scheduled_poll.posted_at = discord.utils.utcnow()
+            await session.commit()
 
-                await polls_channel.send(poll=poll, content=guild_config.polls_message)
-                await interaction.response.send_message(
-                    f"Poll created successfully in {polls_channel.mention}!",
-                    ephemeral=True,
-                )
+    def _retry_scheduled_poll(self, poll_id: int, error: Exception) -> bool:
+        """Schedule another attempt with exponential backoff, False to give up."""
+        attempts = self.post_attempts.get(poll_id, 0) + 1
+        if attempts >= SCHEDULED_POLL_MAX_ATTEMPTS:
+            self.logger.error(
+                "Dropping scheduled poll after repeated failures",
+                poll_id=poll_id,
+                attempts=attempts,
+                error=str(error),
+            )
+            return False
+
+        self.post_attempts[poll_id] = attempts
+        delay = min(
+            SCHEDULED_POLL_RETRY_SECONDS * 2 ** (attempts - 1),
+            SCHEDULED_POLL_MAX_RETRY_SECONDS,
+        )
+        self.scheduled_polls.schedule(
+            poll_id, discord.utils.utcnow() + timedelta(seconds=delay)
+        )
+        self.logger.warning(
+            "Failed to post scheduled poll, retrying",
+            poll_id=poll_id,
+            attempts=attempts,
+            retry_in=delay,
+            error=str(error),
+        )
+        return True
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        if message.type is not discord.MessageType.poll_result or not message.guild:
+            return
+        if message.reference is None or message.reference.message_id is None:
+            return
+        if not isinstance(message.channel, discord.TextChannel):
+            return
 
-                logger.info(
-                    "Poll created",
-                    guild_id=interaction.guild.id,
-                    channel_id=polls_channel.id,
-                    question=question,
+        try:
+            poll_message = await message.channel.fetch_message(
+                message.reference.message_id
+            )
+        except discord.HTTPException as e:
+            self.logger.error(
+                "Failed to fetch ended poll",
+                guild_id=message.guild.id,
+                message_id=message.reference.message_id,
+                error=str(e),
+            )
+            return
+
+        assert self.bot.user is not None, "Bot user is not initialized"
+        if poll_message.author.id != self.bot.user.id:
+            return
+
+        await self.archive_poll_result(poll_message, message.created_at)
+
+    async def archive_poll_result(
+        self, poll_message: discord.Message, ended_at: datetime
+    ) -> None:
+        poll = poll_message.poll
+        guild = poll_message.guild
+        if poll is None or guild is None:
+            return
+
+        answers: list[dict[str, str | int]] = [
+            {"text": answer.text, "votes": answer.vote_count} for answer in poll.answers
+        ]
+        total_votes = sum(answer.vote_count for answer in poll.answers)
+        voters = await self._count_voters(poll, total_votes)
+        member_count = guild.member_count or 0
+        participation = min(voters / member_count, 1.0) if member_count else 0.0
+        victor = poll.victor_answer
+
+        async with get_session() as session:
+            if await session.get(PollResult, poll_message.id):
+                return
+
+            session.add(
+                PollResult(
+                    message_id=poll_message.id,
+                    guild_id=guild.id,
+                    channel_id=poll_message.channel.id,
+                    question=poll.question,
                     answers=answers,
-                    duration_hours=duration_hours,
-                    allow_multiple=allow_multiple,
+                    victor_answer=victor.text if victor else None,
+                    total_votes=total_votes,
+                    member_count=member_count,
+                    ended_at=ended_at,
                 )
+            )
 
-            except Exception as e:
-                logger.error(
-                    "Failed to create poll",
-                    guild_id=interaction.guild.id,
-                    channel_id=polls_channel.id,
-                    error=str(e),
-                )
-                await interaction.response.send_message(
-                    f"An error occurred while creating the poll: {e!s}",
-                    ephemeral=True,
+            poll_stats = await session.get(PollStats, guild.id)
+            if not poll_stats:
+                poll_stats = PollStats(guild_id=guild.id)
+                session.add(poll_stats)
+            poll_stats.poll_count += 1
+            poll_stats.total_votes += total_votes
+            poll_stats.participation_sum += participation
+            poll_stats.last_poll_at = ended_at
+
+            await session.commit()
+
+        self.logger.info(
+            "Archived poll result",
+            guild_id=guild.id,
+            message_id=poll_message.id,
+            total_votes=total_votes,
+        )
+
+    async def _count_voters(self, poll: discord.Poll, total_votes: int) -> int:
+        """Count the members who voted, which differs from votes on multi-select."""
+        if not poll.multiple:
+            return total_votes
+
+        voter_ids: set[int] = set()
+        try:
+            for answer in poll.answers:
+                async for voter in answer.voters(limit=None):
+                    voter_ids.add(voter.id)
+        except discord.HTTPException as e:
+            self.logger.warning(
+                "Failed to fetch poll voters, counting votes instead", error=str(e)
+            )
+            return total_votes
+        return len(voter_ids)
+
+    @app_commands.command(
+        name="stats",
+        description="Show statistics about the finished polls of this server.",
+    )
+    @in_guild()
+    async def poll_stats(self, interaction: discord.Interaction) -> None:
+        assert interaction.guild is not None
+
+        async with get_session() as session:
+            poll_stats = await session.get(PollStats, interaction.guild.id)
+            result = await session.scalars(
+                select(PollResult)
+                .where(PollResult.guild_id == interaction.guild.id)  # type: ignore[arg-type]
+                .order_by(PollResult.ended_at.desc())  # type: ignore[attr-defined]
+                .limit(POLL_STATS_RECENT)
+            )
+            recent_polls = result.all()
+
+        if not poll_stats or not poll_stats.poll_count:
+            await interaction.response.send_message(
+                "No finished polls have been recorded yet.", ephemeral=True
+            )
+            return
+
+        average_votes = poll_stats.total_votes / poll_stats.poll_count
+        average_participation = poll_stats.participation_sum / poll_stats.poll_count
+        recent_lines = []
+        recent_length = 0
+        for poll_result in recent_polls:
+            question = textwrap.shorten(
+                poll_result.question, POLL_STATS_QUESTION_LENGTH, placeholder="…"
+            )
+            line = f"**{question}**: {poll_result.total_votes} votes"
+            if poll_result.victor_answer:
+                victor = textwrap.shorten(
+                    poll_result.victor_answer, POLL_STATS_ANSWER_LENGTH, placeholder="…"
                 )
-                return
+                line += f", won by *{victor}*"
+            # Counts the newline that joins the lines too.
+            recent_length += len(line) + 1
+            if recent_length > EMBED_FIELD_LENGTH + 1:
+                break
+            recent_lines.append(line)
+
+        assert self.bot.user is not None, "Bot user is not initialized"
+        embed = (
+            discord.Embed(
+                title="Poll Statistics",
+                color=discord.Color.blue(),
+                timestamp=discord.utils.utcnow(),
+            )
+            .set_footer(
+                text="ProgAndBot Polls",
+                icon_url=self.bot.user.display_avatar.url,
+            )
+            .add_field(name="Polls", value=poll_stats.poll_count, inline=True)
+            .add_field(name="Total Votes", value=poll_stats.total_votes, inline=True)
+            .add_field(name="Average Votes", value=f"{average_votes:.1f}", inline=True)
+            .add_field(
+                name="Average Participation",
+                value=f"{average_participation:.1%}",
+                inline=True,
+            )
+            .add_field(name="Recent Polls", value="\n".join(recent_lines), inline=False)
+        )
+
+        await interaction.response.send_message(embed=embed)
 
 
 async def setup(bot: ProgAndBot) -> None:
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import io
+
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from discord import app_commands
+from discord.ext import commands
+
+from progandbot.core.checks import in_guild
+from progandbot.core.config import settings
+from progandbot.core.guild_configs import get_guild_config
+from progandbot.core.rendering import AvatarLayer
+from progandbot.core.rendering import CardTemplate
+from progandbot.core.rendering import ProgressBarLayer
+from progandbot.core.rendering import TextLayer
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+    from progandbot.core.rendering import CardData
+
+
+logger = structlog.get_logger(__name__)
+
+RANK_TEMPLATE = CardTemplate(
+    name="rank",
+    version=1,
+    size=(728, 220),
+    layers=(
+        AvatarLayer(position=(35, 35), size=(150, 150)),
+        TextLayer(position=(215, 40), text="{name}", font_size=36),
+        TextLayer(position=(215, 95), text="Level {level}", font_size=28),
+        TextLayer(position=(560, 95), text="{percent}%", font_size=28),
+        ProgressBarLayer(box=(215, 145, 690, 175)),
+    ),
+)
+
+
+def xp_for_level(level: int) -> int:
+    return 100 * level * level
+
+
+def level_progress(xp: int, level: int) -> float:
+    current = xp_for_level(level)
+    required = xp_for_level(level + 1) - current
+    return min(max((xp - current) / required, 0.0), 1.0)
+
+
+class Rank(commands.Cog):
+    def __init__(self, bot: ProgAndBot) -> None:
+        self.bot = bot
+        self.logger = logger.bind(cog_name=self.__class__.__name__)
+
+        self.logger.info(f"Initialized {self.__class__.__name__} cog")
+
+    @app_commands.command(
+        name="rank",
+        description="Show a rank card with the XP progress of a member.",
+    )
+    @app_commands.describe(
+        target_user="User to show the card for. Defaults to the user who invoked the command.",
+    )
+    @in_guild()
+    async def rank(
+        self,
+        interaction: discord.Interaction,
+        target_user: discord.Member | discord.User | None = None,
+    ) -> None:
+        assert interaction.guild is not None
+
+        if target_user is None:
+            target_user = interaction.user
+
+        async with get_session(read_only=True) as session:
+            user_profile = await session.get(
+                UserProfile, (interaction.guild.id, target_user.id)
+            )
+        guild_config = await get_guild_config(self.bot.cache, interaction.guild.id)
+        if not user_profile:
+            await interaction.response.send_message(
+                f"No profile found for {target_user.mention}.", ephemeral=True
+            )
+            return
+
+        image_format = (
+            guild_config.image_format if guild_config else None
+        ) or settings.IMAGE_FORMAT
+        percent = round(level_progress(user_profile.xp, user_profile.level) * 100)
+        avatar = target_user.display_avatar
+
+        async def load_data() -> CardData:
+            return {
+                "avatar": await avatar.read(),
+                "name": target_user.display_name,
+                "level": user_profile.level,
+                "percent": percent,
+                "progress": percent / 100,
+            }
+
+        await interaction.response.defer(thinking=True)
+        rendered = await self.bot.card_renderer.render(
+            RANK_TEMPLATE,
+            (
+                target_user.id,
+                avatar.key,
+                (user_profile.level, percent),
+                target_user.display_name,
+            ),
+            load_data,
+            image_format=image_format,
+            quality=settings.IMAGE_QUALITY,
+        )
+        await interaction.followup.send(
+            file=discord.File(
+                io.BytesIO(rendered), filename=f"rank.{image_format.extension}"
+            )
+        )
+
+
+async def setup(bot: ProgAndBot) -> None:
+    await bot.add_cog(Rank(bot))
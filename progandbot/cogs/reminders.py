@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from discord import app_commands
+from discord.ext import commands
+
+from progandbot.core.checks import in_guild
+from progandbot.core.enums import TimerKind
+from progandbot.core.timers import TimerDispatcher
+from progandbot.db.models.timer import MAX_REMINDER_LENGTH
+from progandbot.db.models.timer import Timer
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+
+
+logger = structlog.get_logger(__name__)
+
+MAX_REMINDER_MINUTES = 60 * 24 * 365
+MAX_TEMP_ROLE_HOURS = 24 * 90
+
+
+class Reminders(commands.Cog):
+    def __init__(self, bot: ProgAndBot) -> None:
+        self.bot = bot
+        self.logger = logger.bind(cog_name=self.__class__.__name__)
+
+        self.dispatcher = TimerDispatcher("timers", self._run_timers)
+
+        self.logger.info(f"Initialized {self.__class__.__name__} cog")
+
+    async def cog_load(self) -> None:
+        self.dispatcher.start()
+
+    async def cog_unload(self) -> None:
+        self.dispatcher.stop()
+
+    async def _add_timer(self, timer: Timer) -> None:
+        async with get_session() as session:
+            session.add(timer)
+            await session.commit()
+        self.dispatcher.notify(timer.due_at)
+
+    @app_commands.command(
+        name="remind",
+        description="Get reminded about something after some minutes.",
+    )
+    @app_commands.describe(
+        in_minutes="Minutes from now when you will be reminded.",
+        message="What you want to be reminded about.",
+    )
+    @in_guild()
+    async def remind(
+        self,
+        interaction: discord.Interaction,
+        in_minutes: app_commands.Range[int, 1, MAX_REMINDER_MINUTES],
+        message: app_commands.Range[str, 1, MAX_REMINDER_LENGTH],
+    ) -> None:
+        assert interaction.guild is not None
+        assert interaction.channel is not None
+
+        now = discord.utils.utcnow()
+        due_at = now + timedelta(minutes=in_minutes)
+        await self._add_timer(
+            Timer(
+                kind=TimerKind.REMINDER,
+                guild_id=interaction.guild.id,
+                channel_id=interaction.channel.id,
+                user_id=interaction.user.id,
+                message=message,
+                created_at=now,
+                due_at=due_at,
+            )
+        )
+
+        self.logger.info(
+            "Reminder created",
+            guild_id=interaction.guild.id,
+            user_id=interaction.user.id,
+            due_at=due_at.isoformat(),
+        )
+        await interaction.response.send_message(
+            f"I will remind you {discord.utils.format_dt(due_at, 'R')}.",
+            ephemeral=True,
+        )
+
+    @app_commands.command(
+        name="temprole",
+        description="Give a role to a member and remove it automatically later.",
+    )
+    @app_commands.describe(
+        member="The member to give the role to.",
+        role="The role to give.",
+        duration_hours="Hours until the role is removed again.",
+    )
+    @app_commands.default_permissions(manage_roles=True)
+    @in_guild()
+    async def temp_role(
+        self,
+        interaction: discord.Interaction,
+        member: discord.Member,
+        role: discord.Role,
+        duration_hours: app_commands.Range[int, 1, MAX_TEMP_ROLE_HOURS],
+    ) -> None:
+        assert interaction.guild is not None
+
+        if role.is_default() or role.managed or role >= interaction.guild.me.top_role:
+            await interaction.response.send_message(
+                f"I cannot assign the role {role.mention}.", ephemeral=True
+            )
+            return
+
+        # The same hierarchy check Discord applies when assigning roles by hand,
+        # so the bot cannot be used to hand out roles above the invoker's own.
+        assert isinstance(interaction.user, discord.Member)
+        if (
+            interaction.user.id != interaction.guild.owner_id
+            and role >= interaction.user.top_role
+        ):
+            await interaction.response.send_message(
+                f"You cannot assign the role {role.mention}, it is not below"
+                " your highest role.",
+                ephemeral=True,
+            )
+            return
+
+        try:
+            await member.add_roles(
+                role, reason=f"Temporary role for {duration_hours} hours"
+            )
+        except discord.HTTPException as e:
+            self.logger.error(
+                "Failed to add temporary role",
+                guild_id=interaction.guild.id,
+                user_id=member.id,
+                role_id=role.id,
+                error=str(e),
+            )
+            await interaction.response.send_message(
+                f"An error occurred while adding the role: {e!s}", ephemeral=True
+            )
+            return
+
+        now = discord.utils.utcnow()
+        due_at = now + timedelta(hours=duration_hours)
+        await self._add_timer(
+            Timer(
+                kind=TimerKind.TEMP_ROLE,
+                guild_id=interaction.guild.id,
+                user_id=member.id,
+                role_id=role.id,
+                created_at=now,
+                due_at=due_at,
+            )
+        )
+
+        self.logger.info(
+            "Temporary role added",
+            guild_id=interaction.guild.id,
+            user_id=member.id,
+            role_id=role.id,
+            due_at=due_at.isoformat(),
+        )
+        await interaction.response.send_message(
+            f"Gave {role.mention} to {member.mention}, it will be removed"
+            f" {discord.utils.format_dt(due_at, 'R')}.",
+            ephemeral=True,
+            allowed_mentions=discord.AllowedMentions.none(),
+        )
+
+    async def _run_timers(self, timers: list[Timer]) -> list[Timer]:
+        await self.bot.wait_until_ready()
+
+        results = await asyncio.gather(
+            *(self._run_timer(timer) for timer in timers), return_exceptions=True
+        )
+        failed = []
+        for timer, result in zip(timers, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Failed to run timer",
+                    timer_id=timer.id,
+                    kind=timer.kind,
+                    guild_id=timer.guild_id,
+                    attempts=timer.attempts + 1,
+                    error=str(result),
+                )
+                failed.append(timer)
+        return failed
+
+    async def _run_timer(self, timer: Timer) -> None:
+        match timer.kind:
+            case TimerKind.REMINDER:
+                await self._send_reminder(timer)
+            case TimerKind.TEMP_ROLE:
+                await self._remove_temp_role(timer)
+
+    async def _send_reminder(self, timer: Timer) -> None:
+        content = (
+            f"<@{timer.user_id}>, {discord.utils.format_dt(timer.created_at, 'R')}"
+            f" you asked me to remind you: {timer.message}"
+        )
+        allowed_mentions = discord.AllowedMentions(
+            everyone=False, roles=False, users=[discord.Object(timer.user_id)]
+        )
+
+        channel = self.bot.get_channel(timer.channel_id) if timer.channel_id else None
+        # Delivered rather than just queued, so a failed send keeps the timer.
+        if isinstance(channel, discord.abc.Messageable):
+            await self.bot.outbox.deliver(
+                channel, content, allowed_mentions=allowed_mentions
+            )
+            return
+
+        user = self.bot.get_user(timer.user_id)
+        if user is None:
+            try:
+                user = await self.bot.fetch_user(timer.user_id)
+            except discord.NotFound:
+                return
+        await self.bot.outbox.deliver(user, content, allowed_mentions=allowed_mentions)
+
+    async def _remove_temp_role(self, timer: Timer) -> None:
+        guild = self.bot.get_guild(timer.guild_id)
+        if guild is None or timer.role_id is None:
+            return
+
+        role = guild.get_role(timer.role_id)
+        if role is None:
+            return
+
+        member = guild.get_member(timer.user_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(timer.user_id)
+            except discord.NotFound:
+                return
+
+        await member.remove_roles(role, reason="Temporary role expired")
+        self.logger.info(
+            "Temporary role removed",
+            guild_id=guild.id,
+            user_id=member.id,
+            role_id=role.id,
+        )
+
+
+async def setup(bot: ProgAndBot) -> None:
+    await bot.add_cog(Reminders(bot))
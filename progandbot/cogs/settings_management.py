@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 from typing import TYPE_CHECKING
 
 import discord
@@ -7,10 +9,18 @@ import structlog
 
 from discord import app_commands
 from discord.ext import commands
+from sqlalchemy import select
 
+from progandbot.core.checks import in_guild
+from progandbot.core.enums import ImageFormat
 from progandbot.core.enums import SupportedLanguage
+from progandbot.core.guild_configs import store_guild_config
+from progandbot.core.word_filter import unsafe_regex_reason
 from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.word_filter import MAX_FILTER_PATTERN_LENGTH
+from progandbot.db.models.word_filter import WordFilter
 from progandbot.db.session import get_session
+from progandbot.db.session import router
 
 
 if TYPE_CHECKING:
@@ -33,14 +43,11 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
         name="language", description="Set the bot language for this server."
     )
     @app_commands.describe(language="The language to set for the bot.")
+    @in_guild()
     async def set_language(
         self, interaction: discord.Interaction, language: SupportedLanguage
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
 
         if language not in SupportedLanguage:
             await interaction.response.send_message(
@@ -62,11 +69,43 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
 
             guild_config.language = language
             await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
 
         await interaction.response.send_message(
             f"Bot language set to '{language.value}'", ephemeral=True
         )
 
+    @app_commands.command(
+        name="image_format",
+        description="Set the format of the images generated by the bot.",
+    )
+    @app_commands.describe(image_format="The image format to use for this server.")
+    @in_guild()
+    async def set_image_format(
+        self, interaction: discord.Interaction, image_format: ImageFormat
+    ) -> None:
+        assert interaction.guild is not None
+
+        self.logger.info(
+            "Setting image format",
+            guild_id=interaction.guild.id,
+            image_format=image_format,
+        )
+
+        async with get_session() as session:
+            guild_config = await session.get(GuildConfig, interaction.guild.id)
+            if not guild_config:
+                guild_config = GuildConfig(guild_id=interaction.guild.id)
+                session.add(guild_config)
+
+            guild_config.image_format = image_format
+            await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
+
+        await interaction.response.send_message(
+            f"Image format set to '{image_format.value}'", ephemeral=True
+        )
+
     welcome_subgroup = app_commands.Group(
         name="welcome",
         description="Manage welcome settings for this server.",
@@ -78,14 +117,11 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
     @app_commands.describe(
         enabled="True or False to enable or disable welcome messages."
     )
+    @in_guild()
     async def set_welcome_enabled(
         self, interaction: discord.Interaction, enabled: bool
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
 
         self.logger.info(
             "Setting welcome messages enabled",
@@ -102,6 +138,7 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
 
             guild_config.welcome_enabled = enabled
             await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
 
         msg_key = "welcome.set_enabled" if enabled else "welcome.set_disabled"
         response_msg = await self.bot.translator.get_translated_str(guild_id, msg_key)
@@ -111,14 +148,11 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
         name="channel", description="Set the welcome channel for this server."
     )
     @app_commands.describe(channel="The channel to set as the welcome channel.")
+    @in_guild()
     async def set_welcome_channel(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
 
         if not isinstance(channel, discord.TextChannel):
             await interaction.response.send_message(
@@ -140,6 +174,7 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
 
             guild_config.welcome_channel_id = channel.id
             await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
 
         await interaction.response.send_message(
             f"Welcome channel set to {channel.mention}", ephemeral=True
@@ -149,14 +184,11 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
         name="message", description="Set the welcome message for this server."
     )
     @app_commands.describe(message="The message to set as the welcome message.")
+    @in_guild()
     async def set_welcome_message(
         self, interaction: discord.Interaction, message: str
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
 
         if len(message) == 0:
             await interaction.response.send_message(
@@ -183,6 +215,7 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
 
             guild_config.welcome_message = message
             await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
 
         await interaction.response.send_message(
             f"Welcome message set to '{message}'", ephemeral=True
@@ -197,14 +230,11 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
         name="channel", description="Set the polls channel for this server."
     )
     @app_commands.describe(channel="The channel to set as the polls channel.")
+    @in_guild()
     async def set_polls_channel(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
 
         if not isinstance(channel, discord.TextChannel):
             await interaction.response.send_message(
@@ -226,6 +256,7 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
 
             guild_config.polls_channel_id = channel.id
             await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
 
         await interaction.response.send_message(
             f"Polls channel set to {channel.mention}", ephemeral=True
@@ -235,14 +266,11 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
         name="message", description="Set the polls message for this server."
     )
     @app_commands.describe(message="The message to set as the polls message.")
+    @in_guild()
     async def set_polls_message(
         self, interaction: discord.Interaction, message: str
     ) -> None:
-        if interaction.guild is None:
-            await interaction.response.send_message(
-                "This command can only be used in a server.", ephemeral=True
-            )
-            return
+        assert interaction.guild is not None
 
         if len(message) == 0:
             await interaction.response.send_message(
@@ -269,11 +297,121 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
 
             guild_config.polls_message = message
             await session.commit()
+        await store_guild_config(self.bot.cache, guild_config)
 
         await interaction.response.send_message(
             f"Polls message set to '{message}'", ephemeral=True
         )
 
+    filter_subgroup = app_commands.Group(
+        name="filter",
+        description="Manage banned words for this server.",
+    )
+
+    @filter_subgroup.command(name="add", description="Add a banned word or regex.")
+    @app_commands.describe(
+        pattern="The word or regex to ban.",
+        is_regex="Whether the pattern is a regex instead of a plain word.",
+    )
+    @in_guild()
+    async def add_filter(
+        self, interaction: discord.Interaction, pattern: str, is_regex: bool = False
+    ) -> None:
+        assert interaction.guild is not None
+
+        if len(pattern) == 0 or len(pattern) > MAX_FILTER_PATTERN_LENGTH:
+            await interaction.response.send_message(
+                f"The pattern must be between 1 and {MAX_FILTER_PATTERN_LENGTH}"
+                " characters.",
+                ephemeral=True,
+            )
+            return
+        if is_regex and (reason := unsafe_regex_reason(pattern)) is not None:
+            await interaction.response.send_message(
+                f"Invalid regex pattern, {reason}.", ephemeral=True
+            )
+            return
+
+        self.logger.info(
+            "Adding word filter",
+            guild_id=interaction.guild.id,
+            pattern=pattern,
+            is_regex=is_regex,
+        )
+
+        guild_id = interaction.guild.id
+        async with get_session() as session:
+            guild_config = await session.get(GuildConfig, guild_id)
+            if not guild_config:
+                session.add(GuildConfig(guild_id=guild_id))
+
+            word_filter = await session.get(WordFilter, (guild_id, pattern))
+            if not word_filter:
+                word_filter = WordFilter(guild_id=guild_id, pattern=pattern)
+                session.add(word_filter)
+
+            word_filter.is_regex = is_regex
+            await session.commit()
+
+        await self.bot.word_filter.reload(guild_id)
+        await interaction.response.send_message(
+            f"Added `{pattern}` to the banned words.", ephemeral=True
+        )
+
+    @filter_subgroup.command(
+        name="remove", description="Remove a banned word or regex."
+    )
+    @app_commands.describe(pattern="The word or regex to remove.")
+    @in_guild()
+    async def remove_filter(
+        self, interaction: discord.Interaction, pattern: str
+    ) -> None:
+        assert interaction.guild is not None
+
+        guild_id = interaction.guild.id
+        async with get_session() as session:
+            word_filter = await session.get(WordFilter, (guild_id, pattern))
+            if not word_filter:
+                await interaction.response.send_message(
+                    f"`{pattern}` is not a banned word.", ephemeral=True
+                )
+                return
+
+            await session.delete(word_filter)
+            await session.commit()
+
+        self.logger.info("Removed word filter", guild_id=guild_id, pattern=pattern)
+
+        await self.bot.word_filter.reload(guild_id)
+        await interaction.response.send_message(
+            f"Removed `{pattern}` from the banned words.", ephemeral=True
+        )
+
+    @filter_subgroup.command(name="list", description="List the banned words.")
+    @in_guild()
+    async def list_filters(self, interaction: discord.Interaction) -> None:
+        assert interaction.guild is not None
+
+        async with get_session() as session:
+            result = await session.scalars(
+                select(WordFilter).where(
+                    WordFilter.guild_id == interaction.guild.id  # type: ignore[arg-type]
+                )
+            )
+            filters = result.all()
+
+        if not filters:
+            await interaction.response.send_message(
+                "There are no banned words.", ephemeral=True
+            )
+            return
+
+        lines = [
+            f"- `{word_filter.pattern}`{' (regex)' if word_filter.is_regex else ''}"
+            for word_filter in filters
+        ]
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
     @commands.command()
     @commands.is_owner()
     async def sync(self, ctx: commands.Context[commands.Bot]) -> None:
@@ -285,6 +423,109 @@ class SettingsManagement(commands.GroupCog, group_name="settings"):
             self.logger.error("Failed to sync application commands", error=str(e))
             await ctx.send(f"Failed to sync application commands: {e}")
 
+    @commands.command()
+    @commands.is_owner()
+    async def jobs(self, ctx: commands.Context[commands.Bot]) -> None:
+        lines = [
+            f"`{job.name}` every {job.interval:g}s: {job.metrics.runs} runs,"
+            f" {job.metrics.failures} failures, {job.metrics.overruns} overruns,"
+            f" last {job.metrics.last_duration:.3f}s,"
+            f" avg {job.metrics.average_duration:.3f}s,"
+            f" max {job.metrics.max_duration:.3f}s"
+            for job in self.bot.scheduler.jobs.values()
+        ]
+        await ctx.send("\n".join(lines) or "No jobs scheduled.")
+
+    @commands.command()
+    @commands.is_owner()
+    async def latency(self, ctx: commands.Context[commands.Bot]) -> None:
+        tracker = self.bot.response_tracker
+        lines = [
+            f"`/{command}`: {histogram.total} samples,"
+            f" p50 <= {histogram.quantile(0.5):g}s,"
+            f" p90 <= {histogram.quantile(0.9):g}s,"
+            f" {tracker.deferred[command]} deferred"
+            for command, histogram in sorted(tracker.histograms.items())
+        ]
+        await ctx.send("\n".join(lines) or "No response latencies recorded.")
+
+    @commands.command()
+    @commands.is_owner()
+    async def rejections(self, ctx: commands.Context[commands.Bot]) -> None:
+        lines = [
+            f"`/{command}` {reason}: {count}"
+            for (command, reason), count in self.bot.tree.rejections.most_common()
+        ]
+        await ctx.send("\n".join(lines) or "No rejected commands recorded.")
+
+    @commands.command()
+    @commands.is_owner()
+    async def outbox(self, ctx: commands.Context[commands.Bot]) -> None:
+        outbox = self.bot.outbox
+        metrics = outbox.metrics
+        lines = [
+            f"{outbox.depth} queued (max {metrics.max_depth}),"
+            f" {metrics.enqueued} enqueued, {metrics.sent} sent,"
+            f" {metrics.coalesced} coalesced, {metrics.throttled} throttled,"
+            f" {metrics.dropped} dropped, {metrics.failed} failed",
+            *(
+                f"- channel `{channel_id}`: {depth} queued"
+                for channel_id, depth in sorted(outbox.channel_depths().items())
+            ),
+            *(
+                f"- `{error}`: {count}"
+                for error, count in metrics.failures.most_common()
+            ),
+        ]
+        await ctx.send("\n".join(lines))
+
+    @commands.command()
+    @commands.is_owner()
+    async def replicas(self, ctx: commands.Context[commands.Bot]) -> None:
+        metrics = router.metrics
+        lines = [
+            f"{metrics.primary_sessions} primary sessions,"
+            f" {metrics.primary_reads} reads on the primary,"
+            f" {metrics.replica_reads.total()} reads on replicas",
+            *(
+                f"- `{name}`: "
+                + (
+                    "unavailable"
+                    if lag is None
+                    else "not streaming"
+                    if math.isinf(lag)
+                    else f"{lag:.1f}s behind"
+                )
+                + f", {metrics.replica_reads[name]} reads,"
+                f" {metrics.failed_checks[name]} failed checks"
+                for name, lag in router.lags().items()
+            ),
+            *(
+                f"- fallback `{reason}`: {count}"
+                for reason, count in metrics.fallbacks.most_common()
+            ),
+        ]
+        await ctx.send("\n".join(lines))
+
+    @commands.command()
+    @commands.is_owner()
+    async def cache(self, ctx: commands.Context[commands.Bot]) -> None:
+        cache = self.bot.cache
+        metrics = cache.metrics
+        tiers = [("local", metrics.local)]
+        if cache.shared:
+            tiers.append(("shared", metrics.remote))
+        lines = [
+            f"{len(cache.local)} local entries, {metrics.loads} loads,"
+            f" {metrics.coalesced} coalesced",
+            *(
+                f"- {name}: {tier.hits} hits, {tier.misses} misses"
+                f" ({tier.hit_ratio:.0%}), {tier.errors} errors"
+                for name, tier in tiers
+            ),
+        ]
+        await ctx.send("\n".join(lines))
+
 
 async def setup(bot: ProgAndBot) -> None:
     await bot.add_cog(SettingsManagement(bot))
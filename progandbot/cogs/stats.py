@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import date
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import Any
+
+import discord
+import structlog
+
+from discord import app_commands
+from discord.ext import commands
+from sqlalchemy import func
+from sqlalchemy import select
+
+from progandbot.core.checks import in_guild
+from progandbot.db.models.activity import DailyActivity
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+
+
+logger = structlog.get_logger(__name__)
+
+STATS_DAYS = 7
+STATS_TOP_USERS = 5
+STATS_CACHE_TTL = 60.0
+
+
+class Stats(commands.Cog):
+    def __init__(self, bot: ProgAndBot) -> None:
+        self.bot = bot
+        self.logger = logger.bind(cog_name=self.__class__.__name__)
+
+        self.logger.info(f"Initialized {self.__class__.__name__} cog")
+
+    @app_commands.command(
+        name="stats",
+        description="Show the server message activity for the last week.",
+    )
+    @in_guild()
+    async def stats(self, interaction: discord.Interaction) -> None:
+        assert interaction.guild is not None
+
+        guild_id = interaction.guild.id
+        today = discord.utils.utcnow().date()
+        since = today - timedelta(days=STATS_DAYS - 1)
+
+        async def load() -> dict[str, Any]:
+            async with get_session(read_only=True) as session:
+                daily_result = await session.execute(
+                    select(DailyActivity.day, func.sum(DailyActivity.message_count))
+                    .where(
+                        DailyActivity.guild_id == guild_id,  # type: ignore[arg-type]
+                        DailyActivity.day >= since,  # type: ignore[arg-type]
+                    )
+                    .group_by(DailyActivity.day)  # type: ignore[arg-type]
+                )
+                top_result = await session.execute(
+                    select(
+                        DailyActivity.user_id,
+                        func.sum(DailyActivity.message_count).label("total"),
+                    )
+                    .where(
+                        DailyActivity.guild_id == guild_id,  # type: ignore[arg-type]
+                        DailyActivity.day >= since,  # type: ignore[arg-type]
+                    )
+                    .group_by(DailyActivity.user_id)  # type: ignore[arg-type]
+                    .order_by(func.sum(DailyActivity.message_count).desc())
+                    .limit(STATS_TOP_USERS)
+                )
+                return {
+                    "daily": [
+                        [day.isoformat(), int(total)] for day, total in daily_result
+                    ],
+                    "top": [[user_id, int(total)] for user_id, total in top_result],
+                }
+
+        # The leaderboard is cached per day, so it rolls over at midnight.
+        leaderboard = await self.bot.cache.get_or_load(
+            f"stats:{guild_id}:{today.isoformat()}", load, STATS_CACHE_TTL
+        )
+        daily_totals = {
+            date.fromisoformat(day): total for day, total in leaderboard["daily"]
+        }
+        top_users = leaderboard["top"]
+
+        week_total = sum(daily_totals.values())
+        daily_lines = [
+            f"`{day.isoformat()}`: {daily_totals.get(day, 0)}"
+            for day in (today - timedelta(days=i) for i in range(STATS_DAYS))
+        ]
+        top_lines = [
+            f"{position}. <@{user_id}>: {total}"
+            for position, (user_id, total) in enumerate(top_users, start=1)
+        ]
+
+        assert self.bot.user is not None, "Bot user is not initialized"
+        embed = (
+            discord.Embed(
+                title="Server Activity",
+                description=f"Messages sent in the last {STATS_DAYS} days.",
+                color=discord.Color.blue(),
+                timestamp=discord.utils.utcnow(),
+            )
+            .set_footer(
+                text="ProgAndBot Stats",
+                icon_url=self.bot.user.display_avatar.url,
+            )
+            .add_field(name="Today", value=daily_totals.get(today, 0), inline=True)
+            .add_field(name="This Week", value=week_total, inline=True)
+            .add_field(name="Per Day", value="\n".join(daily_lines), inline=False)
+            .add_field(
+                name="Top Members",
+                value="\n".join(top_lines) or "No activity yet.",
+                inline=False,
+            )
+        )
+
+        await interaction.response.send_message(embed=embed)
+
+
+async def setup(bot: ProgAndBot) -> None:
+    await bot.add_cog(Stats(bot))
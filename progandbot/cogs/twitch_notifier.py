@@ -1,27 +1,44 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from typing import Any
 
 import discord
 import requests
 import structlog
 
 from discord.ext import commands
-from discord.ext import tasks
 
 from progandbot.core.config import settings
+from progandbot.core.embeds import EmbedFieldTemplate
+from progandbot.core.embeds import EmbedTemplate
 
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from progandbot.core.bot import ProgAndBot
 
 
 logger = structlog.get_logger(__name__)
 
+TWITCH_CHECK_SECONDS = 60
+TWITCH_CHECK_JITTER = 5
+
+TWITCH_EMBED = EmbedTemplate(
+    name="twitch_live",
+    title_key="twitch.title",
+    description_key="twitch.description",
+    color=discord.Color.purple(),
+    footer_key="twitch.footer",
+    url="https://www.twitch.tv/{channel}",
+    image_url="https://media.tenor.com/0yuiqR9nENMAAAAM/twitch-logo.gif",
+    fields=(
+        EmbedFieldTemplate("twitch.category", "{category}"),
+        EmbedFieldTemplate("twitch.channel", "https://www.twitch.tv/{channel}"),
+    ),
+)
+
 
 class TwitchNotifier(commands.Cog):
-    def __init__(self, bot: commands.Bot) -> None:
+    def __init__(self, bot: ProgAndBot) -> None:
         self.bot = bot
         self.logger = logger.bind(cog_name=self.__class__.__name__)
 
@@ -30,13 +47,18 @@ class TwitchNotifier(commands.Cog):
         self.twitch_access_token: str | None = None
         self.is_notified: bool = False
 
-        self.check_twitch_live.start()
+    async def cog_load(self) -> None:
+        self.bot.scheduler.add_job(
+            "check_twitch_live",
+            self.check_twitch_live,
+            interval=TWITCH_CHECK_SECONDS,
+            jitter=TWITCH_CHECK_JITTER,
+            wait_until_ready=True,
+        )
 
-    def cog_unload(self) -> Coroutine[Any, Any, None]:
-        self.check_twitch_live.cancel()
-        return super().cog_unload()
+    async def cog_unload(self) -> None:
+        await self.bot.scheduler.remove_job("check_twitch_live")
 
-    @tasks.loop(minutes=1)
     async def check_twitch_live(self) -> None:
         if not self.twitch_access_token:
             self._get_twitch_access_token()
@@ -92,7 +114,7 @@ class TwitchNotifier(commands.Cog):
                 title=stream_title,
                 category=stream_category,
             )
-            self._send_notification_to_channel(stream_title, stream_category)
+            await self._send_notification_to_channel(stream_title, stream_category)
 
         else:
             if self.is_notified:
@@ -122,7 +144,7 @@ class TwitchNotifier(commands.Cog):
             )
             self.twitch_access_token = None
 
-    def _send_notification_to_channel(self, title: str, category: str) -> None:
+    async def _send_notification_to_channel(self, title: str, category: str) -> None:
         channel = self.bot.get_channel(settings.NOTIFICATIONS_CHANNEL_ID)
         if channel is None or not isinstance(channel, discord.TextChannel):
             self.logger.error(
@@ -134,40 +156,27 @@ class TwitchNotifier(commands.Cog):
             self.logger.error("Bot user is not available for notification")
             return
 
-        message = f"**¡Ey!** ¡{settings.TWITCH_USERNAME} está en directo! ¿A qué esperas para ir a verlo? ||@everyone||\n"
-        embed = (
-            discord.Embed(
-                title="¡Nuevo directo en Twitch!",
-                url=f"https://www.twitch.tv/{settings.TWITCH_USERNAME}",
-                description=f"{title}\n",
-                color=discord.Color.purple(),
-                timestamp=discord.utils.utcnow(),
-            )
-            .set_thumbnail(url=self.bot.user.display_avatar.url)
-            .set_footer(
-                text="ProgAndBot Twitch Notifier",
-                icon_url=self.bot.user.display_avatar.url,
-            )
-            .add_field(name="Categoría", value=category, inline=True)
-            .add_field(
-                name="Canal de Twitch",
-                value=f"https://www.twitch.tv/{settings.TWITCH_USERNAME}",
-                inline=True,
-            )
-            .set_image(url="https://media.tenor.com/0yuiqR9nENMAAAAM/twitch-logo.gif")
+        translator = self.bot.translator
+        lang_code = await translator.get_guild_language(channel.guild.id)
+        message = translator.translate(
+            lang_code, "twitch.message", channel=settings.TWITCH_USERNAME
+        )
+        embed = self.bot.embeds.render(
+            TWITCH_EMBED,
+            lang_code,
+            thumbnail_url=self.bot.user.display_avatar.url,
+            footer_icon_url=self.bot.user.display_avatar.url,
+            channel=settings.TWITCH_USERNAME,
+            title=title,
+            category=category,
         )
 
-        self.bot.loop.create_task(channel.send(message, embed=embed))
+        self.bot.outbox.send(channel, message, embed=embed)
         self.is_notified = True
         self.logger.info(
-            "Twitch live notification sent to channel", channel_id=channel.id
+            "Twitch live notification queued for channel", channel_id=channel.id
         )
 
-    @check_twitch_live.before_loop
-    async def before_check(self) -> None:
-        await self.bot.wait_until_ready()
-        self.logger.info("Starting Twitch live check loop")
-
 
-async def setup(bot: commands.Bot) -> None:
+async def setup(bot: ProgAndBot) -> None:
     await bot.add_cog(TwitchNotifier(bot))
@@ -1,23 +1,74 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
+from typing import Any
 
 import discord
 import structlog
 
 from discord import app_commands
 from discord.ext import commands
-
+from sqlalchemy import func
+from sqlalchemy import select
+
+from progandbot.core.checks import in_text_channel
+from progandbot.core.checks import rate_limit
+from progandbot.core.responses import auto_defer
+from progandbot.core.responses import respond
+from progandbot.db.models.activity import DailyActivity
 from progandbot.db.models.user_profile import UserProfile
 from progandbot.db.session import get_session
 
 
 if TYPE_CHECKING:
+    from sqlalchemy import Row
+
     from progandbot.core.bot import ProgAndBot
 
 
 logger = structlog.get_logger(__name__)
 
+PROFILE_WEEK_DAYS = 7
+
+
+async def fetch_profile_summary(guild_id: int, user_id: int) -> Row[Any] | None:
+    ranked = (
+        select(
+            UserProfile.user_id,
+            UserProfile.xp,
+            UserProfile.level,
+            UserProfile.message_count,
+            UserProfile.warning_count,
+            func.rank()
+            .over(
+                partition_by=UserProfile.guild_id,
+                order_by=UserProfile.xp.desc(),  # type: ignore[attr-defined]
+            )
+            .label("xp_rank"),
+        )
+        .where(UserProfile.guild_id == guild_id)  # type: ignore[arg-type]
+        .subquery()
+    )
+    since = discord.utils.utcnow().date() - timedelta(days=PROFILE_WEEK_DAYS - 1)
+    week_messages = (
+        select(func.coalesce(func.sum(DailyActivity.message_count), 0))
+        .where(
+            DailyActivity.guild_id == guild_id,  # type: ignore[arg-type]
+            DailyActivity.user_id == user_id,  # type: ignore[arg-type]
+            DailyActivity.day >= since,  # type: ignore[arg-type]
+        )
+        .scalar_subquery()
+        .label("week_messages")
+    )
+
+    # Read from the primary, the result is cached until a write invalidates it.
+    async with get_session() as session:
+        result = await session.execute(
+            select(ranked, week_messages).where(ranked.c.user_id == user_id)
+        )
+        return result.first()
+
 
 class UserInfo(commands.Cog):
     def __init__(self, bot: ProgAndBot) -> None:
@@ -33,35 +84,33 @@ class UserInfo(commands.Cog):
     @app_commands.describe(
         target_user="User to get info for. Defaults to the user who invoked the command.",
     )
+    @auto_defer()
+    @rate_limit(5, 30)
+    @in_text_channel()
     async def user_info(
         self,
         interaction: discord.Interaction,
         target_user: discord.Member | discord.User | None = None,
     ) -> None:
-        if interaction.guild is None:
-            await self.bot.send_guild_only_or_error(interaction)
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            await self.bot.send_text_channel_only_error(interaction)
-            return
+        assert interaction.guild is not None
 
         if target_user is None:
             target_user = interaction.user
 
-        async with get_session() as session:
-            user_profile = await session.get(
-                UserProfile, (interaction.guild.id, target_user.id)
-            )
-            if not user_profile:
-                await interaction.response.send_message(
-                    f"No profile found for {target_user.mention}.", ephemeral=True
+        cache_key = (interaction.guild.id, target_user.id)
+        embed_data = self.bot.profile_cache.get(cache_key)
+        if embed_data is None:
+            profile = await fetch_profile_summary(interaction.guild.id, target_user.id)
+            if not profile:
+                await respond(
+                    interaction,
+                    f"No profile found for {target_user.mention}.",
+                    ephemeral=True,
                 )
                 return
 
             assert self.bot.user is not None, "Bot user is not initialized"
-            embed = (
+            embed_data = (
                 discord.Embed(
                     title="User Information",
                     description=f"Showing {target_user.mention} profile.",
@@ -81,15 +130,20 @@ class UserInfo(commands.Cog):
                 )
                 .add_field(inline=False, name="", value="")
                 .add_field(name="Username", value=target_user.name, inline=True)
+                .add_field(name="Level", value=profile.level, inline=True)
                 .add_field(
-                    name="Warnings", value=user_profile.warning_count, inline=True
+                    name="XP", value=f"{profile.xp} (#{profile.xp_rank})", inline=True
                 )
+                .add_field(name="Warnings", value=profile.warning_count, inline=True)
+                .add_field(name="Messages", value=profile.message_count, inline=True)
                 .add_field(
-                    name="Messages", value=user_profile.message_count, inline=True
+                    name="Messages (7 days)", value=profile.week_messages, inline=True
                 )
+                .to_dict()
             )
+            self.bot.profile_cache.set(cache_key, embed_data)
 
-            await interaction.response.send_message(embed=embed)
+        await respond(interaction, embed=discord.Embed.from_dict(embed_data))
 
 
 async def setup(bot: ProgAndBot) -> None:
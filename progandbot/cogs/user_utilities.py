@@ -9,6 +9,11 @@ import structlog
 from discord import app_commands
 from discord.ext import commands
 
+from progandbot.core.checks import in_text_channel
+from progandbot.core.checks import rate_limit
+from progandbot.core.embeds import EmbedTemplate
+from progandbot.core.enums import RateLimitScope
+
 
 if TYPE_CHECKING:
     from progandbot.core.bot import ProgAndBot
@@ -16,6 +21,21 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+DICE_EMBED = EmbedTemplate(
+    name="dice",
+    title_key="dice.title",
+    description_key="dice.description",
+    color=discord.Color.yellow(),
+    footer_key="dice.footer",
+)
+COINFLIP_EMBED = EmbedTemplate(
+    name="coinflip",
+    title_key="coinflip.title",
+    description_key="coinflip.description",
+    color=discord.Color.gold(),
+    footer_key="coinflip.footer",
+)
+
 
 class UserUtilities(commands.Cog):
     def __init__(self, bot: ProgAndBot) -> None:
@@ -28,40 +48,35 @@ class UserUtilities(commands.Cog):
         name="dice",
         description="Roll a dice and get a random number between 1 and 6.",
     )
+    @rate_limit(20, 10, scope=RateLimitScope.GUILD)
+    @rate_limit(3, 10)
+    @in_text_channel()
     async def dice(
         self,
         interaction: discord.Interaction,
     ) -> None:
+        assert interaction.guild is not None
+        translator = self.bot.translator
+        lang_code = await translator.get_guild_language(interaction.guild.id)
         if not self.bot.user:
             await interaction.response.send_message(
-                "Bot user is not available. Please try again later.", ephemeral=True
+                translator.translate(lang_code, "error_bot_user_unavailable"),
+                ephemeral=True,
             )
             return
 
-        if interaction.guild is None:
-            await self.bot.send_guild_only_or_error(interaction)
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            await self.bot.send_text_channel_only_error(interaction)
-            return
-
         result = randint(1, 6)
         img_path = f"assets/dice/{result}.png"
         file_name = f"dice_{result}.png"
         discord_file = discord.File(img_path, filename=file_name)
 
-        embed = discord.Embed(
-            title="Dice Roll 🎲",
-            description=f"{interaction.user.mention} rolled a dice and got: **{result}**",
-            color=discord.Color.yellow(),
-            timestamp=discord.utils.utcnow(),
-        )
-        embed.set_thumbnail(url=f"attachment://{file_name}")
-        embed.set_footer(
-            text="ProgAndBot Dice Roll",
-            icon_url=self.bot.user.display_avatar.url,
+        embed = self.bot.embeds.render(
+            DICE_EMBED,
+            lang_code,
+            thumbnail_url=f"attachment://{file_name}",
+            footer_icon_url=self.bot.user.display_avatar.url,
+            user=interaction.user.mention,
+            result=result,
         )
 
         await interaction.response.send_message(
@@ -73,43 +88,38 @@ class UserUtilities(commands.Cog):
         name="coinflip",
         description="Flip a coin and get either Heads or Tails.",
     )
+    @rate_limit(20, 10, scope=RateLimitScope.GUILD)
+    @rate_limit(3, 10)
+    @in_text_channel()
     async def coinflip(
         self,
         interaction: discord.Interaction,
     ) -> None:
+        assert interaction.guild is not None
+        translator = self.bot.translator
+        lang_code = await translator.get_guild_language(interaction.guild.id)
         if not self.bot.user:
             await interaction.response.send_message(
-                "Bot user is not available. Please try again later.", ephemeral=True
+                translator.translate(lang_code, "error_bot_user_unavailable"),
+                ephemeral=True,
             )
             return
 
-        if interaction.guild is None:
-            await self.bot.send_guild_only_or_error(interaction)
-            return
-        if interaction.channel is None or not isinstance(
-            interaction.channel, discord.TextChannel
-        ):
-            await self.bot.send_text_channel_only_error(interaction)
-            return
-
         result = randint(1, 2)
-        result_text = "Heads" if result == 1 else "Tails"
+        result_key = "heads" if result == 1 else "tails"
 
-        file_name = f"{result_text.lower()}.png"
+        file_name = f"{result_key}.png"
 
         img_path = f"assets/coin/{file_name}"
         discord_file = discord.File(img_path, filename=file_name)
 
-        embed = discord.Embed(
-            title="Coin Flip 🪙",
-            description=f"{interaction.user.mention} flipped a coin and got: **{result_text.upper()}**",
-            color=discord.Color.gold(),
-            timestamp=discord.utils.utcnow(),
-        )
-        embed.set_thumbnail(url=f"attachment://{file_name}")
-        embed.set_footer(
-            text="ProgAndBot Coin Flip",
-            icon_url=self.bot.user.display_avatar.url,
+        embed = self.bot.embeds.render(
+            COINFLIP_EMBED,
+            lang_code,
+            thumbnail_url=f"attachment://{file_name}",
+            footer_icon_url=self.bot.user.display_avatar.url,
+            user=interaction.user.mention,
+            result=translator.translate(lang_code, f"coinflip.{result_key}"),
         )
 
         await interaction.response.send_message(
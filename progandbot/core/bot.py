@@ -1,33 +1,112 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 
 import discord
 import structlog
 
 from discord.ext import commands
 
+from progandbot.core.cache import TieredCache
+from progandbot.core.cache import TTLCache
+from progandbot.core.cache import create_remote_cache
 from progandbot.core.config import settings
+from progandbot.core.embeds import EmbedRegistry
+from progandbot.core.i18n import LOCALE_RELOAD_SECONDS
 from progandbot.core.i18n import I18nManager
+from progandbot.core.outbox import MessageOutbox
+from progandbot.core.rate_limit import CommandRateLimits
+from progandbot.core.rendering import CardRenderer
+from progandbot.core.responses import ResponseTracker
+from progandbot.core.scheduler import Scheduler
+from progandbot.core.tree import ProgAndBotTree
+from progandbot.core.word_filter import WordFilterManager
+from progandbot.db.session import router
+
+
+if TYPE_CHECKING:
+    from discord import app_commands
 
 
 logger = structlog.get_logger(__name__)
 
+PROFILE_CACHE_TTL = 60.0
+RATE_LIMIT_EVICT_SECONDS = 300.0
+
 
 class ProgAndBot(commands.Bot):
     def __init__(self) -> None:
         intents = discord.Intents.default()
         intents.message_content = True
         intents.members = True
-        super().__init__(command_prefix=settings.COMMAND_PREFIX, intents=intents)
+        super().__init__(
+            command_prefix=settings.COMMAND_PREFIX,
+            intents=intents,
+            tree_cls=ProgAndBotTree,
+        )
 
-        self.translator = I18nManager()
+        self.cache = TieredCache(create_remote_cache(settings.REDIS_URL))
+        self.translator = I18nManager(cache=self.cache)
+        self.embeds = EmbedRegistry(self.translator)
+        self.word_filter = WordFilterManager()
+        self.profile_cache: TTLCache[tuple[int, int], dict[str, Any]] = TTLCache(
+            ttl=PROFILE_CACHE_TTL
+        )
+        self.card_renderer = CardRenderer()
+        self.scheduler = Scheduler(self)
+        self.response_tracker = ResponseTracker()
+        self.rate_limits = CommandRateLimits(self.cache)
+        self.outbox = MessageOutbox()
 
     async def on_ready(self) -> None:
         assert self.user is not None, "Bot user is not initialized"
         logger.info(f"Logged in as {self.user.name}!", user_id=self.user.id)
 
+    async def on_app_command_completion(
+        self,
+        interaction: discord.Interaction,
+        command: app_commands.Command[Any, ..., Any] | app_commands.ContextMenu,
+    ) -> None:
+        self.response_tracker.finish(interaction)
+
+    async def close(self) -> None:
+        await self.scheduler.stop()
+        await self.outbox.close()
+        await super().close()
+        await self.cache.close()
+        self.card_renderer.close()
+
+    async def evict_rate_limits(self) -> None:
+        evicted = self.rate_limits.evict_idle() + self.outbox.evict_idle()
+        logger.debug("Evicted idle rate limit buckets", count=evicted)
+
     async def setup_hook(self) -> None:
+        self.scheduler.add_job(
+            "evict_rate_limits",
+            self.evict_rate_limits,
+            interval=RATE_LIMIT_EVICT_SECONDS,
+            persist=False,
+        )
+        # Locale files only change under a running bot while developing, a
+        # production deploy restarts it and loads them fresh.
+        if settings.ENVIRONMENT != "production":
+            self.scheduler.add_job(
+                "reload_locales",
+                self.translator.reload_job,
+                interval=LOCALE_RELOAD_SECONDS,
+                persist=False,
+            )
+        if router.replicas:
+            await router.check_lags()
+            self.scheduler.add_job(
+                "check_replica_lag",
+                router.check_lags,
+                interval=router.check_interval,
+                persist=False,
+            )
+
         cogs_path = Path(__file__).parent.parent / "cogs"
         logger.info("Setting up bot cogs", cogs_path=str(cogs_path))
         for file in cogs_path.glob("*.py"):
@@ -41,22 +120,3 @@ class ProgAndBot(commands.Bot):
             except Exception as e:
                 logger.error(f"Failed to load cog {file.name}", error=str(e))
                 raise e
-
-    async def send_guild_only_or_error(self, interaction: discord.Interaction) -> None:
-        await interaction.response.send_message(
-            "This command can only be used in a server.", ephemeral=True
-        )
-        return
-
-    async def send_text_channel_only_error(
-        self, interaction: discord.Interaction
-    ) -> None:
-        if not interaction.guild:
-            await self.send_guild_only_or_error(interaction)
-            return
-
-        guild_id = interaction.guild.id
-        translated_msg = await self.translator.get_translated_str(
-            guild_id, "error_cmd_text_channel_only"
-        )
-        await interaction.response.send_message(translated_msg, ephemeral=True)
@@ -0,0 +1,329 @@
+"""In-process and shared caches.
+
+:class:`TTLCache` is a plain per-process cache. :class:`TieredCache` puts an
+in-process LRU in front of an optional Redis-compatible server, so that several
+bot processes share cached values while most reads never leave the process.
+Shared values are stored as JSON.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+import structlog
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+
+logger = structlog.get_logger(__name__)
+
+CACHE_MAX_SIZE = 10000
+# How long values read from the shared tier are trusted in this process.
+LOCAL_TTL = 5.0
+
+
+class TTLCache[K: Hashable, V]:
+    def __init__(self, ttl: float, max_size: int = 10000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items: dict[K, tuple[float, V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K) -> V | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._items.pop(key, None)
+        self._items[key] = (time.monotonic() + self.ttl, value)
+        if len(self._items) > self.max_size:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del self._items[next(iter(self._items))]
+
+    def invalidate(self, key: K) -> None:
+        self._items.pop(key, None)
+
+
+class LRUCache[V]:
+    """Cache with a TTL per key that drops the least recently used entry once full."""
+
+    def __init__(self, max_size: int = CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._items: OrderedDict[str, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str, now: float | None = None) -> V | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= (time.monotonic() if now is None else now):
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V, ttl: float, now: float | None = None) -> None:
+        expires_at = (time.monotonic() if now is None else now) + ttl
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def expires_in(self, key: str, now: float | None = None) -> float:
+        item = self._items.get(key)
+        if item is None:
+            return 0.0
+        return max(0.0, item[0] - (time.monotonic() if now is None else now))
+
+    def invalidate(self, key: str) -> None:
+        self._items.pop(key, None)
+
+
+class RemoteCache(Protocol):
+    async def get(self, key: str) -> str | None: ...
+
+    async def set(self, key: str, value: str, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def incr(self, key: str, ttl: float) -> tuple[int, float]: ...
+
+    async def close(self) -> None: ...
+
+
+class RedisCache:
+    """Shared tier on any server that speaks the Redis protocol."""
+
+    def __init__(self, url: str, client: Any = None) -> None:
+        if client is None:
+            import redis.asyncio as redis  # type: ignore[import-not-found]
+
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self._client = client
+
+    async def get(self, key: str) -> str | None:
+        value: str | None = await self._client.get(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._client.set(key, value, px=max(1, round(ttl * 1000)))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def incr(self, key: str, ttl: float) -> tuple[int, float]:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(key, 0, px=max(1, round(ttl * 1000)), nx=True)
+            pipe.incr(key)
+            pipe.pttl(key)
+            _, count, expires_in = await pipe.execute()
+        return int(count), max(0, expires_in) / 1000
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def has_redis() -> bool:
+    return importlib.util.find_spec("redis") is not None
+
+
+def create_remote_cache(url: str | None) -> RemoteCache | None:
+    if url is None:
+        return None
+    if not has_redis():
+        logger.warning("redis is not installed, caching in this process only")
+        return None
+    return RedisCache(url)
+
+
+@dataclass
+class CacheTierMetrics:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class CacheMetrics:
+    local: CacheTierMetrics = field(default_factory=CacheTierMetrics)
+    remote: CacheTierMetrics = field(default_factory=CacheTierMetrics)
+    loads: int = 0
+    coalesced: int = 0
+
+
+class TieredCache:
+    """In-process LRU in front of an optional shared :class:`RemoteCache`.
+
+    Every value has its own TTL. With a shared tier, local copies are kept for
+    at most ``local_ttl`` seconds, which bounds how long a process serves a
+    value that another process has replaced. :meth:`get_or_load` runs one
+    loader per key at a time in this process and hands its result to every
+    concurrent caller. Values must be JSON serializable and are shared between
+    callers, so they must not be mutated. ``None`` is never cached.
+
+    Errors from the shared tier are logged and counted, and the cache carries
+    on as if the shared tier missed, so an unreachable server slows the bot
+    down instead of breaking it.
+    """
+
+    def __init__(
+        self,
+        remote: RemoteCache | None = None,
+        *,
+        namespace: str = "progandbot",
+        max_size: int = CACHE_MAX_SIZE,
+        local_ttl: float = LOCAL_TTL,
+    ) -> None:
+        self.remote = remote
+        self.namespace = namespace
+        self.local_ttl = local_ttl
+        self.local: LRUCache[Any] = LRUCache(max_size)
+        self.metrics = CacheMetrics()
+        self._loading: dict[str, asyncio.Future[Any]] = {}
+
+    @property
+    def shared(self) -> bool:
+        return self.remote is not None
+
+    def _remote_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _remote_failed(self, operation: str, key: str, error: Exception) -> None:
+        self.metrics.remote.errors += 1
+        logger.warning(
+            "Shared cache operation failed",
+            operation=operation,
+            key=key,
+            error=str(error),
+        )
+
+    async def get(self, key: str) -> Any | None:
+        value = self.local.get(key)
+        if value is not None:
+            self.metrics.local.hits += 1
+            return value
+        self.metrics.local.misses += 1
+
+        if self.remote is None:
+            return None
+        try:
+            raw = await self.remote.get(self._remote_key(key))
+        except Exception as e:
+            self._remote_failed("get", key, e)
+            return None
+        if raw is None:
+            self.metrics.remote.misses += 1
+            return None
+
+        self.metrics.remote.hits += 1
+        value = json.loads(raw)
+        self.local.set(key, value, self.local_ttl)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if self.remote is None:
+            self.local.set(key, value, ttl)
+            return
+
+        self.local.set(key, value, min(ttl, self.local_ttl))
+        try:
+            await self.remote.set(self._remote_key(key), json.dumps(value), ttl)
+        except Exception as e:
+            self._remote_failed("set", key, e)
+
+    async def invalidate(self, key: str) -> None:
+        self.local.invalidate(key)
+        if self.remote is None:
+            return
+        try:
+            await self.remote.delete(self._remote_key(key))
+        except Exception as e:
+            self._remote_failed("delete", key, e)
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: float
+    ) -> Any | None:
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            self.metrics.coalesced += 1
+            # Shielded so a cancelled caller does not cancel the other waiters.
+            return await asyncio.shield(pending)
+
+        future = self._loading[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await loader()
+            self.metrics.loads += 1
+            if value is not None:
+                await self.set(key, value, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Marks the exception as retrieved when nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._loading[key]
+        return value
+
+    async def incr(self, key: str, ttl: float) -> tuple[int, float]:
+        """Count a hit on ``key``, returning the count and seconds until reset.
+
+        The counter starts at the first hit and expires ``ttl`` seconds later.
+        Counters live only in the shared tier when there is one, so every
+        process sees the same count.
+        """
+        if self.remote is not None:
+            try:
+                return await self.remote.incr(self._remote_key(key), ttl)
+            except Exception as e:
+                self._remote_failed("incr", key, e)
+
+        now = time.monotonic()
+        count = (self.local.get(key, now) or 0) + 1
+        expires_in = self.local.expires_in(key, now) if count > 1 else ttl
+        self.local.set(key, count, expires_in, now)
+        return count, expires_in
+
+    async def close(self) -> None:
+        if self.remote is not None:
+            await self.remote.close()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import math
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import discord
+
+from discord import app_commands
+
+from progandbot.core.enums import RateLimitScope
+from progandbot.core.rate_limit import RateLimitSpec
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Coroutine
+
+    from progandbot.core.bot import ProgAndBot
+
+
+class TranslatedCheckFailure(app_commands.CheckFailure):
+    """A check failure answered by the command tree with a translated message."""
+
+    translation_key: str
+
+    def __init__(self, **translation_kwargs: Any) -> None:
+        super().__init__(self.translation_key)
+        self.translation_kwargs = translation_kwargs
+
+
+class GuildOnlyFailure(TranslatedCheckFailure):
+    translation_key = "error_cmd_guild_only"
+
+
+class TextChannelOnlyFailure(TranslatedCheckFailure):
+    translation_key = "error_cmd_text_channel_only"
+
+
+class RateLimitedFailure(TranslatedCheckFailure):
+    translation_key = "error_cmd_rate_limited"
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(retry_after=math.ceil(retry_after))
+        self.retry_after = retry_after
+
+
+def _guild_predicate(interaction: discord.Interaction) -> bool:
+    if interaction.guild is None:
+        raise GuildOnlyFailure
+    return True
+
+
+def _text_channel_predicate(interaction: discord.Interaction) -> bool:
+    _guild_predicate(interaction)
+    if not isinstance(interaction.channel, discord.TextChannel):
+        raise TextChannelOnlyFailure
+    return True
+
+
+def in_guild[T]() -> Callable[[T], T]:
+    return app_commands.check(_guild_predicate)
+
+
+def in_text_channel[T]() -> Callable[[T], T]:
+    return app_commands.check(_text_channel_predicate)
+
+
+def rate_limit[T](
+    rate: int, per: float, *, scope: RateLimitScope = RateLimitScope.USER
+) -> Callable[[T], T]:
+    spec = RateLimitSpec(rate, per, scope)
+
+    async def shared_predicate(
+        interaction: discord.Interaction[ProgAndBot], command_name: str, key: int
+    ) -> bool:
+        rate_limits = interaction.client.rate_limits
+        retry_after = await rate_limits.hit_shared(command_name, spec, key)
+        if retry_after:
+            raise RateLimitedFailure(retry_after)
+        return True
+
+    def predicate(
+        interaction: discord.Interaction[ProgAndBot],
+    ) -> bool | Coroutine[Any, Any, bool]:
+        if scope is RateLimitScope.GUILD and interaction.guild_id is not None:
+            key = interaction.guild_id
+        else:
+            key = interaction.user.id
+        command_name = interaction.command.qualified_name if interaction.command else ""
+
+        if interaction.client.rate_limits.shared:
+            return shared_predicate(interaction, command_name, key)
+
+        retry_after = interaction.client.rate_limits.hit(command_name, spec, key)
+        if retry_after:
+            raise RateLimitedFailure(retry_after)
+        return True
+
+    return app_commands.check(predicate)
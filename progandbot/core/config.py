@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from typing import Literal
 
+from pydantic import Field
 from pydantic import PostgresDsn
 from pydantic import computed_field
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 
+from progandbot.core.enums import ImageFormat
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -26,17 +29,33 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "progandbot"
 
+    # Read replicas as "host" or "host:port", sharing the primary's credentials.
+    POSTGRES_REPLICA_HOSTS: list[str] = []
+    POSTGRES_REPLICA_MAX_LAG: float = Field(default=5.0, gt=0)
+    POSTGRES_REPLICA_CHECK_INTERVAL: float = Field(default=10.0, gt=0)
+
+    # Shared cache tier for running several bot processes, needs the redis extra.
+    REDIS_URL: str | None = None
+
     TWITCH_CLIENT_ID: str
     TWITCH_CLIENT_SECRET: str
     TWITCH_USERNAME: str
 
     NOTIFICATIONS_CHANNEL_ID: int = 1394023492344873120
 
-    def _build_postgres_uri(self, driver: Literal["asyncpg", "psycopg"]) -> PostgresDsn:
+    IMAGE_FORMAT: ImageFormat = ImageFormat.JPEG
+    IMAGE_QUALITY: int = Field(default=85, ge=1, le=100)
+
+    def _build_postgres_uri(
+        self,
+        driver: Literal["asyncpg", "psycopg"],
+        host: str | None = None,
+        port: int | None = None,
+    ) -> PostgresDsn:
         return PostgresDsn.build(
             scheme=f"postgresql+{driver}",
-            host=self.POSTGRES_HOST,
-            port=self.POSTGRES_PORT,
+            host=host or self.POSTGRES_HOST,
+            port=port or self.POSTGRES_PORT,
             path=self.POSTGRES_DB,
             username=self.POSTGRES_USER,
             password=self.POSTGRES_PASSWORD,
@@ -52,5 +71,16 @@ class Settings(BaseSettings):
     def POSTGRES_SYNC_URI(self) -> PostgresDsn:  # noqa: N802
         return self._build_postgres_uri("psycopg")
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def POSTGRES_REPLICA_URIS(self) -> list[PostgresDsn]:  # noqa: N802
+        uris = []
+        for replica in self.POSTGRES_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            uris.append(
+                self._build_postgres_uri("asyncpg", host, int(port) if port else None)
+            )
+        return uris
+
 
 settings = Settings()  # type: ignore[call-arg]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+import discord
+
+
+if TYPE_CHECKING:
+    from progandbot.core.enums import SupportedLanguage
+    from progandbot.core.i18n import I18nManager
+    from progandbot.core.i18n import LocaleBundle
+
+
+@dataclass(frozen=True)
+class EmbedFieldTemplate:
+    name_key: str
+    value: str
+    inline: bool = True
+
+
+@dataclass(frozen=True)
+class EmbedTemplate:
+    """Layout of an embed whose texts come from the locale files.
+
+    Translated texts and ``value``/``url`` strings are ``str.format`` templates
+    filled with the data passed to :meth:`EmbedRegistry.render`. Fields whose
+    value renders empty are left out.
+    """
+
+    name: str
+    title_key: str
+    description_key: str
+    color: discord.Color
+    footer_key: str | None = None
+    url: str | None = None
+    image_url: str | None = None
+    fields: tuple[EmbedFieldTemplate, ...] = ()
+
+
+@dataclass(frozen=True)
+class _CompiledEmbed:
+    base: dict[str, Any]
+    title: str
+    description: str
+    url: str | None
+    fields: tuple[tuple[str, str, bool], ...]
+
+
+class EmbedRegistry:
+    """Builds the static part of each template once per language.
+
+    Rendering copies the cached parts and only formats the dynamic texts, so
+    no builder chain runs per message. The cache is dropped whenever the
+    translator swaps in a reloaded locale bundle.
+    """
+
+    def __init__(self, translator: I18nManager) -> None:
+        self.translator = translator
+        self._bundle: LocaleBundle | None = None
+        self._compiled: dict[tuple[str, SupportedLanguage], _CompiledEmbed] = {}
+
+    def _compile(
+        self, template: EmbedTemplate, lang_code: SupportedLanguage
+    ) -> _CompiledEmbed:
+        if self._bundle is not self.translator.bundle:
+            self._bundle = self.translator.bundle
+            self._compiled.clear()
+
+        compiled = self._compiled.get((template.name, lang_code))
+        if compiled is not None:
+            return compiled
+
+        translate = self.translator.translate
+        base: dict[str, Any] = {"type": "rich", "color": template.color.value}
+        if template.footer_key is not None:
+            base["footer"] = {"text": translate(lang_code, template.footer_key)}
+        if template.image_url is not None:
+            base["image"] = {"url": template.image_url}
+
+        compiled = _CompiledEmbed(
+            base=base,
+            title=translate(lang_code, template.title_key),
+            description=translate(lang_code, template.description_key),
+            url=template.url,
+            fields=tuple(
+                (translate(lang_code, field.name_key), field.value, field.inline)
+                for field in template.fields
+            ),
+        )
+        self._compiled[template.name, lang_code] = compiled
+        return compiled
+
+    def render(
+        self,
+        template: EmbedTemplate,
+        lang_code: SupportedLanguage,
+        *,
+        thumbnail_url: str | None = None,
+        footer_icon_url: str | None = None,
+        **data: Any,
+    ) -> discord.Embed:
+        compiled = self._compile(template, lang_code)
+
+        embed_data = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in compiled.base.items()
+        }
+        embed_data["title"] = compiled.title.format(**data)
+        embed_data["description"] = compiled.description.format(**data)
+        embed_data["timestamp"] = discord.utils.utcnow().isoformat()
+        if compiled.url is not None:
+            embed_data["url"] = compiled.url.format(**data)
+        if thumbnail_url is not None:
+            embed_data["thumbnail"] = {"url": thumbnail_url}
+        if footer_icon_url is not None and "footer" in embed_data:
+            embed_data["footer"]["icon_url"] = footer_icon_url
+
+        fields = []
+        for name, value, inline in compiled.fields:
+            rendered = value.format(**data)
+            if rendered:
+                fields.append({"name": name, "value": rendered, "inline": inline})
+        embed_data["fields"] = fields
+
+        return discord.Embed.from_dict(embed_data)
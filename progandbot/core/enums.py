@@ -6,3 +6,34 @@ from enum import Enum
 class SupportedLanguage(str, Enum):
     EN = "en"
     ES = "es"
+
+
+class ImageFormat(str, Enum):
+    PNG = "png"
+    PNG_QUANTIZED = "png_quantized"
+    WEBP = "webp"
+    JPEG = "jpeg"
+
+    @property
+    def extension(self) -> str:
+        return "png" if self is ImageFormat.PNG_QUANTIZED else self.value
+
+
+class TimerKind(str, Enum):
+    REMINDER = "reminder"
+    TEMP_ROLE = "temp_role"
+
+
+class RateLimitScope(str, Enum):
+    USER = "user"
+    GUILD = "guild"
+
+
+class ExportFormat(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    CSV = "csv"
+
+    @property
+    def needs_pyarrow(self) -> bool:
+        return self is not ExportFormat.CSV
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from progandbot.core.cache import TieredCache
+    from progandbot.core.enums import SupportedLanguage
+
+
+GUILD_CONFIG_TTL = 300.0
+
+# Language of every guild whose config this process loaded or stored. Kept past
+# the cache TTLs, so code that must not await, like error replies, still finds
+# it. A change made by another process shows up on the next load here.
+_guild_languages: dict[int, SupportedLanguage] = {}
+
+
+def guild_config_key(guild_id: int) -> str:
+    return f"guild_config:{guild_id}"
+
+
+async def get_guild_config(cache: TieredCache, guild_id: int) -> GuildConfig | None:
+    """Return a detached copy of the guild config, for reading only.
+
+    Loaded from the primary, since a replica could hand back the config from
+    before a change and keep it cached for the whole TTL.
+    """
+
+    async def load() -> dict[str, Any] | None:
+        async with get_session() as session:
+            guild_config = await session.get(GuildConfig, guild_id)
+            if guild_config is None:
+                return None
+            return guild_config.model_dump(mode="json")
+
+    data = await cache.get_or_load(guild_config_key(guild_id), load, GUILD_CONFIG_TTL)
+    if data is None:
+        _guild_languages.pop(guild_id, None)
+        return None
+    guild_config = GuildConfig.model_validate(data)
+    _guild_languages[guild_id] = guild_config.language
+    return guild_config
+
+
+def cached_guild_language(guild_id: int) -> SupportedLanguage | None:
+    """Return the last language seen for the guild, without any I/O."""
+    return _guild_languages.get(guild_id)
+
+
+async def store_guild_config(cache: TieredCache, guild_config: GuildConfig) -> None:
+    """Cache ``guild_config`` right after committing a change to it."""
+    assert guild_config.guild_id is not None
+    _guild_languages[guild_config.guild_id] = guild_config.language
+    await cache.set(
+        guild_config_key(guild_config.guild_id),
+        guild_config.model_dump(mode="json"),
+        GUILD_CONFIG_TTL,
+    )
@@ -2,68 +2,165 @@ from __future__ import annotations
 
 import json
 
+from dataclasses import dataclass
 from pathlib import Path
+from string import Formatter
 from typing import TYPE_CHECKING
 from typing import Any
 
 import structlog
 
+from progandbot.core.cache import TieredCache
 from progandbot.core.enums import SupportedLanguage
-from progandbot.db.models.guild_config import GuildConfig
-from progandbot.db.session import get_session
+from progandbot.core.guild_configs import cached_guild_language
+from progandbot.core.guild_configs import get_guild_config
 
 
 if TYPE_CHECKING:
-    TranslationDict = dict[str, str | "TranslationDict"]
+    import discord
 
 
 logger = structlog.get_logger(__name__)
 
+LOCALES_DIR = Path(__file__).resolve().parent.parent / "locales"
+LOCALE_RELOAD_SECONDS = 5.0
+
+
+class LocaleValidationError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class LocaleBundle:
+    tables: dict[str, dict[str, str]]
+    mtimes: dict[str, float]
+
+
+def _flatten(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _placeholders(text: str) -> set[str]:
+    return {name for _, name, _, _ in Formatter().parse(text) if name is not None}
+
+
+def compile_locales(locales_dir: Path = LOCALES_DIR) -> LocaleBundle:
+    """Load every locale file into a flat table and validate them together.
+
+    Raises :class:`LocaleValidationError` when a supported language has no file,
+    a value is not a string or has a malformed placeholder, a key is missing in
+    some language, or the ``{placeholder}`` names of a key differ between
+    languages.
+    """
+    tables: dict[str, dict[str, str]] = {}
+    mtimes: dict[str, float] = {}
+    errors: list[str] = []
+
+    for file in sorted(locales_dir.glob("*.json")):
+        mtimes[file.name] = file.stat().st_mtime
+        try:
+            flat = _flatten(json.loads(file.read_text(encoding="utf-8")))
+        except json.JSONDecodeError as e:
+            errors.append(f"{file.name}: invalid JSON ({e})")
+            continue
+
+        for key, value in flat.items():
+            if not isinstance(value, str):
+                errors.append(f"{file.stem}: '{key}' is not a string")
+        tables[file.stem] = {k: v for k, v in flat.items() if isinstance(v, str)}
+
+    for language in SupportedLanguage:
+        if language.value not in tables:
+            errors.append(f"{language.value}: locale file not found")
+
+    all_keys = set().union(*tables.values())
+    for key in sorted(all_keys):
+        placeholders: dict[str, set[str]] = {}
+        for lang_code, table in tables.items():
+            if key not in table:
+                errors.append(f"{lang_code}: missing key '{key}'")
+                continue
+            try:
+                placeholders[lang_code] = _placeholders(table[key])
+            except ValueError as e:
+                errors.append(f"{lang_code}: malformed placeholder in '{key}' ({e})")
+
+        if len({frozenset(names) for names in placeholders.values()}) > 1:
+            errors.append(f"'{key}': placeholders differ {placeholders}")
+
+    if errors:
+        raise LocaleValidationError("; ".join(errors))
+    return LocaleBundle(tables=tables, mtimes=mtimes)
+
 
 class I18nManager:
-    def __init__(self, locales_dir: str = "progandbot/locales") -> None:
+    def __init__(
+        self, locales_dir: Path = LOCALES_DIR, cache: TieredCache | None = None
+    ) -> None:
         self.locales_dir = locales_dir
-        self.locales: TranslationDict = {}
-        self.load_locales()
+        self.cache = cache or TieredCache()
+        self.bundle = compile_locales(locales_dir)
+        self._checked_mtimes = self.bundle.mtimes
+        logger.info("Loaded locales", languages=sorted(self.bundle.tables))
 
-    def load_locales(self) -> None:
-        for file in Path(self.locales_dir).glob("*.json"):
-            if not file.is_file():
-                continue
+    def reload_if_changed(self) -> bool:
+        mtimes = {
+            file.name: file.stat().st_mtime
+            for file in sorted(self.locales_dir.glob("*.json"))
+        }
+        if mtimes == self._checked_mtimes:
+            return False
+        self._checked_mtimes = mtimes
 
-            with open(file, encoding="utf-8") as f:
-                try:
-                    locale_data = json.load(f)
-                    self.locales[file.stem] = locale_data
-                    logger.info("Loaded locale file!", locale=file.stem)
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        "Failed to load locale file!", file=file.stem, error=str(e)
-                    )
+        try:
+            bundle = compile_locales(self.locales_dir)
+        except (LocaleValidationError, OSError) as e:
+            logger.error("Failed to reload locales, keeping the old ones", error=str(e))
+            return False
+
+        # Swapping the attribute replaces the whole table at once, so readers
+        # never see a half loaded bundle.
+        self.bundle = bundle
+        logger.info("Reloaded locales", languages=sorted(bundle.tables))
+        return True
+
+    async def reload_job(self) -> None:
+        self.reload_if_changed()
+
+    async def get_guild_language(self, guild_id: int) -> SupportedLanguage:
+        guild_config = await get_guild_config(self.cache, guild_id)
+        if guild_config and guild_config.language in SupportedLanguage:
+            return guild_config.language
+        return SupportedLanguage.EN
+
+    def get_cached_language(
+        self, interaction: discord.Interaction
+    ) -> SupportedLanguage:
+        if interaction.guild_id is not None:
+            language = cached_guild_language(interaction.guild_id)
+            if language is not None:
+                return language
+
+        try:
+            return SupportedLanguage(interaction.locale.value.split("-")[0])
+        except ValueError:
+            return SupportedLanguage.EN
 
     async def get_translated_str(self, guild_id: int, key: str, **kwargs: Any) -> str:
-        lang_code = SupportedLanguage.EN
-        async with get_session() as session:
-            guild_config = await session.get(GuildConfig, guild_id)
-            if guild_config and guild_config.language in SupportedLanguage:
-                lang_code = guild_config.language
+        lang_code = await self.get_guild_language(guild_id)
+        return self.translate(lang_code, key, **kwargs)
 
-        keys = key.split(".")
+    def translate(self, lang_code: SupportedLanguage, key: str, **kwargs: Any) -> str:
         try:
-            value = self.locales[lang_code]
-            for k in keys:
-                assert isinstance(value, dict)
-                value = value[k]
-            if not isinstance(value, str):
-                logger.warning(
-                    "Translation value is not a string",
-                    lang_code=lang_code,
-                    key=key,
-                    value=value,
-                )
-                return key
+            value = self.bundle.tables[lang_code][key]
             return value.format(**kwargs) if kwargs else value
-        except (KeyError, TypeError) as e:
+        except (KeyError, IndexError) as e:
             logger.warning(
                 "Translation key not found or invalid format",
                 lang_code=lang_code,
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from collections import Counter
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+import structlog
+
+from progandbot.core.rate_limit import TokenBucket
+
+
+if TYPE_CHECKING:
+    import discord
+
+
+logger = structlog.get_logger(__name__)
+
+# Discord allows 5 messages per 5 seconds in a channel.
+CHANNEL_RATE = 5
+CHANNEL_PER = 5.0
+COALESCE_DELAY = 2.0
+MAX_CHANNEL_QUEUE = 100
+MAX_CONTENT_LENGTH = 2000
+MAX_ATTACHMENTS = 10
+# How long closing the outbox waits for queued messages to go out.
+CLOSE_TIMEOUT = 10.0
+
+
+class MessageNotSentError(RuntimeError):
+    """Raised by :meth:`MessageOutbox.deliver` when a message was not sent."""
+
+
+@dataclass
+class OutboundMessage:
+    content: str | None = None
+    files: list[discord.File] = field(default_factory=list)
+    embeds: list[discord.Embed] = field(default_factory=list)
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    coalesce_key: str | None = None
+    queued_at: float = field(default_factory=time.monotonic)
+    # Resolved once the message is sent, or failed when it is not.
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+
+    def resolve(self, error: Exception | None = None) -> None:
+        for waiter in self.waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
+
+    def merge(self, other: OutboundMessage) -> bool:
+        """Append ``other`` to this message if both fit in a single send."""
+        if self.coalesce_key is None or other.coalesce_key != self.coalesce_key:
+            return False
+        if self.kwargs != other.kwargs:
+            return False
+
+        content = "\n".join(
+            part for part in (self.content, other.content) if part is not None
+        )
+        if (
+            len(content) > MAX_CONTENT_LENGTH
+            or len(self.files) + len(other.files) > MAX_ATTACHMENTS
+            or len(self.embeds) + len(other.embeds) > MAX_ATTACHMENTS
+        ):
+            return False
+
+        self.content = content or None
+        self.files.extend(other.files)
+        self.embeds.extend(other.embeds)
+        self.waiters.extend(other.waiters)
+        return True
+
+
+@dataclass
+class OutboxMetrics:
+    enqueued: int = 0
+    sent: int = 0
+    coalesced: int = 0
+    failed: int = 0
+    dropped: int = 0
+    throttled: int = 0
+    max_depth: int = 0
+    failures: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class _ChannelQueue:
+    channel: discord.abc.Messageable
+    bucket: TokenBucket
+    pending: deque[OutboundMessage] = field(default_factory=deque)
+    worker: asyncio.Task[None] | None = None
+
+
+class MessageOutbox:
+    """Sends messages that no interaction is waiting on, one queue per channel.
+
+    Each channel gets a worker task while it has pending messages, and its
+    state is kept until :meth:`evict_idle` finds it drained. The worker
+    waits on a token bucket sized to Discord's per-channel limit before every
+    send, so bursts are spread out instead of running into 429s. Messages that
+    share a ``coalesce_key`` are merged into the previous queued message when
+    they fit, and the worker holds such messages for ``coalesce_delay`` seconds
+    so that a burst, like a wave of joins, ends up as one message. Failures are
+    logged and counted instead of being lost in untracked tasks. Callers that
+    must know whether a message went out use :meth:`deliver` instead of
+    :meth:`send`.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: int = CHANNEL_RATE,
+        per: float = CHANNEL_PER,
+        coalesce_delay: float = COALESCE_DELAY,
+        max_queue: int = MAX_CHANNEL_QUEUE,
+    ) -> None:
+        self.rate = rate
+        self.per = per
+        self.coalesce_delay = coalesce_delay
+        self.max_queue = max_queue
+        self.metrics = OutboxMetrics()
+        self._queues: dict[int, _ChannelQueue] = {}
+
+    @property
+    def depth(self) -> int:
+        return sum(len(queue.pending) for queue in self._queues.values())
+
+    def channel_depths(self) -> dict[int, int]:
+        return {
+            channel_id: len(queue.pending)
+            for channel_id, queue in self._queues.items()
+            if queue.pending
+        }
+
+    def send(
+        self,
+        channel: discord.abc.Messageable,
+        content: str | None = None,
+        *,
+        file: discord.File | None = None,
+        embed: discord.Embed | None = None,
+        coalesce_key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._enqueue(
+            channel,
+            OutboundMessage(
+                content=content,
+                files=[file] if file is not None else [],
+                embeds=[embed] if embed is not None else [],
+                kwargs=kwargs,
+                coalesce_key=coalesce_key,
+            ),
+        )
+
+    async def deliver(
+        self,
+        channel: discord.abc.Messageable,
+        content: str | None = None,
+        *,
+        file: discord.File | None = None,
+        embed: discord.Embed | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Queue a message like :meth:`send` and wait until it is sent.
+
+        Raises :class:`MessageNotSentError` when the message is dropped or its
+        send fails.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._enqueue(
+            channel,
+            OutboundMessage(
+                content=content,
+                files=[file] if file is not None else [],
+                embeds=[embed] if embed is not None else [],
+                kwargs=kwargs,
+                waiters=[waiter],
+            ),
+        )
+        await waiter
+
+    def _enqueue(
+        self, channel: discord.abc.Messageable, message: OutboundMessage
+    ) -> None:
+        channel_id: int = channel.id  # type: ignore[attr-defined]
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = _ChannelQueue(
+                channel, TokenBucket(float(self.rate), self.rate / self.per)
+            )
+
+        self.metrics.enqueued += 1
+        if queue.pending and queue.pending[-1].merge(message):
+            self.metrics.coalesced += 1
+        elif len(queue.pending) >= self.max_queue:
+            self.metrics.dropped += 1
+            logger.warning(
+                "Dropping outbound message, channel queue is full",
+                channel_id=channel_id,
+                depth=len(queue.pending),
+            )
+            message.resolve(MessageNotSentError("Channel queue is full"))
+            return
+        else:
+            queue.pending.append(message)
+        self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(
+                self._drain(channel_id, queue), name=f"outbox:{channel_id}"
+            )
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """Forget channels with nothing queued and a full bucket again."""
+        if now is None:
+            now = time.monotonic()
+
+        idle = [
+            channel_id
+            for channel_id, queue in self._queues.items()
+            if not queue.pending
+            and (queue.worker is None or queue.worker.done())
+            and queue.bucket.is_full(now)
+        ]
+        for channel_id in idle:
+            del self._queues[channel_id]
+        return len(idle)
+
+    async def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """Wait up to ``timeout`` seconds for queued messages, then drop the rest."""
+        workers = [
+            queue.worker
+            for queue in self._queues.values()
+            if queue.worker is not None and not queue.worker.done()
+        ]
+        if workers:
+            await asyncio.wait(workers, timeout=timeout)
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        dropped = 0
+        for queue in self._queues.values():
+            for message in queue.pending:
+                message.resolve(MessageNotSentError("Outbox closed"))
+            dropped += len(queue.pending)
+        if dropped:
+            self.metrics.dropped += dropped
+            logger.warning("Dropped outbound messages on close", count=dropped)
+        self._queues.clear()
+
+    async def _drain(self, channel_id: int, queue: _ChannelQueue) -> None:
+        while queue.pending:
+            head = queue.pending[0]
+            if head.coalesce_key is not None:
+                held = head.queued_at + self.coalesce_delay - time.monotonic()
+                if held > 0:
+                    await asyncio.sleep(held)
+
+            while not queue.bucket.consume():
+                self.metrics.throttled += 1
+                await asyncio.sleep(queue.bucket.retry_after())
+
+            message = queue.pending.popleft()
+            try:
+                await self._deliver(channel_id, queue.channel, message)
+            except asyncio.CancelledError:
+                self.metrics.dropped += 1
+                message.resolve(MessageNotSentError("Outbox closed"))
+                raise
+
+    async def _deliver(
+        self,
+        channel_id: int,
+        channel: discord.abc.Messageable,
+        message: OutboundMessage,
+    ) -> None:
+        try:
+            await channel.send(
+                message.content,
+                files=message.files or None,
+                embeds=message.embeds or None,
+                **message.kwargs,
+            )
+        except Exception as e:
+            self.metrics.failed += 1
+            self.metrics.failures[type(e).__name__] += 1
+            logger.error(
+                "Failed to send outbound message",
+                channel_id=channel_id,
+                coalesce_key=message.coalesce_key,
+                error=str(e),
+            )
+            message.resolve(MessageNotSentError(str(e)))
+            return
+
+        self.metrics.sent += 1
+        message.resolve()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from progandbot.core.enums import RateLimitScope
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+    from progandbot.core.cache import TieredCache
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def consume(self, cost: float = 1.0, now: float | None = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+
+        elapsed = max(0.0, now - self.updated_at)
+        self.updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+
+        if self.tokens < cost:
+            return False
+        self.tokens -= cost
+        return True
+
+    def retry_after(self, cost: float = 1.0) -> float:
+        return max(0.0, (cost - self.tokens) / self.refill_rate)
+
+    def is_full(self, now: float) -> bool:
+        refilled = self.tokens + (now - self.updated_at) * self.refill_rate
+        return refilled >= self.capacity
+
+
+class BoundedStateMap[K: Hashable, V]:
+    """LRU map that drops the least recently used entry once full."""
+
+    def __init__(self, max_size: int, factory: Callable[[], V]) -> None:
+        self.max_size = max_size
+        self.factory = factory
+        self._items: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K) -> V:
+        item = self._items.get(key)
+        if item is None:
+            item = self.factory()
+            self._items[key] = item
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        else:
+            self._items.move_to_end(key)
+        return item
+
+    def pop(self, key: K) -> V | None:
+        return self._items.pop(key, None)
+
+
+@dataclass(frozen=True)
+class RateLimitSpec:
+    rate: int
+    per: float
+    scope: RateLimitScope = RateLimitScope.USER
+
+
+class KeyedRateLimiter:
+    """One token bucket per key, dropping buckets once they are full again.
+
+    A full bucket behaves exactly like a new one, so evicting it loses nothing
+    and the map only holds keys that were active during the last ``per``
+    seconds.
+    """
+
+    def __init__(self, rate: int, per: float) -> None:
+        self.capacity = float(rate)
+        self.refill_rate = rate / per
+        self.buckets: dict[Hashable, TokenBucket] = {}
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def hit(self, key: Hashable, now: float | None = None) -> float:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(self.capacity, self.refill_rate)
+        if bucket.consume(now=now):
+            return 0.0
+        return bucket.retry_after()
+
+    def evict_idle(self, now: float | None = None) -> int:
+        if now is None:
+            now = time.monotonic()
+
+        idle = [key for key, bucket in self.buckets.items() if bucket.is_full(now)]
+        for key in idle:
+            del self.buckets[key]
+        return len(idle)
+
+
+class CommandRateLimits:
+    """Per command rate limits, kept in the shared cache when there is one.
+
+    Locally every key gets a token bucket. Buckets cannot be updated
+    atomically in the shared cache, so there each key gets a counter that
+    allows ``rate`` hits in the ``per`` seconds after the first one instead.
+    """
+
+    def __init__(self, cache: TieredCache | None = None) -> None:
+        self.cache = cache
+        self.limiters: dict[tuple[str, RateLimitSpec], KeyedRateLimiter] = {}
+
+    @property
+    def shared(self) -> bool:
+        return self.cache is not None and self.cache.shared
+
+    def hit(self, command: str, spec: RateLimitSpec, key: Hashable) -> float:
+        limiter = self.limiters.get((command, spec))
+        if limiter is None:
+            limiter = self.limiters[command, spec] = KeyedRateLimiter(
+                spec.rate, spec.per
+            )
+        return limiter.hit(key)
+
+    async def hit_shared(
+        self, command: str, spec: RateLimitSpec, key: Hashable
+    ) -> float:
+        assert self.cache is not None
+        count, expires_in = await self.cache.incr(
+            f"rate_limit:{command}:{spec.rate}/{spec.per:g}:{spec.scope.value}:{key}",
+            spec.per,
+        )
+        return 0.0 if count <= spec.rate else expires_in
+
+    def evict_idle(self) -> int:
+        now = time.monotonic()
+        return sum(limiter.evict_idle(now) for limiter in self.limiters.values())
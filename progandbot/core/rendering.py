@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import io
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+import structlog
+
+from PIL import Image
+from PIL import ImageDraw
+from PIL import ImageFont
+
+from progandbot.core.enums import ImageFormat
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+
+logger = structlog.get_logger(__name__)
+
+CardData = dict[str, Any]
+
+
+@lru_cache(maxsize=32)
+def load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    return ImageFont.load_default(size=size)
+
+
+@lru_cache(maxsize=8)
+def load_background(path: str) -> Image.Image:
+    with Image.open(path) as image:
+        return image.convert("RGB")
+
+
+@lru_cache(maxsize=8)
+def circle_mask(size: tuple[int, int]) -> Image.Image:
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, *size), fill=255)
+    return mask
+
+
+def encode_image(
+    image: Image.Image, image_format: ImageFormat, quality: int = 85
+) -> bytes:
+    buffer = io.BytesIO()
+    match image_format:
+        case ImageFormat.PNG:
+            image.save(buffer, format="PNG")
+        case ImageFormat.PNG_QUANTIZED:
+            image.quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(
+                buffer, format="PNG", optimize=True
+            )
+        case ImageFormat.WEBP:
+            image.save(buffer, format="WEBP", quality=quality, method=4)
+        case ImageFormat.JPEG:
+            image.convert("RGB").save(
+                buffer, format="JPEG", quality=quality, optimize=True
+            )
+    return buffer.getvalue()
+
+
+class Layer(Protocol):
+    def draw(self, image: Image.Image, data: CardData) -> None: ...
+
+
+@dataclass(frozen=True)
+class AvatarLayer:
+    position: tuple[int, int]
+    size: tuple[int, int] = (150, 150)
+
+    def draw(self, image: Image.Image, data: CardData) -> None:
+        avatar_bytes: bytes | None = data.get("avatar")
+        if avatar_bytes is None:
+            return
+
+        with Image.open(io.BytesIO(avatar_bytes)) as avatar:
+            avatar_image = avatar.convert("RGBA").resize(self.size)
+        image.paste(avatar_image, self.position, mask=circle_mask(self.size))
+
+
+@dataclass(frozen=True)
+class TextLayer:
+    position: tuple[int, int]
+    text: str
+    font_size: int = 32
+    fill: str = "white"
+
+    def draw(self, image: Image.Image, data: CardData) -> None:
+        ImageDraw.Draw(image).text(
+            self.position,
+            self.text.format(**data),
+            fill=self.fill,
+            font=load_font(self.font_size),
+        )
+
+
+@dataclass(frozen=True)
+class ProgressBarLayer:
+    box: tuple[int, int, int, int]
+    key: str = "progress"
+    fill: str = "#5865f2"
+    background: str = "#2b2d31"
+
+    def draw(self, image: Image.Image, data: CardData) -> None:
+        progress = min(max(float(data.get(self.key, 0.0)), 0.0), 1.0)
+        left, top, right, bottom = self.box
+        radius = (bottom - top) // 2
+
+        draw = ImageDraw.Draw(image)
+        draw.rounded_rectangle(self.box, radius=radius, fill=self.background)
+        filled_right = left + round((right - left) * progress)
+        if filled_right - left > 2 * radius:
+            draw.rounded_rectangle(
+                (left, top, filled_right, bottom), radius=radius, fill=self.fill
+            )
+
+
+@dataclass(frozen=True)
+class CardTemplate:
+    name: str
+    version: int
+    layers: tuple[Layer, ...]
+    background: str | None = None
+    size: tuple[int, int] = (728, 402)
+    background_color: str = "#1e1f22"
+
+    def compose(self, data: CardData) -> Image.Image:
+        if self.background is not None:
+            image = load_background(self.background).copy()
+        else:
+            image = Image.new("RGB", self.size, self.background_color)
+
+        for layer in self.layers:
+            layer.draw(image, data)
+        return image
+
+    def render(
+        self,
+        data: CardData,
+        image_format: ImageFormat = ImageFormat.PNG,
+        quality: int = 85,
+    ) -> bytes:
+        return encode_image(self.compose(data), image_format, quality)
+
+
+class CardRenderer:
+    def __init__(self, max_workers: int = 2, cache_size: int = 256) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="card-renderer"
+        )
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Future[bytes]] = {}
+
+    async def render(
+        self,
+        template: CardTemplate,
+        cache_key: Hashable,
+        load_data: Callable[[], Awaitable[CardData]],
+        image_format: ImageFormat = ImageFormat.PNG,
+        quality: int = 85,
+    ) -> bytes:
+        key = (template.name, template.version, image_format, quality, cache_key)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        # Identical cards requested while one is rendering share that render.
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bytes] = loop.create_future()
+        self._in_flight[key] = future
+        try:
+            data = await load_data()
+            rendered = await loop.run_in_executor(
+                self.executor, partial(template.render, data, image_format, quality)
+            )
+            future.set_result(rendered)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting.
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+            if not future.done():
+                future.cancel()
+
+        self._cache[key] = rendered
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        logger.debug(
+            "Rendered card",
+            template=template.name,
+            image_format=image_format,
+            size=len(rendered),
+        )
+        return rendered
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+from bisect import bisect_left
+from collections import Counter
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+import discord
+import structlog
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_RESPONSE_BUDGET = 1.0
+DEFAULT_RESPONSE_DEADLINE = 2.0
+HISTOGRAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 2.5, 3.0, 5.0, 10.0)
+HISTOGRAM_MAX_SAMPLES = 1000
+HISTOGRAM_MIN_SAMPLES = 5
+PREDICTION_QUANTILE = 0.9
+AUTO_DEFER_ATTR = "__auto_defer_policy__"
+RESPONSE_TIMING_KEY = "response_timing"
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        if self.total >= HISTOGRAM_MAX_SAMPLES:
+            # Halve the old samples so that recent latencies dominate.
+            self.counts = [count // 2 for count in self.counts]
+            self.total = sum(self.counts)
+        self.counts[bisect_left(HISTOGRAM_BUCKETS, seconds)] += 1
+        self.total += 1
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.total
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if bucket < len(HISTOGRAM_BUCKETS):
+                    return HISTOGRAM_BUCKETS[bucket]
+                return math.inf
+        return 0.0
+
+
+@dataclass(frozen=True)
+class AutoDeferPolicy:
+    budget: float = DEFAULT_RESPONSE_BUDGET
+    deadline: float = DEFAULT_RESPONSE_DEADLINE
+    ephemeral: bool = False
+
+
+@dataclass
+class ResponseTiming:
+    command: str
+    started: float = field(default_factory=time.monotonic)
+    first_response: float | None = None
+    # Set while the public "thinking" message of a deferral awaits its reply.
+    public_placeholder: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    watchdog: asyncio.Task[None] | None = None
+
+
+def auto_defer[F: Callable[..., Any]](
+    *,
+    budget: float = DEFAULT_RESPONSE_BUDGET,
+    deadline: float = DEFAULT_RESPONSE_DEADLINE,
+    ephemeral: bool = False,
+) -> Callable[[F], F]:
+    """Let the command tree defer this command when it is likely to be slow.
+
+    The command is deferred up front when the recorded time to its first
+    response is predicted to exceed ``budget`` seconds, and otherwise as soon as
+    ``deadline`` seconds pass without a response. Decorated commands must answer
+    with :func:`respond`, which switches to a followup once deferred and keeps
+    ephemeral replies private after a public deferral.
+    """
+
+    def decorator(func: F) -> F:
+        setattr(func, AUTO_DEFER_ATTR, AutoDeferPolicy(budget, deadline, ephemeral))
+        return func
+
+    return decorator
+
+
+async def respond(
+    interaction: discord.Interaction, content: str | None = None, **kwargs: Any
+) -> None:
+    timing: ResponseTiming | None = interaction.extras.get(RESPONSE_TIMING_KEY)
+    if timing is None:
+        await _send(interaction, content, **kwargs)
+        return
+
+    if timing.first_response is None:
+        timing.first_response = time.monotonic()
+    async with timing.lock:
+        placeholder = timing.public_placeholder
+        timing.public_placeholder = False
+        if placeholder and kwargs.get("ephemeral"):
+            # The first followup would replace the public placeholder and be
+            # shown to everyone, so the placeholder goes first.
+            try:
+                await interaction.delete_original_response()
+            except discord.HTTPException as e:
+                logger.error(
+                    "Failed to delete deferral placeholder",
+                    command=timing.command,
+                    error=str(e),
+                )
+        await _send(interaction, content, **kwargs)
+
+
+async def _send(
+    interaction: discord.Interaction, content: str | None, **kwargs: Any
+) -> None:
+    if interaction.response.is_done():
+        await interaction.followup.send(content, **kwargs)
+    else:
+        await interaction.response.send_message(content, **kwargs)
+
+
+class ResponseTracker:
+    def __init__(self) -> None:
+        self.histograms: defaultdict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self.deferred: Counter[str] = Counter()
+
+    def predict(self, command: str) -> float | None:
+        histogram = self.histograms.get(command)
+        if histogram is None or histogram.total < HISTOGRAM_MIN_SAMPLES:
+            return None
+        return histogram.quantile(PREDICTION_QUANTILE)
+
+    async def start(
+        self, interaction: discord.Interaction, command: str, policy: AutoDeferPolicy
+    ) -> None:
+        timing = ResponseTiming(command)
+        interaction.extras[RESPONSE_TIMING_KEY] = timing
+
+        predicted = self.predict(command)
+        if predicted is not None and predicted > policy.budget:
+            await self._defer(interaction, timing, policy, reason="predicted")
+            return
+
+        timing.watchdog = asyncio.create_task(
+            self._defer_after_deadline(interaction, timing, policy)
+        )
+
+    def finish(self, interaction: discord.Interaction) -> None:
+        timing: ResponseTiming | None = interaction.extras.pop(
+            RESPONSE_TIMING_KEY, None
+        )
+        if timing is None:
+            return
+
+        if timing.watchdog is not None:
+            timing.watchdog.cancel()
+        responded_at = timing.first_response or time.monotonic()
+        self.histograms[timing.command].record(responded_at - timing.started)
+
+    async def _defer_after_deadline(
+        self,
+        interaction: discord.Interaction,
+        timing: ResponseTiming,
+        policy: AutoDeferPolicy,
+    ) -> None:
+        await asyncio.sleep(policy.deadline)
+        await self._defer(interaction, timing, policy, reason="deadline")
+
+    async def _defer(
+        self,
+        interaction: discord.Interaction,
+        timing: ResponseTiming,
+        policy: AutoDeferPolicy,
+        reason: str,
+    ) -> None:
+        async with timing.lock:
+            if interaction.response.is_done():
+                return
+            try:
+                await interaction.response.defer(
+                    thinking=True, ephemeral=policy.ephemeral
+                )
+            except discord.HTTPException as e:
+                logger.error(
+                    "Failed to defer interaction", command=timing.command, error=str(e)
+                )
+                return
+            timing.public_placeholder = not policy.ephemeral
+
+        self.deferred[timing.command] += 1
+        logger.info("Deferred interaction", command=timing.command, reason=reason)
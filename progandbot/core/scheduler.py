@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from progandbot.db.models.job_state import JobState
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from discord.ext import commands
+
+
+logger = structlog.get_logger(__name__)
+
+# How long removing a job waits for its runs in progress before cancelling them.
+JOB_STOP_TIMEOUT = 30.0
+
+
+@dataclass
+class JobMetrics:
+    runs: int = 0
+    failures: int = 0
+    overruns: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.runs if self.runs else 0.0
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: Callable[[], Awaitable[None]]
+    interval: float
+    jitter: float = 0.0
+    max_concurrency: int = 1
+    wait_until_ready: bool = False
+    persist: bool = True
+    metrics: JobMetrics = field(default_factory=JobMetrics)
+    running: set[asyncio.Task[None]] = field(default_factory=set)
+    loop_task: asyncio.Task[None] | None = None
+
+
+class Scheduler:
+    """Runs named periodic jobs for the whole bot.
+
+    Each job gets one loop task that sleeps for its interval plus random jitter
+    and then starts a run, unless ``max_concurrency`` runs are still going, in
+    which case the tick is counted as an overrun and skipped. Start and finish
+    times are persisted in ``job_states`` so that after a restart a job waits
+    out the rest of its interval instead of running immediately. Jobs that run
+    every few seconds and are cheap to repeat should pass ``persist=False``,
+    which skips that write after every run.
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.jobs: dict[str, ScheduledJob] = {}
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[None]],
+        *,
+        interval: float,
+        jitter: float = 0.0,
+        max_concurrency: int = 1,
+        wait_until_ready: bool = False,
+        persist: bool = True,
+    ) -> ScheduledJob:
+        if name in self.jobs:
+            raise ValueError(f"Job '{name}' is already scheduled")
+
+        job = ScheduledJob(
+            name=name,
+            func=func,
+            interval=interval,
+            jitter=jitter,
+            max_concurrency=max_concurrency,
+            wait_until_ready=wait_until_ready,
+            persist=persist,
+        )
+        job.loop_task = asyncio.create_task(self._job_loop(job), name=f"job:{name}")
+        self.jobs[name] = job
+        logger.info("Scheduled job", job=name, interval=interval, jitter=jitter)
+        return job
+
+    async def remove_job(self, name: str, *, timeout: float = JOB_STOP_TIMEOUT) -> None:
+        """Stop scheduling ``name`` and wait for its runs in progress.
+
+        Runs are only cancelled once ``timeout`` seconds have passed, since a
+        cancelled run can lose work it had already taken on.
+        """
+        job = self.jobs.pop(name, None)
+        if job is None:
+            return
+
+        if job.loop_task is not None:
+            job.loop_task.cancel()
+        await self._wait_for_runs(job, timeout)
+
+    async def stop(self, *, timeout: float = JOB_STOP_TIMEOUT) -> None:
+        jobs = list(self.jobs.values())
+        self.jobs.clear()
+        # Every loop is cancelled before awaiting anything, so none starts a run.
+        for job in jobs:
+            if job.loop_task is not None:
+                job.loop_task.cancel()
+        await asyncio.gather(*(self._wait_for_runs(job, timeout) for job in jobs))
+
+    async def _wait_for_runs(self, job: ScheduledJob, timeout: float) -> None:
+        if job.loop_task is not None:
+            await asyncio.gather(job.loop_task, return_exceptions=True)
+        if job.running:
+            _, pending = await asyncio.wait(set(job.running), timeout=timeout)
+            if pending:
+                logger.warning(
+                    "Cancelling job runs that did not finish in time",
+                    job=job.name,
+                    count=len(pending),
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        logger.info("Removed job", job=job.name)
+
+    async def _initial_delay(self, job: ScheduledJob) -> float:
+        if not job.persist:
+            return 0.0
+        try:
+            async with get_session() as session:
+                state = await session.get(JobState, job.name)
+        except Exception as e:
+            logger.error("Failed to load job state", job=job.name, error=str(e))
+            return 0.0
+
+        if state is None or state.last_started_at is None:
+            return 0.0
+        last_started_at = state.last_started_at
+        if last_started_at.tzinfo is None:
+            last_started_at = last_started_at.replace(tzinfo=UTC)
+        elapsed = (discord.utils.utcnow() - last_started_at).total_seconds()
+        return max(job.interval - elapsed, 0.0)
+
+    async def _job_loop(self, job: ScheduledJob) -> None:
+        if job.wait_until_ready:
+            await self.bot.wait_until_ready()
+
+        delay = await self._initial_delay(job)
+        while True:
+            await asyncio.sleep(delay + random.uniform(0, job.jitter))
+            delay = job.interval
+
+            if len(job.running) >= job.max_concurrency:
+                job.metrics.overruns += 1
+                logger.warning(
+                    "Skipping job run, previous runs still in progress",
+                    job=job.name,
+                    running=len(job.running),
+                )
+                continue
+
+            task = asyncio.create_task(self._run_job(job), name=f"job-run:{job.name}")
+            job.running.add(task)
+            task.add_done_callback(job.running.discard)
+
+    async def _run_job(self, job: ScheduledJob) -> None:
+        started_at = discord.utils.utcnow()
+        start = time.monotonic()
+        error: str | None = None
+        try:
+            await job.func()
+        except Exception as e:
+            error = str(e)
+            job.metrics.failures += 1
+            logger.error("Job failed", job=job.name, error=error)
+
+        duration = time.monotonic() - start
+        metrics = job.metrics
+        metrics.runs += 1
+        metrics.last_duration = duration
+        metrics.total_duration += duration
+        metrics.max_duration = max(metrics.max_duration, duration)
+        if duration > job.interval:
+            logger.warning(
+                "Job run took longer than its interval",
+                job=job.name,
+                duration=duration,
+                interval=job.interval,
+            )
+
+        if job.persist:
+            await self._persist_state(job, started_at, duration, error)
+
+    async def _persist_state(
+        self,
+        job: ScheduledJob,
+        started_at: datetime,
+        duration: float,
+        error: str | None,
+    ) -> None:
+        try:
+            async with get_session() as session:
+                state = await session.get(JobState, job.name)
+                if not state:
+                    state = JobState(name=job.name)
+                    session.add(state)
+
+                state.last_started_at = started_at
+                state.last_finished_at = discord.utils.utcnow()
+                state.last_duration = duration
+                state.last_error = error[:500] if error else None
+                await session.commit()
+        except Exception as e:
+            logger.error("Failed to persist job state", job=job.name, error=str(e))
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+
+from datetime import UTC
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from sqlalchemy import delete
+from sqlalchemy import select
+from sqlalchemy import update
+
+from progandbot.db.models.timer import Timer
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Hashable
+    from datetime import datetime
+
+
+logger = structlog.get_logger(__name__)
+
+TIMER_WINDOW = timedelta(minutes=10)
+TIMER_BATCH_SIZE = 500
+TIMER_RETRY_SECONDS = 30.0
+TIMER_MAX_ATTEMPTS = 8
+TIMER_MAX_BACKOFF = timedelta(hours=1)
+
+
+class TimerQueue[K: Hashable]:
+    """Fires ``callback(key)`` when each scheduled key becomes due.
+
+    Keys live in a min-heap ordered by due time and a single task sleeps until
+    the earliest one, so nothing polls while there is no work. Rescheduling or
+    cancelling a key leaves its old heap entry behind, which is skipped when
+    popped.
+    """
+
+    def __init__(self, name: str, callback: Callable[[K], Awaitable[None]]) -> None:
+        self.name = name
+        self.callback = callback
+        self.logger = logger.bind(timer_queue=name)
+
+        self._heap: list[tuple[datetime, int, K]] = []
+        self._due: dict[K, datetime] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def schedule(self, key: K, due_at: datetime) -> None:
+        self._due[key] = due_at
+        heapq.heappush(self._heap, (due_at, next(self._counter), key))
+        self._wakeup.set()
+
+    def cancel(self, key: K) -> None:
+        self._due.pop(key, None)
+
+    def next_due(self) -> datetime | None:
+        while self._heap:
+            due_at, _, key = self._heap[0]
+            if self._due.get(key) == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def pop_due(self, now: datetime) -> list[K]:
+        due_keys: list[K] = []
+        while (due_at := self.next_due()) is not None and due_at <= now:
+            _, _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due_keys.append(key)
+        return due_keys
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            due_at = self.next_due()
+            if due_at is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = (due_at - discord.utils.utcnow()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue
+                except TimeoutError:
+                    pass
+
+            for key in self.pop_due(discord.utils.utcnow()):
+                try:
+                    await self.callback(key)
+                except Exception as e:
+                    self.logger.error("Timer callback failed", key=key, error=str(e))
+
+
+class TimerDispatcher:
+    """Runs the rows of the ``timers`` table as they become due.
+
+    Instead of keeping every pending timer in memory, each pass fetches at most
+    ``batch_size`` timers due within ``window`` with one query on the
+    ``due_at`` index and sleeps until the earliest of them. Everything already
+    due is handed to ``handler`` as a single batch, which returns the timers it
+    failed to run. The rest are deleted in one statement, while failed timers
+    are pushed back with an exponential backoff and only dropped after
+    ``TIMER_MAX_ATTEMPTS`` attempts. ``notify`` wakes the loop up when a timer
+    is created that is due before the current sleep ends.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[list[Timer]], Awaitable[list[Timer]]],
+        *,
+        window: timedelta = TIMER_WINDOW,
+        batch_size: int = TIMER_BATCH_SIZE,
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.window = window
+        self.batch_size = batch_size
+        self.logger = logger.bind(timer_dispatcher=name)
+
+        self._wakeup = asyncio.Event()
+        self._sleeping_until: datetime | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def notify(self, due_at: datetime) -> None:
+        if self._sleeping_until is None or due_at < self._sleeping_until:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def fetch_window(self, now: datetime) -> list[Timer]:
+        async with get_session() as session:
+            result = await session.scalars(
+                select(Timer)
+                .where(Timer.due_at <= now + self.window)  # type: ignore[arg-type]
+                .order_by(Timer.due_at)  # type: ignore[arg-type]
+                .limit(self.batch_size)
+            )
+            timers = list(result.all())
+
+        for timer in timers:
+            if timer.due_at.tzinfo is None:
+                timer.due_at = timer.due_at.replace(tzinfo=UTC)
+                timer.created_at = timer.created_at.replace(tzinfo=UTC)
+        return timers
+
+    async def dispatch(self, timers: list[Timer]) -> None:
+        try:
+            failed = await self.handler(timers)
+        except Exception as e:
+            self.logger.error("Timer batch failed", count=len(timers), error=str(e))
+            failed = timers
+
+        now = discord.utils.utcnow()
+        failed_ids = {timer.id for timer in failed}
+        done_ids = [timer.id for timer in timers if timer.id not in failed_ids]
+        retries: list[Timer] = []
+        for timer in failed:
+            if timer.attempts + 1 >= TIMER_MAX_ATTEMPTS:
+                self.logger.error(
+                    "Dropping timer that keeps failing",
+                    timer_id=timer.id,
+                    kind=timer.kind,
+                    attempts=timer.attempts + 1,
+                )
+                done_ids.append(timer.id)
+            else:
+                retries.append(timer)
+
+        async with get_session() as session:
+            if done_ids:
+                await session.execute(
+                    delete(Timer).where(Timer.id.in_(done_ids))  # type: ignore[union-attr]
+                )
+            for timer in retries:
+                backoff = min(
+                    timedelta(seconds=TIMER_RETRY_SECONDS * 2**timer.attempts),
+                    TIMER_MAX_BACKOFF,
+                )
+                await session.execute(
+                    update(Timer)
+                    .where(Timer.id == timer.id)  # type: ignore[arg-type]
+                    .values(attempts=timer.attempts + 1, due_at=now + backoff)
+                )
+            await session.commit()
+        self.logger.debug("Dispatched timers", count=len(timers), retried=len(retries))
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = discord.utils.utcnow()
+            try:
+                timers = await self.fetch_window(now)
+                due = [timer for timer in timers if timer.due_at <= now]
+                if due:
+                    await self.dispatch(due)
+                    continue
+            except Exception as e:
+                self.logger.error("Failed to dispatch timers", error=str(e))
+                await asyncio.sleep(TIMER_RETRY_SECONDS)
+                continue
+
+            self._sleeping_until = timers[0].due_at if timers else now + self.window
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=(self._sleeping_until - now).total_seconds(),
+                )
+            except TimeoutError:
+                pass
+            finally:
+                self._sleeping_until = None
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import discord
+import structlog
+
+from discord import app_commands
+
+from progandbot.core.checks import TranslatedCheckFailure
+from progandbot.core.responses import AUTO_DEFER_ATTR
+from progandbot.core.responses import respond
+
+
+if TYPE_CHECKING:
+    from progandbot.core.bot import ProgAndBot
+    from progandbot.core.responses import AutoDeferPolicy
+
+
+logger = structlog.get_logger(__name__)
+
+
+class ProgAndBotTree(app_commands.CommandTree["ProgAndBot"]):
+    def __init__(self, client: ProgAndBot, *, fallback_to_global: bool = True) -> None:
+        super().__init__(client, fallback_to_global=fallback_to_global)
+        self.rejections: Counter[tuple[str, str]] = Counter()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        command = interaction.command
+        if interaction.type is discord.InteractionType.application_command and (
+            isinstance(command, app_commands.Command)
+        ):
+            policy: AutoDeferPolicy | None = getattr(
+                command.callback, AUTO_DEFER_ATTR, None
+            )
+            if policy is not None:
+                await self.client.response_tracker.start(
+                    interaction, command.qualified_name, policy
+                )
+        return True
+
+    async def on_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ) -> None:
+        self.client.response_tracker.finish(interaction)
+        if not isinstance(error, app_commands.CheckFailure):
+            await super().on_error(interaction, error)
+            return
+
+        command_name = interaction.command.qualified_name if interaction.command else ""
+        self.rejections[(command_name, type(error).__name__)] += 1
+        if not isinstance(error, TranslatedCheckFailure):
+            logger.warning(
+                "Command check failed", command=command_name, error=str(error)
+            )
+            return
+
+        # Rejections are answered from cached translations, without a DB query.
+        translator = self.client.translator
+        await respond(
+            interaction,
+            translator.translate(
+                translator.get_cached_language(interaction),
+                error.translation_key,
+                **error.translation_kwargs,
+            ),
+            ephemeral=True,
+        )
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import re
+
+from re import _constants as sre_constants
+from re import _parser as sre_parser
+from typing import TYPE_CHECKING
+
+import structlog
+
+from sqlalchemy import select
+
+from progandbot.db.models.word_filter import WordFilter
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+
+logger = structlog.get_logger(__name__)
+
+_REPEATS = (
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    sre_constants.POSSESSIVE_REPEAT,
+)
+_BACKREFERENCES = (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS)
+
+
+def unsafe_regex_reason(pattern: str) -> str | None:
+    """Return why ``pattern`` is not allowed as a filter, or None if it is.
+
+    Filters run on every message inside the event loop, so a pattern that
+    backtracks catastrophically, like ``(a+)+$``, would stall the bot for every
+    guild. Only patterns that match in polynomial time are allowed: no
+    backreferences, and nothing repeated inside a repeated group, be it another
+    quantifier or an alternation.
+    """
+    try:
+        parsed = sre_parser.parse(pattern)
+    except re.error as e:
+        return f"it does not compile: {e}"
+    return _unsafe_reason(parsed, repeated=False)
+
+
+def _unsafe_reason(items: Any, repeated: bool) -> str | None:
+    for op, av in items:
+        reason = None
+        if op in _BACKREFERENCES:
+            return "backreferences are not allowed"
+        if op in _REPEATS:
+            _, max_repeat, body = av
+            if repeated and max_repeat > 1:
+                return "quantifiers inside a repeated group are not allowed"
+            reason = _unsafe_reason(body, repeated or max_repeat > 1)
+        elif op is sre_constants.BRANCH:
+            if repeated:
+                return "alternation inside a repeated group is not allowed"
+            for branch in av[1]:
+                reason = reason or _unsafe_reason(branch, repeated)
+        elif op is sre_constants.SUBPATTERN:
+            reason = _unsafe_reason(av[3], repeated)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            reason = _unsafe_reason(av[1], repeated)
+        elif op is sre_constants.ATOMIC_GROUP:
+            reason = _unsafe_reason(av, repeated)
+        if reason is not None:
+            return reason
+    return None
+
+
+def _is_combinable(pattern: str) -> bool:
+    """Whether a regex keeps its meaning inside one ``|``-joined pattern.
+
+    Group numbers shift once patterns are joined, which breaks backreferences,
+    named groups collide, and inline global flags must come first, so only
+    patterns without groups or flags are joined.
+    """
+    try:
+        return re.compile(f"(?:{pattern})").groups == 0
+    except re.error:
+        return False
+
+
+def compile_filters(filters: Iterable[WordFilter]) -> list[re.Pattern[str]]:
+    """Compile the filters of a guild into as few patterns as possible.
+
+    Plain words and simple regexes share one pattern. Every other regex gets
+    its own. Regexes that are not allowed, including ones saved before
+    :func:`unsafe_regex_reason` existed, are logged and skipped, so one bad
+    filter never turns off the rest.
+    """
+    alternatives = []
+    patterns = []
+    for word_filter in filters:
+        if not word_filter.is_regex:
+            alternatives.append(rf"(?<!\w){re.escape(word_filter.pattern)}(?!\w)")
+            continue
+
+        reason = unsafe_regex_reason(word_filter.pattern)
+        if reason is not None:
+            logger.error(
+                "Skipping word filter that is not allowed",
+                guild_id=word_filter.guild_id,
+                pattern=word_filter.pattern,
+                reason=reason,
+            )
+        elif _is_combinable(word_filter.pattern):
+            alternatives.append(f"(?:{word_filter.pattern})")
+        else:
+            patterns.append(re.compile(word_filter.pattern, re.IGNORECASE))
+    if alternatives:
+        patterns.insert(0, re.compile("|".join(alternatives), re.IGNORECASE))
+    return patterns
+
+
+class WordFilterManager:
+    def __init__(self) -> None:
+        self.compiled: dict[int, list[re.Pattern[str]]] = {}
+
+    async def reload(self, guild_id: int) -> list[re.Pattern[str]]:
+        async with get_session() as session:
+            result = await session.scalars(
+                select(WordFilter).where(WordFilter.guild_id == guild_id)  # type: ignore[arg-type]
+            )
+            filters = result.all()
+
+        patterns = compile_filters(filters)
+        self.compiled[guild_id] = patterns
+        logger.info("Compiled word filters", guild_id=guild_id, count=len(filters))
+        return patterns
+
+    async def find_match(self, guild_id: int, content: str) -> str | None:
+        if guild_id in self.compiled:
+            patterns = self.compiled[guild_id]
+        else:
+            patterns = await self.reload(guild_id)
+
+        if not content:
+            return None
+        for pattern in patterns:
+            match = pattern.search(content)
+            if match:
+                return match.group(0)
+        return None
@@ -1,13 +1,40 @@
 from __future__ import annotations
 
+from .activity import DailyActivity  # noqa: TID252
+from .activity import MonthlyActivity  # noqa: TID252
+from .backfill_checkpoint import BackfillCheckpoint  # noqa: TID252
 from .guild_config import GuildConfig  # noqa: TID252
+from .job_state import JobState  # noqa: TID252
+from .poll_result import PollResult  # noqa: TID252
+from .poll_result import PollStats  # noqa: TID252
+from .scheduled_poll import ScheduledPoll  # noqa: TID252
+from .timer import Timer  # noqa: TID252
 from .user_profile import UserProfile  # noqa: TID252
+from .word_filter import WordFilter  # noqa: TID252
 
 
+DailyActivity.model_rebuild()
+MonthlyActivity.model_rebuild()
+BackfillCheckpoint.model_rebuild()
 GuildConfig.model_rebuild()
+JobState.model_rebuild()
+PollResult.model_rebuild()
+PollStats.model_rebuild()
+ScheduledPoll.model_rebuild()
+Timer.model_rebuild()
 UserProfile.model_rebuild()
+WordFilter.model_rebuild()
 
 __all__ = [
+    "BackfillCheckpoint",
+    "DailyActivity",
     "GuildConfig",
+    "JobState",
+    "MonthlyActivity",
+    "PollResult",
+    "PollStats",
+    "ScheduledPoll",
+    "Timer",
     "UserProfile",
+    "WordFilter",
 ]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import date  # noqa: TC003
+
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class DailyActivity(SQLModel, table=True):
+    __tablename__ = "daily_activity"
+    # Range partitioned by month on PostgreSQL, see progandbot.db.partitions.
+    __table_args__ = (
+        Index("ix_daily_activity_guild_id_day", "guild_id", "day"),
+        {"postgresql_partition_by": "RANGE (day)"},
+    )
+
+    guild_id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("guild_configs.guild_id"),
+            primary_key=True,
+            autoincrement=False,
+        ),
+    )
+    user_id: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, primary_key=True, autoincrement=False),
+    )
+    day: date = Field(sa_column=Column(Date, primary_key=True))
+
+    message_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
+
+class MonthlyActivity(SQLModel, table=True):
+    __tablename__ = "monthly_activity"
+
+    guild_id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("guild_configs.guild_id"),
+            primary_key=True,
+            autoincrement=False,
+        ),
+    )
+    user_id: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, primary_key=True, autoincrement=False),
+    )
+    month: date = Field(sa_column=Column(Date, primary_key=True))
+
+    message_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class BackfillCheckpoint(SQLModel, table=True):
+    __tablename__ = "backfill_checkpoints"
+
+    guild_id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("guild_configs.guild_id"),
+            primary_key=True,
+            autoincrement=False,
+        ),
+    )
+    channel_id: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, primary_key=True, autoincrement=False),
+    )
+
+    # Only messages older than this one are counted, newer ones were tracked live.
+    until_message_id: int = Field(sa_column=Column(BigInteger, nullable=False))
+    # Oldest message counted so far, history resumes from here.
+    cursor_message_id: int | None = Field(default=None, sa_column=Column(BigInteger))
+    messages_counted: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    completed_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
@@ -7,6 +7,7 @@ from sqlalchemy import String
 from sqlmodel import Field
 from sqlmodel import SQLModel
 
+from progandbot.core.enums import ImageFormat
 from progandbot.core.enums import SupportedLanguage
 
 
@@ -58,3 +59,11 @@ class GuildConfig(SQLModel, table=True):
             String(2000), server_default=DEFAULT_POLLS_MESSAGE, nullable=False
         ),
     )
+
+    image_format: ImageFormat | None = Field(
+        default=None,
+        sa_column=Column(
+            Enum(ImageFormat, values_callable=lambda x: [e.value for e in x]),
+            nullable=True,
+        ),
+    )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import String
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class JobState(SQLModel, table=True):
+    __tablename__ = "job_states"
+
+    name: str = Field(max_length=100, sa_column=Column(String(100), primary_key=True))
+
+    last_started_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    last_finished_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    last_duration: float | None = Field(default=None)
+    last_error: str | None = Field(
+        default=None, max_length=500, sa_column=Column(String(500), nullable=True)
+    )
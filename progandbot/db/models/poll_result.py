@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import JSON
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import String
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class PollResult(SQLModel, table=True):
+    __tablename__ = "poll_results"
+    __table_args__ = (
+        Index("ix_poll_results_guild_id_ended_at", "guild_id", "ended_at"),
+    )
+
+    message_id: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, primary_key=True, autoincrement=False),
+    )
+    guild_id: int = Field(
+        sa_column=Column(
+            BigInteger, ForeignKey("guild_configs.guild_id"), nullable=False
+        ),
+    )
+    channel_id: int = Field(sa_column=Column(BigInteger, nullable=False))
+
+    question: str = Field(max_length=300, sa_column=Column(String(300), nullable=False))
+    answers: list[dict[str, str | int]] = Field(sa_column=Column(JSON, nullable=False))
+    victor_answer: str | None = Field(
+        default=None, max_length=55, sa_column=Column(String(55), nullable=True)
+    )
+    total_votes: int = Field(default=0)
+    member_count: int = Field(default=0)
+
+    ended_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+
+class PollStats(SQLModel, table=True):
+    __tablename__ = "poll_stats"
+
+    guild_id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("guild_configs.guild_id"),
+            primary_key=True,
+            autoincrement=False,
+        ),
+    )
+
+    poll_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    total_votes: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    participation_sum: float = Field(
+        default=0.0, sa_column_kwargs={"server_default": "0"}
+    )
+    last_poll_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import JSON
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import String
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class ScheduledPoll(SQLModel, table=True):
+    __tablename__ = "scheduled_polls"
+
+    id: int | None = Field(default=None, primary_key=True)
+    guild_id: int = Field(
+        sa_column=Column(
+            BigInteger, ForeignKey("guild_configs.guild_id"), nullable=False
+        ),
+    )
+    channel_id: int = Field(sa_column=Column(BigInteger, nullable=False))
+
+    question: str = Field(max_length=300, sa_column=Column(String(300), nullable=False))
+    answers: list[str] = Field(sa_column=Column(JSON, nullable=False))
+    duration_hours: int = Field(default=24)
+    allow_multiple: bool = Field(
+        default=False, sa_column_kwargs={"server_default": "false"}
+    )
+
+    scheduled_for: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
+    posted_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003
+
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Enum
+from sqlalchemy import String
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+from progandbot.core.enums import TimerKind
+
+
+MAX_REMINDER_LENGTH = 1000
+
+
+class Timer(SQLModel, table=True):
+    __tablename__ = "timers"
+
+    id: int | None = Field(default=None, primary_key=True)
+    kind: TimerKind = Field(
+        sa_column=Column(
+            Enum(TimerKind, values_callable=lambda x: [e.value for e in x]),
+            nullable=False,
+        ),
+    )
+    guild_id: int = Field(sa_column=Column(BigInteger, nullable=False))
+    channel_id: int | None = Field(default=None, sa_column=Column(BigInteger))
+    user_id: int = Field(sa_column=Column(BigInteger, nullable=False))
+    role_id: int | None = Field(default=None, sa_column=Column(BigInteger))
+    message: str | None = Field(
+        default=None,
+        max_length=MAX_REMINDER_LENGTH,
+        sa_column=Column(String(MAX_REMINDER_LENGTH)),
+    )
+
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    due_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, index=True)
+    )
+    # Failed runs so far, each of which pushed due_at back.
+    attempts: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
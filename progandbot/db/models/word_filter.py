@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import String
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+MAX_FILTER_PATTERN_LENGTH = 200
+
+
+class WordFilter(SQLModel, table=True):
+    __tablename__ = "word_filters"
+
+    guild_id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            ForeignKey("guild_configs.guild_id"),
+            primary_key=True,
+            autoincrement=False,
+        ),
+    )
+    pattern: str = Field(
+        max_length=MAX_FILTER_PATTERN_LENGTH,
+        sa_column=Column(String(MAX_FILTER_PATTERN_LENGTH), primary_key=True),
+    )
+
+    is_regex: bool = Field(default=False, sa_column_kwargs={"server_default": "false"})
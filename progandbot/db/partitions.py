@@ -0,0 +1,164 @@
+"""Monthly range partitions for the PostgreSQL event tables.
+
+Partitioned tables are split by month on a date column, with one child table
+named ``<table>_yYYYYmMM`` per month. New partitions are created a few months
+ahead of time and whole months are dropped once they fall out of retention,
+which is far cheaper than deleting their rows. Rows outside every monthly
+partition, like imported old months or rows written while the partition job
+was not running, land in a ``<table>_default`` partition instead of failing,
+and move to their monthly partition when it is created. On other databases the
+tables are plain and these helpers do nothing.
+"""
+
+from __future__ import annotations
+
+import re
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import structlog
+
+from sqlalchemy import text
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = structlog.get_logger(__name__)
+
+PARTITION_MONTHS_AHEAD = 3
+PARTITION_NAME_PATTERN = re.compile(r"_y(\d{4})m(\d{2})$")
+# Column each partitioned table is split on.
+PARTITION_KEYS = {"daily_activity": "day"}
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_ddl(table: str, month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)}"
+        f" PARTITION OF {table}"
+        f" FOR VALUES FROM ('{month.isoformat()}')"
+        f" TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def default_partition_ddl(table: str) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {default_partition_name(table)}"
+        f" PARTITION OF {table} DEFAULT"
+    )
+
+
+def is_partitioned(session: AsyncSession) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+async def list_partitions(session: AsyncSession, table: str) -> dict[date, str]:
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class parent ON pg_inherits.inhparent = parent.oid"
+            " JOIN pg_class child ON pg_inherits.inhrelid = child.oid"
+            " WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    partitions = {}
+    for (name,) in result:
+        match = PARTITION_NAME_PATTERN.search(name)
+        if match is not None:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+async def create_partitions(
+    session: AsyncSession,
+    table: str,
+    today: date,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+) -> list[str]:
+    """Make sure the partitions from this month to ``months_ahead`` exist."""
+    if not is_partitioned(session):
+        return []
+
+    await session.execute(text(default_partition_ddl(table)))
+    existing = await list_partitions(session, table)
+    current = today.replace(day=1)
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month in existing:
+            continue
+        await _create_partition(session, table, month)
+        created.append(partition_name(table, month))
+    await session.commit()
+
+    if created:
+        logger.info("Created partitions", table=table, partitions=created)
+    return created
+
+
+async def _create_partition(session: AsyncSession, table: str, month: date) -> None:
+    # A partition cannot be created while the default partition holds rows in
+    # its range, so those rows are set aside and moved into it afterwards.
+    default = default_partition_name(table)
+    in_month = (
+        f"{PARTITION_KEYS[table]} >= '{month.isoformat()}'"
+        f" AND {PARTITION_KEYS[table]} < '{add_months(month, 1).isoformat()}'"
+    )
+    has_rows = await session.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_month})")
+    )
+    if not has_rows:
+        await session.execute(text(partition_ddl(table, month)))
+        return
+
+    moved = f"{partition_name(table, month)}_moved"
+    await session.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {moved} ON COMMIT DROP"
+            f" AS SELECT * FROM {default} WHERE {in_month}"
+        )
+    )
+    await session.execute(text(f"DELETE FROM {default} WHERE {in_month}"))
+    await session.execute(text(partition_ddl(table, month)))
+    await session.execute(text(f"INSERT INTO {table} SELECT * FROM {moved}"))
+    logger.info("Moved rows out of the default partition", table=table, month=month)
+
+
+async def drop_partitions_before(
+    session: AsyncSession, table: str, cutoff: date
+) -> list[str]:
+    """Drop the partitions whose whole month is older than ``cutoff``.
+
+    Runs in the caller's transaction, so the drop commits together with
+    whatever moved the data out of those months.
+    """
+    if not is_partitioned(session):
+        return []
+
+    existing = await list_partitions(session, table)
+    dropped = []
+    for month, name in sorted(existing.items()):
+        if add_months(month, 1) > cutoff:
+            continue
+        await session.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+
+    if dropped:
+        logger.info("Dropped partitions", table=table, partitions=dropped)
+    return dropped
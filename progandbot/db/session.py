@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import math
+import time
+
+from collections import Counter
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 
+import structlog
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -12,8 +23,29 @@ from progandbot.core.config import settings
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
+    from collections.abc import Mapping
 
 
+logger = structlog.get_logger(__name__)
+
+LAG_CHECK_TIMEOUT = 2.0
+# Lags measured longer ago than this many check intervals are not trusted.
+LAG_STALE_INTERVALS = 3
+# Zero when the server is not a standby, or when it streams from the primary
+# and has replayed everything it received. NULL when it is not streaming, as
+# it then has nothing new to replay and would otherwise look caught up
+# forever. Reading the receiver status needs the pg_read_all_stats role.
+REPLICATION_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN NOT EXISTS ("
+    "SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
 engine = create_async_engine(str(settings.POSTGRES_ASYNC_URI), pool_pre_ping=True)
 AsyncSessionFactory = async_sessionmaker(
     bind=engine,
@@ -22,7 +54,130 @@ AsyncSessionFactory = async_sessionmaker(
 )
 
 
+@dataclass
+class RoutingMetrics:
+    primary_sessions: int = 0
+    primary_reads: int = 0
+    replica_reads: Counter[str] = field(default_factory=Counter)
+    fallbacks: Counter[str] = field(default_factory=Counter)
+    failed_checks: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class _Replica:
+    name: str
+    factory: async_sessionmaker[AsyncSession]
+    # None until the first check and while the replica cannot be reached.
+    lag: float | None = None
+    checked_at: float = -math.inf
+
+
+class ReplicaRouter:
+    """Picks the database that serves each read-only session.
+
+    Reads rotate over the replicas whose replication lag is within
+    ``max_lag`` seconds. Lags are measured by :meth:`check_lags`, which the bot
+    runs as a scheduled job every ``check_interval`` seconds so that reads
+    never wait on a check. A replica that fails the check, or whose last check
+    is older than ``LAG_STALE_INTERVALS`` intervals, is skipped. When no
+    replica is usable the read falls back to the primary, and every decision
+    is counted in :attr:`metrics`.
+    """
+
+    def __init__(
+        self,
+        factories: Mapping[str, async_sessionmaker[AsyncSession]],
+        *,
+        max_lag: float = settings.POSTGRES_REPLICA_MAX_LAG,
+        check_interval: float = settings.POSTGRES_REPLICA_CHECK_INTERVAL,
+    ) -> None:
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.metrics = RoutingMetrics()
+        self.replicas = [_Replica(name, factory) for name, factory in factories.items()]
+        self._rotation = itertools.count()
+
+    def lags(self) -> dict[str, float | None]:
+        return {replica.name: replica.lag for replica in self.replicas}
+
+    async def measure_lag(self, replica: _Replica) -> float:
+        async with replica.factory() as session:
+            if session.get_bind().dialect.name != "postgresql":
+                return 0.0
+            lag = await session.scalar(REPLICATION_LAG_QUERY)
+            return math.inf if lag is None else float(lag)
+
+    async def check_lags(self) -> None:
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    async def _check(self, replica: _Replica) -> None:
+        try:
+            async with asyncio.timeout(LAG_CHECK_TIMEOUT):
+                replica.lag = await self.measure_lag(replica)
+        except Exception as e:
+            replica.lag = None
+            self.metrics.failed_checks[replica.name] += 1
+            logger.warning(
+                "Replica lag check failed", replica=replica.name, error=str(e)
+            )
+        replica.checked_at = time.monotonic()
+
+    async def route(self) -> async_sessionmaker[AsyncSession] | None:
+        """Return the factory of the replica to read from, None for the primary."""
+        if not self.replicas:
+            self.metrics.primary_reads += 1
+            return None
+
+        fresh_since = time.monotonic() - self.check_interval * LAG_STALE_INTERVALS
+        checked = [
+            replica for replica in self.replicas if replica.checked_at >= fresh_since
+        ]
+        usable = [
+            replica
+            for replica in checked
+            if replica.lag is not None and replica.lag <= self.max_lag
+        ]
+        if not usable:
+            reachable = any(replica.lag is not None for replica in checked)
+            self.metrics.primary_reads += 1
+            self.metrics.fallbacks["lagging" if reachable else "unavailable"] += 1
+            return None
+
+        replica = usable[next(self._rotation) % len(usable)]
+        self.metrics.replica_reads[replica.name] += 1
+        return replica.factory
+
+
+router = ReplicaRouter(
+    {
+        name: async_sessionmaker(
+            bind=create_async_engine(str(uri), pool_pre_ping=True),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        for name, uri in zip(
+            settings.POSTGRES_REPLICA_HOSTS, settings.POSTGRES_REPLICA_URIS, strict=True
+        )
+    }
+)
+
+
 @asynccontextmanager
-async def get_session() -> AsyncGenerator[AsyncSession]:
-    async with AsyncSessionFactory() as session:
+async def get_session(*, read_only: bool = False) -> AsyncGenerator[AsyncSession]:
+    """Open a session on the primary, or on a replica when ``read_only``.
+
+    Replicas trail the primary by up to the configured lag, so read-only
+    sessions are for paths that can show slightly stale data and never write.
+    Results that are cached until a write invalidates them must be read from
+    the primary, or the cache would keep the data from before the write.
+    """
+    factory = None
+    if read_only:
+        factory = await router.route()
+    else:
+        router.metrics.primary_sessions += 1
+    if factory is None:
+        factory = AsyncSessionFactory
+
+    async with factory() as session:
         yield session
@@ -0,0 +1,59 @@
+"""Iterate over large query results without loading them into memory.
+
+Results are fetched ``batch_size`` rows at a time through a server-side cursor
+(``yield_per``), so memory use depends on the batch size and not on the number
+of rows. The session's connection stays busy until the iteration ends, so
+consumers that may stop early should wrap the iterator in
+``contextlib.aclosing`` to release the cursor right away.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Sequence
+
+    from sqlalchemy import Row
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql import Executable
+
+
+STREAM_BATCH_SIZE = 1000
+
+
+async def stream_partitions(
+    session: AsyncSession,
+    statement: Executable,
+    *,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """Yield the rows of ``statement`` in lists of up to ``batch_size`` rows."""
+    result = await session.stream(
+        statement, execution_options={"yield_per": batch_size}
+    )
+    try:
+        async for partition in result.partitions():
+            yield partition
+    finally:
+        await result.close()
+
+
+async def stream_scalars(
+    session: AsyncSession,
+    statement: Executable,
+    *,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator[Any]:
+    """Yield the first column of every row of ``statement``, one at a time."""
+    result = await session.stream_scalars(
+        statement, execution_options={"yield_per": batch_size}
+    )
+    try:
+        async for item in result:
+            yield item
+    finally:
+        await result.close()
@@ -0,0 +1,383 @@
+"""Export and import of all the data of a guild.
+
+Every table is written to its own file, as Parquet or Arrow IPC when
+``pyarrow`` is installed and as CSV otherwise. Rows are read through a
+server-side cursor and written chunk by chunk, so memory use does not grow
+with the size of the guild. Imports replace the data of the exported guilds
+and load it with ``COPY`` on PostgreSQL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import enum
+import importlib.util
+import json
+
+from datetime import date
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+import structlog
+
+from sqlalchemy import JSON
+from sqlalchemy import Boolean
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlmodel import SQLModel
+
+from progandbot.core.enums import ExportFormat
+
+# Registers every table in the metadata.
+from progandbot.db import models  # noqa: F401
+from progandbot.db.streaming import stream_partitions
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from sqlalchemy import Column
+    from sqlalchemy import Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = structlog.get_logger(__name__)
+
+TRANSFER_CHUNK_ROWS = 10_000
+
+
+def _guild_tables() -> tuple[str, ...]:
+    """Return guild_configs and every table referencing it, in foreign key order.
+
+    Taken from the metadata so that a new table referencing guild configs is
+    exported, and deleted before them on import, without being listed here.
+    """
+    guild_id = SQLModel.metadata.tables["guild_configs"].c.guild_id
+    return tuple(
+        table.name
+        for table in SQLModel.metadata.sorted_tables
+        if table.name == "guild_configs"
+        or any(foreign_key.column is guild_id for foreign_key in table.foreign_keys)
+    )
+
+
+EXPORT_TABLES = _guild_tables()
+# Surrogate keys are left to the target database so they cannot collide.
+GENERATED_COLUMNS = {"scheduled_polls": ("id",)}
+
+Row = tuple[Any, ...]
+
+
+def has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def resolve_format(export_format: ExportFormat) -> ExportFormat:
+    if export_format.needs_pyarrow and not has_pyarrow():
+        logger.warning(
+            "pyarrow is not installed, exporting as CSV instead",
+            requested=export_format.value,
+        )
+        return ExportFormat.CSV
+    return export_format
+
+
+def _export_value(column: Column[Any], value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(column.type, JSON):
+        return json.dumps(value)
+    return value
+
+
+def _import_value(column: Column[Any], value: Any) -> Any:
+    """Turn a value read from a file back into what the column expects.
+
+    CSV files hold only text, so every type is parsed, while Arrow values keep
+    their types except for JSON, which is always stored as text.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(column.type, JSON):
+        return json.loads(value)
+    if not isinstance(value, str):
+        return value
+
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return value == "True"
+    if isinstance(column_type, Integer):
+        return int(value)
+    if isinstance(column_type, Float):
+        return float(value)
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def _arrow_schema(table: Table) -> Any:
+    import pyarrow as pa  # type: ignore[import-not-found]
+
+    def arrow_type(column: Column[Any]) -> Any:
+        column_type = column.type
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        if isinstance(column_type, Float):
+            return pa.float64()
+        if isinstance(column_type, DateTime):
+            return pa.timestamp("us", tz="UTC")
+        if isinstance(column_type, Date):
+            return pa.date32()
+        return pa.string()
+
+    return pa.schema([(column.name, arrow_type(column)) for column in table.columns])
+
+
+class _TableWriter(Protocol):
+    def write(self, rows: Sequence[Row]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, table: Table) -> None:
+        self._file = path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(table.columns.keys())
+
+    def write(self, rows: Sequence[Row]) -> None:
+        self._writer.writerows(
+            [
+                tuple("" if value is None else _isoformat(value) for value in row)
+                for row in rows
+            ]
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowWriter:
+    def __init__(self, path: Path, table: Table, export_format: ExportFormat) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        self._pa = pa
+        self._schema = _arrow_schema(table)
+        if export_format is ExportFormat.PARQUET:
+            self._writer = pq.ParquetWriter(path, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self._schema)
+
+    def write(self, rows: Sequence[Row]) -> None:
+        columns = list(zip(*rows, strict=True))
+        self._writer.write_batch(self._pa.record_batch(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _open_writer(path: Path, table: Table, export_format: ExportFormat) -> _TableWriter:
+    if export_format is ExportFormat.CSV:
+        return _CsvWriter(path, table)
+    return _ArrowWriter(path, table, export_format)
+
+
+def _read_chunks(path: Path, table: Table) -> Iterator[list[Row]]:
+    """Yield the rows of an exported file in chunks, in table column order."""
+    names = table.columns.keys()
+    match path.suffix.removeprefix("."):
+        case ExportFormat.CSV.value:
+            with path.open(newline="", encoding="utf-8") as file:
+                reader = csv.DictReader(file)
+                chunk: list[Row] = []
+                for record in reader:
+                    chunk.append(tuple(record.get(name) for name in names))
+                    if len(chunk) == TRANSFER_CHUNK_ROWS:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+        case ExportFormat.PARQUET.value:
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=TRANSFER_CHUNK_ROWS):
+                yield _batch_rows(batch, names)
+        case ExportFormat.ARROW.value:
+            import pyarrow as pa
+
+            with pa.memory_map(str(path)) as source:
+                arrow_reader = pa.ipc.open_file(source)
+                for index in range(arrow_reader.num_record_batches):
+                    yield _batch_rows(arrow_reader.get_batch(index), names)
+
+
+def _batch_rows(batch: Any, names: Sequence[str]) -> list[Row]:
+    columns = [
+        batch.column(name).to_pylist()
+        if name in batch.schema.names
+        else [None] * batch.num_rows
+        for name in names
+    ]
+    return list(zip(*columns, strict=True))
+
+
+def _table_file(directory: Path, name: str) -> Path | None:
+    for export_format in ExportFormat:
+        path = directory / f"{name}.{export_format.value}"
+        if path.exists():
+            return path
+    return None
+
+
+async def export_guild(
+    session: AsyncSession,
+    guild_id: int,
+    directory: Path,
+    export_format: ExportFormat = ExportFormat.PARQUET,
+) -> dict[str, int]:
+    """Write every table of the guild to ``directory``, returning row counts."""
+    export_format = resolve_format(export_format)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    exported: dict[str, int] = {}
+    for name in EXPORT_TABLES:
+        table = SQLModel.metadata.tables[name]
+        writer = await asyncio.to_thread(
+            _open_writer,
+            directory / f"{name}.{export_format.value}",
+            table,
+            export_format,
+        )
+        exported[name] = 0
+        try:
+            async for partition in stream_partitions(
+                session,
+                select(table).where(table.c.guild_id == guild_id),
+                batch_size=TRANSFER_CHUNK_ROWS,
+            ):
+                rows = [
+                    tuple(
+                        _export_value(column, value)
+                        for column, value in zip(table.columns, row, strict=True)
+                    )
+                    for row in partition
+                ]
+                await asyncio.to_thread(writer.write, rows)
+                exported[name] += len(rows)
+        finally:
+            await asyncio.to_thread(writer.close)
+
+    logger.info(
+        "Exported guild data",
+        guild_id=guild_id,
+        format=export_format.value,
+        rows=exported,
+    )
+    return exported
+
+
+async def _copy_rows(
+    session: AsyncSession, table: Table, columns: Sequence[Column[Any]], rows: list[Row]
+) -> None:
+    if session.get_bind().dialect.name != "postgresql":
+        names = [column.name for column in columns]
+        await session.execute(
+            insert(table), [dict(zip(names, row, strict=True)) for row in rows]
+        )
+        return
+
+    # asyncpg takes JSON as text, and enums by their label.
+    json_columns = [
+        index for index, column in enumerate(columns) if isinstance(column.type, JSON)
+    ]
+    if json_columns:
+        rows = [
+            tuple(
+                json.dumps(value)
+                if index in json_columns and value is not None
+                else value
+                for index, value in enumerate(row)
+            )
+            for row in rows
+        ]
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        table.name, records=rows, columns=[column.name for column in columns]
+    )
+
+
+async def import_guilds(session: AsyncSession, directory: Path) -> dict[str, int]:
+    """Replace the data of the guilds exported to ``directory``.
+
+    Existing rows of those guilds are deleted first and everything is loaded in
+    a single transaction, so a failed import leaves the database untouched.
+    """
+    files = {name: _table_file(directory, name) for name in EXPORT_TABLES}
+    guild_configs_file = files["guild_configs"]
+    if guild_configs_file is None:
+        raise FileNotFoundError(f"No guild_configs export found in {directory}")
+
+    guild_ids = await asyncio.to_thread(_read_guild_ids, guild_configs_file)
+
+    for name in reversed(EXPORT_TABLES):
+        table = SQLModel.metadata.tables[name]
+        await session.execute(delete(table).where(table.c.guild_id.in_(guild_ids)))
+
+    imported: dict[str, int] = {}
+    for name, path in files.items():
+        if path is None:
+            continue
+
+        table = SQLModel.metadata.tables[name]
+        skipped = GENERATED_COLUMNS.get(name, ())
+        indexes = [
+            index
+            for index, column in enumerate(table.columns)
+            if column.name not in skipped
+        ]
+        columns = [table.columns[index] for index in indexes]
+
+        imported[name] = 0
+        chunks = _read_chunks(path, table)
+        while chunk := await asyncio.to_thread(next, chunks, None):
+            rows = [
+                tuple(
+                    _import_value(table.columns[index], row[index]) for index in indexes
+                )
+                for row in chunk
+            ]
+            await _copy_rows(session, table, columns, rows)
+            imported[name] += len(rows)
+    await session.commit()
+
+    logger.info("Imported guild data", guild_ids=guild_ids, rows=imported)
+    return imported
+
+
+def _read_guild_ids(path: Path) -> list[int]:
+    table = SQLModel.metadata.tables["guild_configs"]
+    index = table.columns.keys().index("guild_id")
+    return [int(row[index]) for chunk in _read_chunks(path, table) for row in chunk]
@@ -0,0 +1,121 @@
+"""Batched ``INSERT ... ON CONFLICT`` for PostgreSQL and SQLite.
+
+Production runs on PostgreSQL while the tests run on SQLite, and both support
+the same ``ON CONFLICT`` clause through their own SQLAlchemy ``insert``. These
+helpers pick the right one for the session and send multi-row statements,
+split so that no statement goes over the bound parameter limit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from sqlalchemy import Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlmodel import SQLModel
+
+
+UPSERT_BATCH_SIZE = 1000
+# asyncpg allows 32767 bound parameters per statement and SQLite 32766.
+MAX_BOUND_PARAMETERS = 32766
+
+type Rows = Sequence[Mapping[str, Any]]
+
+
+def _table(model: type[SQLModel] | Table) -> Table:
+    table: Table = inspect(model).local_table if isinstance(model, type) else model
+    return table
+
+
+def _batches(rows: Rows, batch_size: int) -> Iterator[Rows]:
+    if not rows:
+        return
+    batch_size = max(1, min(batch_size, MAX_BOUND_PARAMETERS // len(rows[0])))
+    for start in range(0, len(rows), batch_size):
+        yield rows[start : start + batch_size]
+
+
+def dialect_insert(session: AsyncSession, table: Table) -> Any:
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+async def insert_ignore(
+    session: AsyncSession,
+    model: type[SQLModel] | Table,
+    rows: Rows,
+    *,
+    index_elements: Sequence[str],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    """Insert ``rows``, skipping the ones that conflict with existing rows."""
+    table = _table(model)
+    for batch in _batches(rows, batch_size):
+        stmt = dialect_insert(session, table).values(batch)
+        await session.execute(
+            stmt.on_conflict_do_nothing(index_elements=index_elements)
+        )
+
+
+async def upsert(
+    session: AsyncSession,
+    model: type[SQLModel] | Table,
+    rows: Rows,
+    *,
+    index_elements: Sequence[str],
+    update: Sequence[str] | None = None,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    """Insert ``rows``, overwriting the ``update`` columns of conflicting rows.
+
+    ``update`` defaults to every inserted column outside of ``index_elements``.
+    """
+    table = _table(model)
+    for batch in _batches(rows, batch_size):
+        stmt = dialect_insert(session, table).values(batch)
+        columns = update
+        if columns is None:
+            columns = [name for name in batch[0] if name not in index_elements]
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={name: stmt.excluded[name] for name in columns},
+            )
+        )
+
+
+async def upsert_increment(
+    session: AsyncSession,
+    model: type[SQLModel] | Table,
+    rows: Rows,
+    *,
+    index_elements: Sequence[str],
+    increment: Sequence[str],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    """Insert ``rows``, adding their ``increment`` columns to conflicting rows.
+
+    Increments happen in the database, so concurrent writers never lose
+    updates the way a read followed by a write can.
+    """
+    table = _table(model)
+    for batch in _batches(rows, batch_size):
+        stmt = dialect_insert(session, table).values(batch)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={name: table.c[name] + stmt.excluded[name] for name in increment},
+            )
+        )
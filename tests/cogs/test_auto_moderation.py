@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from progandbot.cogs.auto_moderation import DUPLICATE_THRESHOLD
+from progandbot.cogs.auto_moderation import FLOOD_BURST
+from progandbot.cogs.auto_moderation import AutoModeration
+from progandbot.core.word_filter import WordFilterManager
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.models.word_filter import WordFilter
+from progandbot.db.session import get_session
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_message(guild_id: int, user_id: int, content: str) -> MagicMock:
+    message = MagicMock()
+    message.author.bot = False
+    message.author.id = user_id
+    message.guild.id = guild_id
+    message.content = content
+    message.raw_mentions = []
+    message.raw_role_mentions = []
+    message.delete = AsyncMock()
+    message.channel.send = AsyncMock()
+    return message
+
+
+async def test_duplicate_content_is_detected() -> None:
+    cog = AutoModeration(MagicMock())
+
+    violations = [
+        cog._detect_violation(_make_message(1, 2, "buy now"), now=100.0 + i * 10)
+        for i in range(DUPLICATE_THRESHOLD)
+    ]
+
+    assert violations[:-1] == [None] * (DUPLICATE_THRESHOLD - 1)
+    assert violations[-1] == "duplicate messages"
+
+
+async def test_flood_is_detected() -> None:
+    cog = AutoModeration(MagicMock())
+
+    violations = [
+        cog._detect_violation(_make_message(1, 3, f"message {i}"), now=100.0)
+        for i in range(FLOOD_BURST + 1)
+    ]
+
+    assert violations[-1] == "message flood"
+    assert violations[:-1] == [None] * FLOOD_BURST
+
+
+def _make_bot() -> MagicMock:
+    bot_mock = MagicMock()
+    bot_mock.word_filter = WordFilterManager()
+    return bot_mock
+
+
+async def test_on_message_warns_spammer_once_and_deletes_every_violation() -> None:
+    cog = AutoModeration(_make_bot())
+
+    guild_id = 4321
+    user_id = 8765
+    messages = [
+        _make_message(guild_id, user_id, "spam") for _ in range(DUPLICATE_THRESHOLD + 2)
+    ]
+    for message in messages:
+        await cog.on_message(message)
+
+    assert [message.delete.await_count for message in messages] == [0] * (
+        DUPLICATE_THRESHOLD - 1
+    ) + [1] * 3
+    cog.bot.outbox.send.assert_called_once()
+    async with get_session() as session:
+        profile = await session.get(UserProfile, (guild_id, user_id))
+        assert profile is not None
+        assert profile.warning_count == 1
+
+
+async def test_on_message_deletes_filtered_words() -> None:
+    cog = AutoModeration(_make_bot())
+
+    guild_id = 2468
+    async with get_session() as session:
+        session.add(WordFilter(guild_id=guild_id, pattern="darn"))
+        session.add(
+            WordFilter(guild_id=guild_id, pattern=r"free\s+nitro", is_regex=True)
+        )
+        await session.commit()
+
+    clean = _make_message(guild_id, 1, "darnation is fine")
+    await cog.on_message(clean)
+    clean.delete.assert_not_awaited()
+
+    for content in ("well DARN it", "get FREE   nitro here"):
+        message = _make_message(guild_id, 1, content)
+        await cog.on_message(message)
+        message.delete.assert_awaited_once()
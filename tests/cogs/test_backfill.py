@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from progandbot.cogs import backfill
+from progandbot.cogs.backfill import Backfill
+from progandbot.cogs.backfill import BackfillProgress
+from progandbot.db.models.backfill_checkpoint import BackfillCheckpoint
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_channel(channel_id: int, authors: list[int]) -> MagicMock:
+    # Message ids grow with the index, the author of message 10 + i is authors[i].
+    messages = [
+        MagicMock(id=10 + index, author=MagicMock(id=author, bot=author == 0))
+        for index, author in enumerate(authors)
+    ]
+
+    async def history(**kwargs: Any) -> AsyncIterator[MagicMock]:
+        before: discord.Object = kwargs["before"]
+        for message in reversed(messages):
+            if message.id < before.id:
+                yield message
+
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = channel_id
+    channel.history = history
+    return channel
+
+
+async def test_backfill_channel_counts_and_resumes_from_checkpoint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(backfill, "BACKFILL_FLUSH_MESSAGES", 2)
+
+    guild_id = 97531
+    channel = _make_channel(11, [1, 2, 1, 0, 1, 2, 1])
+    guild = MagicMock(id=guild_id)
+    guild.get_channel.return_value = channel
+
+    async with get_session() as session:
+        session.add(GuildConfig(guild_id=guild_id))
+        session.add(UserProfile(guild_id=guild_id, user_id=1, message_count=5))
+        # Messages 16 and newer were already tracked live, 13 and newer were
+        # counted before the restart.
+        session.add(
+            BackfillCheckpoint(
+                guild_id=guild_id,
+                channel_id=channel.id,
+                until_message_id=16,
+                cursor_message_id=13,
+            )
+        )
+        await session.commit()
+
+    cog = Backfill(MagicMock())
+    progress = BackfillProgress(channels=1)
+    async with get_session() as session:
+        checkpoint = await session.get(BackfillCheckpoint, (guild_id, channel.id))
+    assert checkpoint is not None
+    await cog._backfill_channel(guild, checkpoint, progress)
+
+    async with get_session() as session:
+        first = await session.get(UserProfile, (guild_id, 1))
+        second = await session.get(UserProfile, (guild_id, 2))
+        checkpoint = await session.get(BackfillCheckpoint, (guild_id, channel.id))
+    assert first is not None and first.message_count == 7
+    assert second is not None and second.message_count == 1
+    assert checkpoint is not None
+    assert checkpoint.cursor_message_id == 10
+    assert checkpoint.messages_counted == 3
+    assert checkpoint.completed_at is not None
+    assert progress.channels_done == 1
+    assert progress.messages_counted == 3
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from sqlalchemy import select
+
+from progandbot.cogs.guild_join import GuildJoin
+from progandbot.core.enums import SupportedLanguage
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.session import get_session
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_on_ready_creates_missing_guild_configs() -> None:
+    async with get_session() as session:
+        session.add(GuildConfig(guild_id=9001, language=SupportedLanguage.ES))
+        await session.commit()
+
+    bot = MagicMock()
+    bot.guilds = [MagicMock(id=guild_id) for guild_id in (9001, 9002, 9003)]
+    cog = GuildJoin(bot)
+    await cog.on_ready()
+    await cog.on_ready()
+
+    async with get_session() as session:
+        configs = (
+            await session.scalars(
+                select(GuildConfig).where(
+                    GuildConfig.guild_id.in_([9001, 9002, 9003])  # type: ignore[union-attr]
+                )
+            )
+        ).all()
+    assert {config.guild_id: config.language for config in configs} == {
+        9001: SupportedLanguage.ES,
+        9002: SupportedLanguage.EN,
+        9003: SupportedLanguage.EN,
+    }
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+from datetime import date
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
+import discord
 import pytest
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import OperationalError
+
+from progandbot.cogs import message_tracker
+from progandbot.cogs.message_tracker import ACTIVITY_FLUSH_RETRIES
 from progandbot.cogs.message_tracker import MessageTracker
+from progandbot.db.models.activity import DailyActivity
+from progandbot.db.models.activity import MonthlyActivity
 from progandbot.db.models.user_profile import UserProfile
 from progandbot.db.session import get_session
 
 
+if TYPE_CHECKING:
+    from collections import Counter
+
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -30,3 +44,129 @@ async def test_on_message_increments_message_count() -> None:
         profile = await session.get(UserProfile, (guild_id, user_id))
         assert profile is not None
         assert profile.message_count == 1
+    bot_mock.profile_cache.invalidate.assert_not_called()
+
+
+async def test_flush_activity_batches_daily_counts() -> None:
+    cog = MessageTracker(MagicMock())
+
+    guild_id = 13579
+    user_id = 2468
+
+    mock_message = MagicMock()
+    mock_message.author.bot = False
+    mock_message.guild.id = guild_id
+    mock_message.author.id = user_id
+
+    for _ in range(3):
+        await cog.on_message(mock_message)
+    await cog.flush_activity()
+    await cog.on_message(mock_message)
+    await cog.flush_activity()
+
+    today = discord.utils.utcnow().date()
+    async with get_session() as session:
+        activity = await session.get(DailyActivity, (guild_id, user_id, today))
+        assert activity is not None
+        assert activity.message_count == 4
+    assert not cog.pending_activity
+
+
+async def test_flush_activity_drops_only_rows_that_keep_failing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cog = MessageTracker(MagicMock())
+    today = discord.utils.utcnow().date()
+    good = (24680, 1, today)
+    bad = (24680, 2, today)
+    write_activity = cog._write_activity
+
+    async def fail_on_bad_row(counts: Counter[tuple[int, int, date]]) -> None:
+        if bad in counts:
+            raise IntegrityError("INSERT", {}, Exception("foreign key violation"))
+        await write_activity(counts)
+
+    monkeypatch.setattr(cog, "_write_activity", fail_on_bad_row)
+
+    for _ in range(ACTIVITY_FLUSH_RETRIES + 1):
+        cog.pending_activity.update({good: 1, bad: 1})
+        await cog.flush_activity()
+        assert set(cog.pending_activity) <= {bad}
+    assert not cog.pending_activity
+    assert not cog.flush_retries
+
+    async with get_session() as session:
+        activity = await session.get(DailyActivity, good)
+        assert activity is not None
+        assert activity.message_count == ACTIVITY_FLUSH_RETRIES + 1
+
+
+async def test_flush_activity_keeps_counts_through_an_outage(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(message_tracker, "ACTIVITY_PENDING_MAX_ROWS", 2)
+    cog = MessageTracker(MagicMock())
+    today = discord.utils.utcnow().date()
+    write_activity = cog._write_activity
+    writes = 0
+    down = True
+
+    async def unreachable(counts: Counter[tuple[int, int, date]]) -> None:
+        nonlocal writes
+        writes += 1
+        if down:
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+        await write_activity(counts)
+
+    monkeypatch.setattr(cog, "_write_activity", unreachable)
+
+    for user_id in (1, 2, 1, 3):
+        cog._add_pending((35791, user_id, today), 1)
+    for _ in range(ACTIVITY_FLUSH_RETRIES + 2):
+        await cog.flush_activity()
+    assert writes == ACTIVITY_FLUSH_RETRIES + 2
+    assert cog.pending_activity == {(35791, 1, today): 2, (35791, 2, today): 1}
+    assert not cog.flush_retries
+
+    down = False
+    await cog.flush_activity()
+    assert not cog.pending_activity
+    async with get_session() as session:
+        activity = await session.get(DailyActivity, (35791, 1, today))
+        assert activity is not None
+        assert activity.message_count == 2
+
+
+async def test_compact_activity_moves_old_days_to_monthly_buckets() -> None:
+    cog = MessageTracker(MagicMock())
+
+    guild_id = 97531
+    user_id = 8642
+    today = date(2025, 7, 15)
+    async with get_session() as session:
+        for day, count in ((date(2025, 3, 2), 5), (date(2025, 3, 20), 7)):
+            session.add(
+                DailyActivity(
+                    guild_id=guild_id, user_id=user_id, day=day, message_count=count
+                )
+            )
+        session.add(
+            DailyActivity(
+                guild_id=guild_id, user_id=user_id, day=today, message_count=1
+            )
+        )
+        await session.commit()
+
+    await cog.compact_activity(today=today)
+
+    async with get_session() as session:
+        monthly = await session.get(
+            MonthlyActivity, (guild_id, user_id, date(2025, 3, 1))
+        )
+        assert monthly is not None
+        assert monthly.message_count == 12
+        assert (
+            await session.get(DailyActivity, (guild_id, user_id, date(2025, 3, 2)))
+            is None
+        )
+        assert await session.get(DailyActivity, (guild_id, user_id, today)) is not None
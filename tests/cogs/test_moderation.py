@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from progandbot.cogs import moderation
+from progandbot.cogs.moderation import Moderation
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_channel(messages: list[MagicMock]) -> MagicMock:
+    async def history(limit: int | None = None):  # type: ignore[no-untyped-def]
+        for message in messages[:limit]:
+            yield message
+
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.history = history
+    channel.delete_messages = AsyncMock()
+    return channel
+
+
+def _make_message(age: timedelta, author_id: int = 1) -> MagicMock:
+    message = MagicMock()
+    message.created_at = discord.utils.utcnow() - age
+    message.author.id = author_id
+    message.delete = AsyncMock()
+    return message
+
+
+async def test_stream_purge_bulk_deletes_recent_and_single_deletes_old(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(moderation, "SINGLE_DELETE_DELAY", 0)
+    cog = Moderation(MagicMock())
+
+    recent = [_make_message(timedelta(hours=i)) for i in range(150)]
+    old = [_make_message(timedelta(days=20 + i)) for i in range(3)]
+    channel = _make_channel([*recent, *old])
+    interaction = MagicMock()
+    interaction.created_at = discord.utils.utcnow()
+    interaction.edit_original_response = AsyncMock()
+
+    deleted = await cog._stream_purge(interaction, channel, 152, lambda _: True)
+
+    assert deleted == 152
+    batch_sizes = [len(c.args[0]) for c in channel.delete_messages.await_args_list]
+    assert batch_sizes == [100, 50]
+    assert old[0].delete.await_count == 1
+    assert old[1].delete.await_count == 1
+    assert old[2].delete.await_count == 0
+
+
+async def test_slow_clear_reports_in_the_channel_once_the_token_expires(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(moderation, "SINGLE_DELETE_DELAY", 0)
+    monkeypatch.setattr(moderation, "CLEAR_PROGRESS_INTERVAL", 0)
+    cog = Moderation(MagicMock())
+
+    old = [_make_message(timedelta(days=20 + i)) for i in range(3)]
+    channel = _make_channel(old)
+    interaction = MagicMock()
+    interaction.created_at = discord.utils.utcnow() - timedelta(minutes=14, seconds=30)
+    interaction.channel = channel
+    interaction.response.defer = AsyncMock()
+    interaction.edit_original_response = AsyncMock()
+    interaction.followup.send = AsyncMock()
+
+    await Moderation.clear_messages.callback(cog, interaction, 3)
+
+    assert all(m.delete.await_count == 1 for m in old)
+    interaction.edit_original_response.assert_not_awaited()
+    interaction.followup.send.assert_not_awaited()
+    cog.bot.outbox.send.assert_called_once()
+    assert cog.bot.outbox.send.call_args.args[0] is channel
+    assert "cleared 3 messages" in cog.bot.outbox.send.call_args.args[1]
+
+
+async def test_stream_purge_applies_filter() -> None:
+    cog = Moderation(MagicMock())
+
+    messages = [_make_message(timedelta(minutes=i), author_id=i % 2) for i in range(10)]
+    channel = _make_channel(messages)
+    interaction = MagicMock()
+    interaction.created_at = discord.utils.utcnow()
+    interaction.edit_original_response = AsyncMock()
+
+    deleted = await cog._stream_purge(
+        interaction, channel, 100, lambda m: m.author.id == 1
+    )
+
+    assert deleted == 5
+    (batch,) = channel.delete_messages.await_args.args
+    assert all(m.author.id == 1 for m in batch)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from progandbot.cogs.polls import SCHEDULED_POLL_MAX_ATTEMPTS
+from progandbot.cogs.polls import Polls
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.poll_result import PollResult
+from progandbot.db.models.poll_result import PollStats
+from progandbot.db.models.scheduled_poll import ScheduledPoll
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_poll_message(message_id: int, guild_id: int, votes: list[int]) -> MagicMock:
+    answers = []
+    for i, count in enumerate(votes):
+        answer = MagicMock()
+        answer.text = f"answer {i}"
+        answer.vote_count = count
+        answers.append(answer)
+
+    poll_message = MagicMock()
+    poll_message.id = message_id
+    poll_message.guild.id = guild_id
+    poll_message.guild.member_count = 20
+    poll_message.channel.id = 1
+    poll_message.poll.question = "question?"
+    poll_message.poll.multiple = False
+    poll_message.poll.answers = answers
+    poll_message.poll.victor_answer = answers[votes.index(max(votes))]
+    return poll_message
+
+
+async def test_archive_poll_result_updates_summary_once() -> None:
+    cog = Polls(MagicMock())
+    guild_id = 5555
+    ended_at = discord.utils.utcnow()
+
+    await cog.archive_poll_result(_make_poll_message(1, guild_id, [3, 7]), ended_at)
+    await cog.archive_poll_result(_make_poll_message(2, guild_id, [4, 1]), ended_at)
+    await cog.archive_poll_result(_make_poll_message(2, guild_id, [4, 1]), ended_at)
+
+    async with get_session() as session:
+        poll_result = await session.get(PollResult, 1)
+        assert poll_result is not None
+        assert poll_result.victor_answer == "answer 1"
+        assert poll_result.answers == [
+            {"text": "answer 0", "votes": 3},
+            {"text": "answer 1", "votes": 7},
+        ]
+
+        poll_stats = await session.get(PollStats, guild_id)
+        assert poll_stats is not None
+        assert poll_stats.poll_count == 2
+        assert poll_stats.total_votes == 15
+        assert poll_stats.participation_sum == pytest.approx(0.5 + 0.25)
+
+
+async def test_archive_poll_result_counts_distinct_voters_of_multi_select() -> None:
+    cog = Polls(MagicMock())
+    guild_id = 5556
+    poll_message = _make_poll_message(3, guild_id, [2, 2])
+    poll_message.poll.multiple = True
+
+    async def voters(user_ids: list[int]) -> AsyncIterator[MagicMock]:
+        for user_id in user_ids:
+            yield MagicMock(id=user_id)
+
+    first, second = poll_message.poll.answers
+    first.voters = lambda limit: voters([1, 2])
+    second.voters = lambda limit: voters([2, 3])
+
+    await cog.archive_poll_result(poll_message, discord.utils.utcnow())
+
+    async with get_session() as session:
+        poll_stats = await session.get(PollStats, guild_id)
+        assert poll_stats is not None
+        assert poll_stats.total_votes == 4
+        assert poll_stats.participation_sum == pytest.approx(3 / 20)
+
+
+async def test_failed_scheduled_poll_is_retried_with_backoff() -> None:
+    bot_mock = MagicMock()
+    bot_mock.wait_until_ready = AsyncMock()
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.send = AsyncMock(side_effect=discord.DiscordServerError(MagicMock(), ""))
+    bot_mock.get_channel.return_value = channel
+    cog = Polls(bot_mock)
+
+    guild_id = 6666
+    async with get_session() as session:
+        session.add(GuildConfig(guild_id=guild_id))
+        scheduled_poll = ScheduledPoll(
+            guild_id=guild_id,
+            channel_id=1,
+            question="question?",
+            answers=["yes", "no"],
+            scheduled_for=discord.utils.utcnow(),
+        )
+        session.add(scheduled_poll)
+        await session.commit()
+    assert scheduled_poll.id is not None
+    poll_id = scheduled_poll.id
+
+    await cog._post_scheduled_poll(poll_id)
+    first_retry = cog.scheduled_polls.next_due()
+    await cog._post_scheduled_poll(poll_id)
+    second_retry = cog.scheduled_polls.next_due()
+
+    assert cog.post_attempts[poll_id] == 2
+    assert first_retry is not None and second_retry is not None
+    assert second_retry > first_retry
+    async with get_session() as session:
+        stored = await session.get(ScheduledPoll, poll_id)
+        assert stored is not None and stored.posted_at is None
+
+    for _ in range(SCHEDULED_POLL_MAX_ATTEMPTS - 2):
+        await cog._post_scheduled_poll(poll_id)
+    assert poll_id not in cog.post_attempts
+    async with get_session() as session:
+        stored = await session.get(ScheduledPoll, poll_id)
+        assert stored is not None and stored.posted_at is not None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from progandbot.cogs.reminders import Reminders
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_temp_role_rejects_roles_not_below_the_invokers_top_role() -> None:
+    cog = Reminders(MagicMock())
+    invoker_top_role = MagicMock()
+
+    role = MagicMock()
+    role.is_default.return_value = False
+    role.managed = False
+    role.__ge__.side_effect = lambda other: other is invoker_top_role
+
+    member = MagicMock()
+    member.add_roles = AsyncMock()
+    interaction = MagicMock()
+    interaction.guild.owner_id = 1
+    interaction.user = MagicMock(spec=discord.Member)
+    interaction.user.id = 2
+    interaction.user.top_role = invoker_top_role
+    interaction.response.send_message = AsyncMock()
+
+    await Reminders.temp_role.callback(cog, interaction, member, role, 1)
+
+    member.add_roles.assert_not_awaited()
+    assert "cannot assign" in interaction.response.send_message.await_args.args[0]
+
+    interaction.user.id = interaction.guild.owner_id
+    member.add_roles.side_effect = discord.HTTPException(MagicMock(), "stop here")
+    await Reminders.temp_role.callback(cog, interaction, member, role, 1)
+    member.add_roles.assert_awaited_once()
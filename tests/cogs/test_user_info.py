@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import discord
+import pytest
+
+from progandbot.cogs.user_info import fetch_profile_summary
+from progandbot.db.models.activity import DailyActivity
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_fetch_profile_summary_ranks_by_xp() -> None:
+    guild_id = 11223
+    today = discord.utils.utcnow().date()
+    async with get_session() as session:
+        for user_id, xp in ((1, 50), (2, 300), (3, 120)):
+            session.add(UserProfile(guild_id=guild_id, user_id=user_id, xp=xp))
+        session.add(UserProfile(guild_id=guild_id + 1, user_id=4, xp=1000))
+        session.add(
+            DailyActivity(guild_id=guild_id, user_id=3, day=today, message_count=9)
+        )
+        await session.commit()
+
+    profile = await fetch_profile_summary(guild_id, 3)
+
+    assert profile is not None
+    assert profile.xp == 120
+    assert profile.xp_rank == 2
+    assert profile.week_messages == 9
+    assert await fetch_profile_summary(guild_id, 99) is None
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import time
+import uuid
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pytest_asyncio
+
+from progandbot.core.cache import LRUCache
+from progandbot.core.cache import RedisCache
+from progandbot.core.cache import TieredCache
+from progandbot.core.enums import RateLimitScope
+from progandbot.core.rate_limit import CommandRateLimits
+from progandbot.core.rate_limit import RateLimitSpec
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from progandbot.core.cache import RemoteCache
+
+
+pytestmark = pytest.mark.asyncio
+
+# Set to a Redis URL to run the shared tier tests against a real server too.
+REDIS_URL_ENV = "PROGANDBOT_TEST_REDIS_URL"
+
+
+class MemoryRemote:
+    """Shared tier for two caches in one process, standing in for a server."""
+
+    def __init__(self, store: dict[str, tuple[float, str]]) -> None:
+        self.store = store
+        self.fail = False
+
+    async def get(self, key: str) -> str | None:
+        if self.fail:
+            raise ConnectionError("down")
+        item = self.store.get(key)
+        if item is None or item[0] <= time.monotonic():
+            return None
+        return item[1]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        if self.fail:
+            raise ConnectionError("down")
+        self.store[key] = (time.monotonic() + ttl, value)
+
+    async def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+
+    async def incr(self, key: str, ttl: float) -> tuple[int, float]:
+        if self.fail:
+            raise ConnectionError("down")
+        now = time.monotonic()
+        item = self.store.get(key)
+        if item is None or item[0] <= now:
+            item = (now + ttl, "0")
+        self.store[key] = (item[0], str(int(item[1]) + 1))
+        return int(item[1]) + 1, item[0] - now
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest_asyncio.fixture(
+    params=[
+        "memory",
+        pytest.param(
+            "fakeredis",
+            marks=pytest.mark.skipif(
+                importlib.util.find_spec("fakeredis") is None,
+                reason="fakeredis is not installed",
+            ),
+        ),
+        pytest.param(
+            "redis",
+            marks=pytest.mark.skipif(
+                REDIS_URL_ENV not in os.environ,
+                reason=f"{REDIS_URL_ENV} is not set",
+            ),
+        ),
+    ]
+)
+async def remotes(
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[tuple[RemoteCache, RemoteCache]]:
+    """Two clients of the same shared tier, as two bot processes would have."""
+    if request.param == "memory":
+        store: dict[str, tuple[float, str]] = {}
+        yield MemoryRemote(store), MemoryRemote(store)
+        return
+
+    if request.param == "fakeredis":
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        clients = [
+            RedisCache(
+                "", fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+            )
+            for _ in range(2)
+        ]
+    else:
+        url = os.environ[REDIS_URL_ENV]
+        clients = [RedisCache(url) for _ in range(2)]
+    yield clients[0], clients[1]
+    for client in clients:
+        await client.close()
+
+
+def _pair(remotes: tuple[RemoteCache, RemoteCache]) -> tuple[TieredCache, TieredCache]:
+    namespace = f"test-{uuid.uuid4().hex}"
+    return (
+        TieredCache(remotes[0], namespace=namespace),
+        TieredCache(remotes[1], namespace=namespace),
+    )
+
+
+async def test_lru_cache_expires_per_key_and_evicts_least_recently_used() -> None:
+    cache: LRUCache[int] = LRUCache(max_size=2)
+    cache.set("short", 1, ttl=1.0, now=0.0)
+    cache.set("long", 2, ttl=10.0, now=0.0)
+
+    assert cache.get("short", now=0.5) == 1
+    cache.set("new", 3, ttl=10.0, now=0.5)
+    assert cache.get("long", now=0.5) is None
+    assert cache.get("short", now=1.0) is None
+    assert cache.get("new", now=1.0) == 3
+
+
+async def test_get_or_load_runs_one_loader_for_concurrent_callers() -> None:
+    cache = TieredCache()
+    calls = 0
+
+    async def load() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("key", load, ttl=60.0) for _ in range(10))
+    )
+
+    assert results == [{"value": 1}] * 10
+    assert calls == 1
+    assert cache.metrics.loads == 1
+    assert cache.metrics.coalesced == 9
+    assert await cache.get_or_load("key", load, ttl=60.0) == {"value": 1}
+    assert cache.metrics.local.hits == 1
+
+
+async def test_get_or_load_shares_failures_and_never_caches_none() -> None:
+    cache = TieredCache()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("key", fail, ttl=60.0) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def load_none() -> None:
+        return None
+
+    assert await cache.get_or_load("key", load_none, ttl=60.0) is None
+    assert await cache.get_or_load("key", load_none, ttl=60.0) is None
+    assert cache.metrics.loads == 2
+
+
+async def test_shared_tier_is_seen_by_other_processes(
+    remotes: tuple[RemoteCache, RemoteCache],
+) -> None:
+    first, second = _pair(remotes)
+
+    await first.set("config", {"language": "es"}, ttl=60.0)
+    assert await second.get("config") == {"language": "es"}
+    assert await second.get("config") == {"language": "es"}
+    assert second.metrics.remote.hits == 1
+    assert second.metrics.local.hits == 1
+    assert second.metrics.local.misses == 1
+
+    await first.invalidate("config")
+    second.local.invalidate("config")
+    assert await second.get("config") is None
+    assert second.metrics.remote.misses == 1
+
+
+async def test_shared_rate_limits_count_hits_from_every_process(
+    remotes: tuple[RemoteCache, RemoteCache],
+) -> None:
+    first, second = _pair(remotes)
+    spec = RateLimitSpec(2, 60, RateLimitScope.USER)
+    limits = [CommandRateLimits(first), CommandRateLimits(second)]
+    assert all(rate_limits.shared for rate_limits in limits)
+
+    assert await limits[0].hit_shared("dice", spec, 1) == 0.0
+    assert await limits[1].hit_shared("dice", spec, 1) == 0.0
+    assert 0 < await limits[0].hit_shared("dice", spec, 1) <= 60
+    assert await limits[1].hit_shared("dice", spec, 2) == 0.0
+
+
+async def test_shared_tier_errors_fall_back_to_this_process() -> None:
+    remote = MemoryRemote({})
+    cache = TieredCache(remote)
+    remote.fail = True
+
+    await cache.set("key", 1, ttl=60.0)
+    assert await cache.get("key") == 1
+    cache.local.invalidate("key")
+    assert await cache.get("key") is None
+    assert await cache.incr("counter", ttl=60.0) == (1, 60.0)
+    assert (await cache.incr("counter", ttl=60.0))[0] == 2
+    assert cache.metrics.remote.errors == 4
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from progandbot.core.checks import GuildOnlyFailure
+from progandbot.core.checks import TextChannelOnlyFailure
+from progandbot.core.checks import _text_channel_predicate
+from progandbot.core.enums import SupportedLanguage
+from progandbot.core.guild_configs import guild_config_key
+from progandbot.core.guild_configs import store_guild_config
+from progandbot.core.i18n import I18nManager
+from progandbot.core.responses import ResponseTracker
+from progandbot.core.tree import ProgAndBotTree
+from progandbot.db.models.guild_config import GuildConfig
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_text_channel_predicate_rejects_dms_and_other_channels() -> None:
+    interaction = MagicMock()
+    interaction.guild = None
+    with pytest.raises(GuildOnlyFailure):
+        _text_channel_predicate(interaction)
+
+    interaction.guild = MagicMock()
+    interaction.channel = MagicMock(spec=discord.Thread)
+    with pytest.raises(TextChannelOnlyFailure):
+        _text_channel_predicate(interaction)
+
+    interaction.channel = MagicMock(spec=discord.TextChannel)
+    assert _text_channel_predicate(interaction)
+
+
+async def test_tree_answers_rejections_from_cached_translations() -> None:
+    client = MagicMock()
+    client._connection._command_tree = None
+    client.translator = I18nManager()
+    await store_guild_config(
+        client.translator.cache,
+        GuildConfig(guild_id=1, language=SupportedLanguage.ES),
+    )
+    # Still answered in the guild language once the cached config expires.
+    client.translator.cache.local.invalidate(guild_config_key(1))
+    client.response_tracker = ResponseTracker()
+    tree = ProgAndBotTree(client)
+
+    interaction = MagicMock()
+    interaction.extras = {}
+    interaction.guild_id = 1
+    interaction.command.qualified_name = "dice"
+    interaction.response.is_done.return_value = False
+    interaction.response.send_message = AsyncMock()
+
+    await tree.on_error(interaction, TextChannelOnlyFailure())
+    await tree.on_error(interaction, TextChannelOnlyFailure())
+
+    interaction.response.send_message.assert_awaited_with(
+        "Este comando solo puede usarse en un canal de texto.", ephemeral=True
+    )
+    assert tree.rejections[("dice", "TextChannelOnlyFailure")] == 2
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from progandbot.cogs.moderation import KICK_EMBED
+from progandbot.core.embeds import EmbedRegistry
+from progandbot.core.enums import SupportedLanguage
+from progandbot.core.i18n import I18nManager
+from progandbot.core.i18n import compile_locales
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_embed_registry_renders_translated_copies() -> None:
+    translator = I18nManager()
+    registry = EmbedRegistry(translator)
+
+    embed = registry.render(
+        KICK_EMBED,
+        SupportedLanguage.ES,
+        footer_icon_url="https://example.com/mod.png",
+        member="<@1>",
+        moderator="<@2>",
+        reason="spam",
+    )
+    assert embed.title == "Moderación: Miembro expulsado"
+    assert embed.description == "<@1> ha sido expulsado del servidor."
+    assert [(field.name, field.value) for field in embed.fields] == [
+        ("Expulsado por", "<@2>"),
+        ("Motivo", "spam"),
+    ]
+    assert embed.footer.icon_url == "https://example.com/mod.png"
+    embed.set_footer(text="changed")
+
+    embed = registry.render(
+        KICK_EMBED, SupportedLanguage.EN, member="<@1>", moderator="<@2>", reason=""
+    )
+    assert embed.title == "Moderation: Member Kicked"
+    assert [field.name for field in embed.fields] == ["Kicked By"]
+    assert embed.footer.text == "ProgAndBot Moderation"
+    assert embed.footer.icon_url is None
+
+    translator.bundle = compile_locales()
+    registry.render(
+        KICK_EMBED, SupportedLanguage.EN, member="", moderator="", reason=""
+    )
+    assert len(registry._compiled) == 1
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from progandbot.core.enums import SupportedLanguage
+from progandbot.core.i18n import I18nManager
+from progandbot.core.i18n import LocaleValidationError
+from progandbot.core.i18n import compile_locales
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_locales(path: Path, en: dict[str, object], es: dict[str, object]) -> None:
+    (path / "en.json").write_text(json.dumps(en), encoding="utf-8")
+    (path / "es.json").write_text(json.dumps(es), encoding="utf-8")
+
+
+def test_bundled_locales_are_valid() -> None:
+    bundle = compile_locales()
+    assert set(bundle.tables) == {language.value for language in SupportedLanguage}
+
+
+def test_compile_locales_reports_missing_keys_and_placeholders(tmp_path: Path) -> None:
+    _write_locales(
+        tmp_path,
+        {"greeting": "Hi {name}", "welcome": {"title": "Welcome"}},
+        {"greeting": "Hola {user}"},
+    )
+
+    with pytest.raises(LocaleValidationError) as exc_info:
+        compile_locales(tmp_path)
+    assert "es: missing key 'welcome.title'" in str(exc_info.value)
+    assert "'greeting': placeholders differ" in str(exc_info.value)
+
+
+def test_reload_swaps_bundle_only_when_valid(tmp_path: Path) -> None:
+    _write_locales(tmp_path, {"greeting": "Hi {name}"}, {"greeting": "Hola {name}"})
+    translator = I18nManager(tmp_path)
+    assert translator.translate(SupportedLanguage.ES, "greeting", name="A") == "Hola A"
+    assert not translator.reload_if_changed()
+
+    _write_locales(tmp_path, {"greeting": "Hey {name}"}, {"greeting": "Hola {nam}"})
+    os.utime(tmp_path / "es.json", (0, 1))
+    assert not translator.reload_if_changed()
+    assert translator.translate(SupportedLanguage.EN, "greeting", name="A") == "Hi A"
+
+    _write_locales(tmp_path, {"greeting": "Hey {name}"}, {"greeting": "Buenas {name}"})
+    os.utime(tmp_path / "es.json", (0, 2))
+    assert translator.reload_if_changed()
+    assert translator.translate(SupportedLanguage.EN, "greeting", name="A") == "Hey A"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from progandbot.core.outbox import MessageNotSentError
+from progandbot.core.outbox import MessageOutbox
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_channel(channel_id: int) -> MagicMock:
+    channel = MagicMock()
+    channel.id = channel_id
+    channel.send = AsyncMock()
+    return channel
+
+
+async def test_outbox_coalesces_bursts_per_channel() -> None:
+    outbox = MessageOutbox(coalesce_delay=0.05)
+    welcomes = _make_channel(1)
+    other = _make_channel(2)
+
+    for member in ("a", "b", "c"):
+        outbox.send(welcomes, f"Welcome {member}!", coalesce_key="welcome")
+    outbox.send(welcomes, "Not a welcome")
+    outbox.send(other, "Welcome d!", coalesce_key="welcome")
+    assert outbox.depth == 3
+    assert outbox.channel_depths() == {1: 2, 2: 1}
+
+    await asyncio.sleep(0.1)
+
+    assert [call.args[0] for call in welcomes.send.await_args_list] == [
+        "Welcome a!\nWelcome b!\nWelcome c!",
+        "Not a welcome",
+    ]
+    other.send.assert_awaited_once()
+    assert outbox.depth == 0
+    assert outbox.metrics.coalesced == 2
+    assert outbox.metrics.sent == 3
+    await outbox.close()
+
+
+async def test_outbox_throttles_and_counts_failures() -> None:
+    outbox = MessageOutbox(rate=2, per=0.1)
+    channel = _make_channel(1)
+    channel.send.side_effect = [None, discord.DiscordException("boom"), None]
+
+    for index in range(3):
+        outbox.send(channel, f"message {index}")
+    await asyncio.sleep(0.01)
+    assert channel.send.await_count == 2
+
+    await asyncio.sleep(0.1)
+    assert channel.send.await_count == 3
+    assert outbox.metrics.throttled >= 1
+    assert outbox.metrics.sent == 2
+    assert outbox.metrics.failures == {"DiscordException": 1}
+
+    assert outbox.evict_idle(time.monotonic() + 1) == 1
+    await outbox.close()
+
+
+async def test_outbox_deliver_reports_whether_the_message_was_sent() -> None:
+    outbox = MessageOutbox()
+    channel = _make_channel(1)
+    channel.send.side_effect = [None, discord.DiscordException("boom")]
+
+    await outbox.deliver(channel, "sent")
+    with pytest.raises(MessageNotSentError):
+        await outbox.deliver(channel, "failed")
+    await outbox.close()
+
+
+async def test_outbox_close_drains_queues_then_counts_dropped_messages() -> None:
+    outbox = MessageOutbox(rate=1, per=60)
+    channel = _make_channel(1)
+    for index in range(3):
+        outbox.send(channel, f"message {index}")
+    waiter = asyncio.ensure_future(outbox.deliver(channel, "reminder"))
+
+    await outbox.close(timeout=0.05)
+
+    channel.send.assert_awaited_once()
+    assert outbox.metrics.dropped == 3
+    with pytest.raises(MessageNotSentError):
+        await waiter
+    assert outbox.depth == 0
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from progandbot.core.checks import RateLimitedFailure
+from progandbot.core.checks import rate_limit
+from progandbot.core.enums import RateLimitScope
+from progandbot.core.rate_limit import CommandRateLimits
+from progandbot.core.rate_limit import KeyedRateLimiter
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_keyed_rate_limiter_limits_per_key_and_evicts_full_buckets() -> None:
+    limiter = KeyedRateLimiter(rate=2, per=10)
+
+    assert limiter.hit("a", now=0) == 0
+    assert limiter.hit("a", now=0) == 0
+    assert limiter.hit("a", now=0) == pytest.approx(5)
+    assert limiter.hit("b", now=0) == 0
+
+    assert limiter.evict_idle(now=5) == 1
+    assert limiter.evict_idle(now=10) == 1
+    assert len(limiter) == 0
+
+
+async def test_rate_limit_check_raises_with_retry_after() -> None:
+    async def command() -> None:
+        return None
+
+    rate_limit(1, 60, scope=RateLimitScope.GUILD)(command)
+    [predicate] = command.__discord_app_commands_checks__  # type: ignore[attr-defined]
+
+    interaction = MagicMock()
+    interaction.client.rate_limits = CommandRateLimits()
+    interaction.command.qualified_name = "dice"
+    interaction.guild_id = 1
+
+    interaction.user.id = 10
+    assert predicate(interaction)
+    interaction.user.id = 11
+    with pytest.raises(RateLimitedFailure) as exc_info:
+        predicate(interaction)
+    assert exc_info.value.translation_kwargs == {"retry_after": 60}
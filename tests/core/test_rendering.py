@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import io
+
+import pytest
+
+from PIL import Image
+
+from progandbot.core.enums import ImageFormat
+from progandbot.core.rendering import CardData
+from progandbot.core.rendering import CardRenderer
+from progandbot.core.rendering import CardTemplate
+from progandbot.core.rendering import ProgressBarLayer
+from progandbot.core.rendering import TextLayer
+
+
+pytestmark = pytest.mark.asyncio
+
+TEMPLATE = CardTemplate(
+    name="test",
+    version=1,
+    size=(200, 80),
+    layers=(
+        TextLayer(position=(10, 10), text="{name}", font_size=16),
+        ProgressBarLayer(box=(10, 40, 190, 60)),
+    ),
+)
+
+
+async def test_renderer_reuses_cached_and_in_flight_cards() -> None:
+    renderer = CardRenderer(max_workers=1)
+    loads = 0
+
+    async def load_data() -> CardData:
+        nonlocal loads
+        loads += 1
+        return {"name": "test", "progress": 0.5}
+
+    first, second = await asyncio.gather(
+        renderer.render(TEMPLATE, "key", load_data),
+        renderer.render(TEMPLATE, "key", load_data),
+    )
+    third = await renderer.render(TEMPLATE, "key", load_data)
+    renderer.close()
+
+    assert first.startswith(b"\x89PNG")
+    assert first == second == third
+    assert loads == 1
+
+
+@pytest.mark.parametrize("image_format", list(ImageFormat))
+async def test_render_encodes_every_image_format(image_format: ImageFormat) -> None:
+    rendered = TEMPLATE.render({"name": "test", "progress": 0.5}, image_format)
+
+    with Image.open(io.BytesIO(rendered)) as image:
+        assert image.size == TEMPLATE.size
+        assert image.format == image_format.extension.upper()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from progandbot.core.responses import HISTOGRAM_MIN_SAMPLES
+from progandbot.core.responses import AutoDeferPolicy
+from progandbot.core.responses import LatencyHistogram
+from progandbot.core.responses import ResponseTracker
+from progandbot.core.responses import respond
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _make_interaction() -> MagicMock:
+    interaction = MagicMock()
+    interaction.extras = {}
+    responded = False
+
+    async def mark_responded(*args: object, **kwargs: object) -> None:
+        nonlocal responded
+        responded = True
+
+    interaction.response.is_done = lambda: responded
+    interaction.response.defer = AsyncMock(side_effect=mark_responded)
+    interaction.response.send_message = AsyncMock(side_effect=mark_responded)
+    interaction.followup.send = AsyncMock()
+    interaction.delete_original_response = AsyncMock()
+    return interaction
+
+
+async def test_latency_histogram_quantile() -> None:
+    histogram = LatencyHistogram()
+    for seconds in [0.01] * 8 + [1.2, 4.0]:
+        histogram.record(seconds)
+
+    assert histogram.quantile(0.5) == 0.05
+    assert histogram.quantile(0.9) == 1.5
+    assert histogram.quantile(1.0) == 5.0
+
+
+async def test_tracker_defers_after_deadline_and_responds_with_followup() -> None:
+    tracker = ResponseTracker()
+    interaction = _make_interaction()
+
+    await tracker.start(interaction, "slow", AutoDeferPolicy(deadline=0.01))
+    await asyncio.sleep(0.05)
+    await respond(interaction, "done")
+    tracker.finish(interaction)
+
+    interaction.response.defer.assert_awaited_once_with(thinking=True, ephemeral=False)
+    interaction.followup.send.assert_awaited_once_with("done")
+    interaction.delete_original_response.assert_not_awaited()
+    assert tracker.deferred["slow"] == 1
+    assert tracker.histograms["slow"].total == 1
+
+
+async def test_ephemeral_reply_after_public_deferral_stays_private() -> None:
+    tracker = ResponseTracker()
+    interaction = _make_interaction()
+
+    await tracker.start(interaction, "slow", AutoDeferPolicy(deadline=0.0))
+    await asyncio.sleep(0.01)
+    await respond(interaction, "error", ephemeral=True)
+    await respond(interaction, "more", ephemeral=True)
+    tracker.finish(interaction)
+
+    interaction.delete_original_response.assert_awaited_once()
+    assert interaction.followup.send.await_count == 2
+    interaction.followup.send.assert_awaited_with("more", ephemeral=True)
+
+
+async def test_tracker_defers_up_front_when_predicted_slow() -> None:
+    tracker = ResponseTracker()
+    for _ in range(HISTOGRAM_MIN_SAMPLES):
+        tracker.histograms["slow"].record(2.0)
+    for _ in range(HISTOGRAM_MIN_SAMPLES):
+        tracker.histograms["fast"].record(0.01)
+
+    slow_interaction = _make_interaction()
+    await tracker.start(slow_interaction, "slow", AutoDeferPolicy(ephemeral=True))
+    slow_interaction.response.defer.assert_awaited_once_with(
+        thinking=True, ephemeral=True
+    )
+
+    fast_interaction = _make_interaction()
+    await tracker.start(fast_interaction, "fast", AutoDeferPolicy())
+    await respond(fast_interaction, "done", ephemeral=True)
+    tracker.finish(fast_interaction)
+    tracker.finish(slow_interaction)
+
+    fast_interaction.response.defer.assert_not_awaited()
+    fast_interaction.response.send_message.assert_awaited_once_with(
+        "done", ephemeral=True
+    )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from progandbot.core.scheduler import Scheduler
+from progandbot.db.models.job_state import JobState
+from progandbot.db.session import get_session
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_scheduler_records_metrics_overruns_and_state() -> None:
+    scheduler = Scheduler(MagicMock())
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_job() -> None:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+
+    job = scheduler.add_job("test_slow_job", slow_job, interval=0.01)
+    async with asyncio.timeout(5):
+        while not job.metrics.overruns:
+            await asyncio.sleep(0.01)
+    job.interval = 60
+    release.set()
+    await scheduler.stop()
+
+    assert job.metrics.runs >= 1
+    assert calls == job.metrics.runs
+    assert job.metrics.max_duration >= job.metrics.last_duration
+
+    async with get_session() as session:
+        state = await session.get(JobState, "test_slow_job")
+        assert state is not None
+        assert state.last_duration is not None
+        assert state.last_error is None
+
+
+async def test_scheduler_skips_state_for_jobs_that_are_not_persisted() -> None:
+    scheduler = Scheduler(MagicMock())
+
+    async def job() -> None:
+        return None
+
+    scheduled = scheduler.add_job("test_unpersisted", job, interval=0.01, persist=False)
+    async with asyncio.timeout(5):
+        while scheduled.metrics.runs < 2:
+            await asyncio.sleep(0.01)
+    await scheduler.stop()
+
+    async with get_session() as session:
+        assert await session.get(JobState, "test_unpersisted") is None
+
+
+async def test_scheduler_stop_waits_for_runs_before_cancelling() -> None:
+    scheduler = Scheduler(MagicMock())
+    started = asyncio.Event()
+    finished = False
+
+    async def job() -> None:
+        nonlocal finished
+        started.set()
+        await asyncio.sleep(0.05)
+        finished = True
+
+    scheduler.add_job("test_finishing_job", job, interval=0.01)
+    await started.wait()
+    await scheduler.stop()
+    assert finished
+
+    stuck = scheduler.add_job("test_stuck_job", asyncio.Event().wait, interval=0.01)
+    async with asyncio.timeout(5):
+        while not stuck.running:
+            await asyncio.sleep(0.01)
+    run = next(iter(stuck.running))
+    await scheduler.stop(timeout=0.01)
+    assert run.cancelled()
+    assert not scheduler.jobs
+
+
+async def test_scheduler_rejects_duplicate_job_names() -> None:
+    scheduler = Scheduler(MagicMock())
+
+    async def job() -> None:
+        return None
+
+    scheduler.add_job("test_duplicate", job, interval=60)
+    with pytest.raises(ValueError):
+        scheduler.add_job("test_duplicate", job, interval=60)
+    await scheduler.stop()
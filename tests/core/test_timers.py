@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+from datetime import timedelta
+
+import discord
+import pytest
+
+from sqlalchemy import select
+
+from progandbot.core.enums import TimerKind
+from progandbot.core.timers import TIMER_MAX_ATTEMPTS
+from progandbot.core.timers import TimerDispatcher
+from progandbot.core.timers import TimerQueue
+from progandbot.db.models.timer import Timer
+from progandbot.db.session import get_session
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_timer_queue_fires_in_due_order_and_skips_cancelled() -> None:
+    fired: list[str] = []
+    done = asyncio.Event()
+
+    async def callback(key: str) -> None:
+        fired.append(key)
+        if key == "last":
+            done.set()
+
+    queue: TimerQueue[str] = TimerQueue("test", callback)
+    queue.start()
+
+    now = discord.utils.utcnow()
+    queue.schedule("last", now + timedelta(milliseconds=60))
+    queue.schedule("cancelled", now + timedelta(milliseconds=20))
+    queue.schedule("first", now + timedelta(milliseconds=10))
+    queue.schedule("moved", now + timedelta(milliseconds=5))
+    queue.schedule("moved", now + timedelta(milliseconds=40))
+    queue.cancel("cancelled")
+
+    await asyncio.wait_for(done.wait(), timeout=1)
+    queue.stop()
+
+    assert fired == ["first", "moved", "last"]
+    assert len(queue) == 0
+
+
+async def test_timer_dispatcher_fetches_window_and_deletes_dispatched() -> None:
+    batches: list[list[int]] = []
+
+    async def handler(timers: list[Timer]) -> list[Timer]:
+        batches.append([timer.user_id for timer in timers])
+        return []
+
+    now = discord.utils.utcnow()
+    async with get_session() as session:
+        for user_id, due_in in [(3, 30), (1, -60), (4, 3600), (2, -1)]:
+            session.add(
+                Timer(
+                    kind=TimerKind.REMINDER,
+                    guild_id=1,
+                    user_id=user_id,
+                    message="test",
+                    created_at=now,
+                    due_at=now + timedelta(seconds=due_in),
+                )
+            )
+        await session.commit()
+
+    dispatcher = TimerDispatcher("test", handler, window=timedelta(minutes=1))
+    timers = await dispatcher.fetch_window(now)
+    assert [timer.user_id for timer in timers] == [1, 2, 3]
+
+    await dispatcher.dispatch([timer for timer in timers if timer.due_at <= now])
+    assert batches == [[1, 2]]
+
+    async with get_session() as session:
+        remaining = (await session.scalars(select(Timer.user_id))).all()
+    assert sorted(remaining) == [3, 4]
+
+
+async def test_timer_dispatcher_retries_failed_timers_with_backoff() -> None:
+    async def handler(timers: list[Timer]) -> list[Timer]:
+        return [timer for timer in timers if timer.user_id != 11]
+
+    now = discord.utils.utcnow()
+    async with get_session() as session:
+        for user_id, attempts in [(11, 0), (12, 0), (13, TIMER_MAX_ATTEMPTS - 1)]:
+            session.add(
+                Timer(
+                    kind=TimerKind.TEMP_ROLE,
+                    guild_id=2,
+                    user_id=user_id,
+                    created_at=now,
+                    due_at=now,
+                    attempts=attempts,
+                )
+            )
+        await session.commit()
+        timers = list(
+            (await session.scalars(select(Timer).where(Timer.guild_id == 2))).all()
+        )
+
+    dispatcher = TimerDispatcher("test", handler)
+    await dispatcher.dispatch(timers)
+
+    async with get_session() as session:
+        remaining = (
+            await session.scalars(select(Timer).where(Timer.guild_id == 2))
+        ).all()
+    assert [timer.user_id for timer in remaining] == [12]
+    assert remaining[0].attempts == 1
+    assert remaining[0].due_at.replace(tzinfo=now.tzinfo) > now
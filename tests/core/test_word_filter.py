@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from progandbot.core.word_filter import compile_filters
+from progandbot.core.word_filter import unsafe_regex_reason
+from progandbot.db.models.word_filter import WordFilter
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _matches(filters: list[WordFilter], content: str) -> bool:
+    return any(pattern.search(content) for pattern in compile_filters(filters))
+
+
+async def test_regexes_with_groups_or_flags_keep_their_meaning() -> None:
+    filters = [
+        WordFilter(guild_id=1, pattern="darn"),
+        WordFilter(guild_id=1, pattern=r"(a)b", is_regex=True),
+        WordFilter(guild_id=1, pattern=r"(?i)spam", is_regex=True),
+        WordFilter(guild_id=1, pattern=r"(?P<word>foo)bar", is_regex=True),
+        WordFilter(guild_id=1, pattern=r"(?P<word>baz)qux", is_regex=True),
+    ]
+
+    for content in ("DARN", "ab", "SPAM", "foobar", "bazqux"):
+        assert _matches(filters, content), content
+    assert not _matches(filters, "xy darnation")
+
+
+async def test_invalid_regex_skips_only_that_filter() -> None:
+    filters = [
+        WordFilter(guild_id=1, pattern="darn"),
+        WordFilter(guild_id=1, pattern="(unclosed", is_regex=True),
+    ]
+
+    assert _matches(filters, "darn it")
+
+
+async def test_regexes_that_can_backtrack_catastrophically_are_rejected() -> None:
+    for pattern in (r"(a+)+$", r"(a|aa)*$", r"(\w+\s?){1,50}$", r"(x)\1"):
+        assert unsafe_regex_reason(pattern) is not None, pattern
+    for pattern in (r"free\s+nitro", r"[a-z]+\d{2,4}", r"(?:ab)+c", r"(?=x)y*"):
+        assert unsafe_regex_reason(pattern) is None, pattern
+
+    # Saved before the check existed, so skipped when compiled.
+    filters = [
+        WordFilter(guild_id=1, pattern="darn"),
+        WordFilter(guild_id=1, pattern=r"(a+)+$", is_regex=True),
+    ]
+    start = time.monotonic()
+    assert not _matches(filters, "a" * 40 + "!")
+    assert time.monotonic() - start < 1.0
+    assert _matches(filters, "darn it")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from progandbot.db.partitions import add_months
+from progandbot.db.partitions import create_partitions
+from progandbot.db.partitions import default_partition_ddl
+from progandbot.db.partitions import drop_partitions_before
+from progandbot.db.partitions import partition_ddl
+from progandbot.db.session import get_session
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_monthly_partition_bounds() -> None:
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_ddl("daily_activity", date(2025, 12, 1)) == (
+        "CREATE TABLE IF NOT EXISTS daily_activity_y2025m12"
+        " PARTITION OF daily_activity"
+        " FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')"
+    )
+    assert default_partition_ddl("daily_activity") == (
+        "CREATE TABLE IF NOT EXISTS daily_activity_default"
+        " PARTITION OF daily_activity DEFAULT"
+    )
+
+
+async def test_partition_jobs_skip_unpartitioned_databases() -> None:
+    async with get_session() as session:
+        assert await create_partitions(session, "daily_activity", date.today()) == []
+        assert (
+            await drop_partitions_before(session, "daily_activity", date.today()) == []
+        )
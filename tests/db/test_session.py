@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import math
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from progandbot.db import session as db_session
+from progandbot.db.session import ReplicaRouter
+from progandbot.db.session import get_session
+
+
+if TYPE_CHECKING:
+    from progandbot.db.session import _Replica
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(create_async_engine("sqlite+aiosqlite:///:memory:"))
+
+
+class FakeLagRouter(ReplicaRouter):
+    def __init__(self, lags: dict[str, float | Exception], **kwargs: float) -> None:
+        super().__init__({name: _factory() for name in lags}, **kwargs)
+        self.fake_lags = lags
+        self.checks = 0
+
+    async def measure_lag(self, replica: _Replica) -> float:
+        self.checks += 1
+        lag = self.fake_lags[replica.name]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+
+async def test_router_rotates_over_replicas_within_max_lag() -> None:
+    router = FakeLagRouter({"a": 0.5, "b": 1.0, "c": 30.0}, max_lag=5.0)
+    await router.check_lags()
+
+    routed = [await router.route() for _ in range(4)]
+
+    assert routed == [router.replicas[index].factory for index in (0, 1, 0, 1)]
+    assert router.metrics.replica_reads == {"a": 2, "b": 2}
+    assert router.metrics.primary_reads == 0
+
+
+async def test_router_falls_back_to_primary() -> None:
+    lagging = FakeLagRouter({"a": 30.0, "b": math.inf}, max_lag=5.0)
+    await lagging.check_lags()
+    assert await lagging.route() is None
+    assert lagging.metrics.fallbacks == {"lagging": 1}
+
+    down = FakeLagRouter({"a": ConnectionRefusedError()})
+    await down.check_lags()
+    assert await down.route() is None
+    assert down.metrics.fallbacks == {"unavailable": 1}
+    assert down.metrics.failed_checks == {"a": 1}
+    assert down.lags() == {"a": None}
+
+    unconfigured = ReplicaRouter({})
+    assert await unconfigured.route() is None
+    assert unconfigured.metrics.primary_reads == 1
+    assert not unconfigured.metrics.fallbacks
+
+
+async def test_router_only_trusts_recent_lag_checks() -> None:
+    router = FakeLagRouter({"a": 0.0}, check_interval=3600.0)
+
+    assert await router.route() is None
+    assert router.checks == 0
+
+    await router.check_lags()
+    for _ in range(3):
+        assert await router.route() is router.replicas[0].factory
+    assert router.checks == 1
+
+    router.check_interval = 0.0
+    assert await router.route() is None
+    assert router.metrics.fallbacks == {"unavailable": 2}
+
+
+async def test_measured_lag_is_zero_off_postgres() -> None:
+    router = ReplicaRouter({"a": _factory()})
+    assert await router.measure_lag(router.replicas[0]) == 0.0
+
+
+async def test_read_only_sessions_use_the_routed_replica(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    router = FakeLagRouter({"a": 0.0})
+    await router.check_lags()
+    monkeypatch.setattr(db_session, "router", router)
+
+    async with get_session(read_only=True) as session:
+        assert session.bind is router.replicas[0].factory.kw["bind"]
+        assert await session.scalar(text("SELECT 1")) == 1
+    async with get_session() as session:
+        assert session.bind is not router.replicas[0].factory.kw["bind"]
+
+    assert router.metrics.replica_reads == {"a": 1}
+    assert router.metrics.primary_sessions == 1
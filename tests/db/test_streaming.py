@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from sqlmodel import select
+
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+from progandbot.db.streaming import stream_partitions
+from progandbot.db.streaming import stream_scalars
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_stream_helpers_yield_every_row_in_batches() -> None:
+    guild_id = 75319
+    async with get_session() as session:
+        session.add(GuildConfig(guild_id=guild_id))
+        session.add_all(
+            UserProfile(guild_id=guild_id, user_id=user_id, xp=user_id)
+            for user_id in range(25)
+        )
+        await session.commit()
+
+    statement = (
+        select(UserProfile.user_id, UserProfile.xp)
+        .where(UserProfile.guild_id == guild_id)
+        .order_by(UserProfile.user_id)  # type: ignore[arg-type]
+    )
+    async with get_session() as session:
+        partitions = [
+            list(partition)
+            async for partition in stream_partitions(session, statement, batch_size=10)
+        ]
+        profiles = [
+            profile
+            async for profile in stream_scalars(
+                session,
+                select(UserProfile).where(UserProfile.guild_id == guild_id),
+                batch_size=10,
+            )
+        ]
+
+    assert [len(partition) for partition in partitions] == [10, 10, 5]
+    assert [tuple(row) for row in partitions[2]] == [(i, i) for i in range(20, 25)]
+    assert sorted(profile.user_id for profile in profiles) == list(range(25))
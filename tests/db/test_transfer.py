@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from sqlalchemy import event
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from progandbot.core.enums import ExportFormat
+from progandbot.core.enums import SupportedLanguage
+from progandbot.db.models.backfill_checkpoint import BackfillCheckpoint
+from progandbot.db.models.guild_config import GuildConfig
+from progandbot.db.models.scheduled_poll import ScheduledPoll
+from progandbot.db.models.user_profile import UserProfile
+from progandbot.db.session import get_session
+from progandbot.db.transfer import export_guild
+from progandbot.db.transfer import import_guilds
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.engine.interfaces import DBAPIConnection
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("export_format", list(ExportFormat))
+async def test_export_round_trips_guild_data(
+    tmp_path: Path, export_format: ExportFormat
+) -> None:
+    if export_format.needs_pyarrow:
+        pytest.importorskip("pyarrow")
+
+    guild_id = 86420 + list(ExportFormat).index(export_format)
+
+    scheduled_for = datetime(2025, 8, 1, 12, 30, tzinfo=UTC)
+    async with get_session() as session:
+        session.add(GuildConfig(guild_id=guild_id, language=SupportedLanguage.ES))
+        session.add(UserProfile(guild_id=guild_id, user_id=1, xp=10, message_count=3))
+        session.add(UserProfile(guild_id=guild_id, user_id=2, warning_count=1))
+        session.add(
+            ScheduledPoll(
+                guild_id=guild_id,
+                channel_id=5,
+                question="Tabs or spaces?",
+                answers=["Tabs", "Spaces"],
+                scheduled_for=scheduled_for,
+            )
+        )
+        await session.commit()
+
+    async with get_session() as session:
+        exported = await export_guild(session, guild_id, tmp_path, export_format)
+    assert exported["guild_configs"] == 1
+    assert exported["user_profiles"] == 2
+    assert exported["scheduled_polls"] == 1
+
+    async with get_session() as session:
+        profile = await session.get(UserProfile, (guild_id, 1))
+        assert profile is not None
+        profile.xp = 999
+        await session.commit()
+
+    async with get_session() as session:
+        imported = await import_guilds(session, tmp_path)
+    assert imported == exported
+
+    async with get_session() as session:
+        config = await session.get(GuildConfig, guild_id)
+        profiles = (
+            await session.scalars(
+                select(UserProfile)
+                .where(UserProfile.guild_id == guild_id)  # type: ignore[arg-type]
+                .order_by(UserProfile.user_id)  # type: ignore[arg-type]
+            )
+        ).all()
+        poll = await session.scalar(
+            select(ScheduledPoll).where(ScheduledPoll.guild_id == guild_id)  # type: ignore[arg-type]
+        )
+    assert config is not None and config.language is SupportedLanguage.ES
+    assert [(p.user_id, p.xp, p.message_count, p.warning_count) for p in profiles] == [
+        (1, 10, 3, 0),
+        (2, 0, 0, 1),
+    ]
+    assert poll is not None
+    assert poll.answers == ["Tabs", "Spaces"]
+    assert poll.scheduled_for.replace(tzinfo=UTC) == scheduled_for
+
+
+async def test_import_replaces_every_table_referencing_the_guild(
+    tmp_path: Path,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(
+        connection: DBAPIConnection, record: ConnectionPoolEntry
+    ) -> None:
+        connection.execute("PRAGMA foreign_keys=ON")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    guild_id = 97531
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(GuildConfig(guild_id=guild_id))
+        await session.commit()
+        session.add(
+            BackfillCheckpoint(guild_id=guild_id, channel_id=1, until_message_id=100)
+        )
+        await session.commit()
+
+        exported = await export_guild(session, guild_id, tmp_path, ExportFormat.CSV)
+        assert exported["backfill_checkpoints"] == 1
+
+        imported = await import_guilds(session, tmp_path)
+        assert imported == exported
+        checkpoint = await session.get(BackfillCheckpoint, (guild_id, 1))
+        assert checkpoint is not None
+        assert checkpoint.until_message_id == 100
+    await engine.dispose()
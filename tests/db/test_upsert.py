@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pytest_asyncio
+
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from progandbot.db import upsert as db_upsert
+from progandbot.db.upsert import insert_ignore
+from progandbot.db.upsert import upsert
+from progandbot.db.upsert import upsert_increment
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+pytestmark = pytest.mark.asyncio
+
+# Set to a PostgreSQL URL to run the parity tests against PostgreSQL too.
+POSTGRES_URL_ENV = "PROGANDBOT_TEST_POSTGRES_URL"
+
+metadata = MetaData()
+counters = Table(
+    "upsert_parity_counters",
+    metadata,
+    Column("guild_id", Integer, primary_key=True, autoincrement=False),
+    Column("user_id", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(50), nullable=False),
+    Column("count", Integer, nullable=False),
+)
+
+
+@pytest_asyncio.fixture(
+    params=[
+        "sqlite+aiosqlite:///:memory:",
+        pytest.param(
+            os.environ.get(POSTGRES_URL_ENV),
+            marks=pytest.mark.skipif(
+                POSTGRES_URL_ENV not in os.environ,
+                reason=f"{POSTGRES_URL_ENV} is not set",
+            ),
+        ),
+    ],
+    ids=["sqlite", "postgresql"],
+)
+async def session(request: pytest.FixtureRequest) -> AsyncGenerator[AsyncSession]:
+    engine = create_async_engine(request.param)
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+    async with AsyncSession(engine) as session:
+        yield session
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+    await engine.dispose()
+
+
+async def _rows(session: AsyncSession) -> list[tuple[int, int, str, int]]:
+    result = await session.execute(
+        select(counters).order_by(counters.c.guild_id, counters.c.user_id)
+    )
+    return [tuple(row) for row in result]  # type: ignore[misc]
+
+
+async def test_upsert_helpers_behave_the_same_on_every_backend(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Four parameters per row, so at most two rows go in each statement.
+    monkeypatch.setattr(db_upsert, "MAX_BOUND_PARAMETERS", 8)
+    keys = ["guild_id", "user_id"]
+
+    await insert_ignore(
+        session,
+        counters,
+        [
+            {"guild_id": 1, "user_id": user_id, "name": "first", "count": 1}
+            for user_id in range(3)
+        ],
+        index_elements=keys,
+    )
+    await insert_ignore(
+        session,
+        counters,
+        [{"guild_id": 1, "user_id": 0, "name": "ignored", "count": 100}],
+        index_elements=keys,
+    )
+    await upsert_increment(
+        session,
+        counters,
+        [
+            {"guild_id": 1, "user_id": 1, "name": "kept", "count": 5},
+            {"guild_id": 1, "user_id": 2, "name": "kept", "count": 7},
+            {"guild_id": 2, "user_id": 1, "name": "new", "count": 3},
+        ],
+        index_elements=keys,
+        increment=["count"],
+    )
+    await upsert(
+        session,
+        counters,
+        [
+            {"guild_id": 1, "user_id": 2, "name": "renamed", "count": 0},
+            {"guild_id": 2, "user_id": 2, "name": "inserted", "count": 4},
+        ],
+        index_elements=keys,
+        update=["name"],
+    )
+    await session.commit()
+
+    assert await _rows(session) == [
+        (1, 0, "first", 1),
+        (1, 1, "first", 6),
+        (1, 2, "renamed", 8),
+        (2, 1, "new", 3),
+        (2, 2, "inserted", 4),
+    ]